@@ -0,0 +1,248 @@
+"""
+Headless interface for submitting ChemShell workflows without the notebook UI.
+
+Submissions are described by a YAML or JSON specification which populates the
+same application models used by the UI, for example::
+
+    structure: water.xyz
+    workflow: geometry
+    qm:
+      theory: NWCHEM
+      method: dft
+      functional: B3LYP
+      basis_set: cc-pvdz
+    mm:
+      theory: DL_POLY
+      force_field: water.ff
+      qm_region: "0-2"
+    vibrational_analysis: true
+    resources:
+      code: chemsh@localhost
+      ncpus: 4
+      label: water-opt
+      description: Optimisation of a water molecule
+
+A specification file may contain a single mapping or a list of mappings, one per
+submission. A ``structure_group`` (label or identifier of an AiiDA group) can be
+given in place of the ``structure`` to batch process all of its structures.
+
+A nudged elastic band (``workflow: neb``) uses the ``structure`` as the reactant
+and additionally requires a product structure::
+
+    neb:
+      product: product.xyz
+      images: 8
+      interpolation: idpp
+      execution: images
+
+A basis set screening (``workflow: screening``) of a ``structure_group``
+promotes the structures within an energy window (kJ/mol) of the lowest energy,
+and/or the lowest ``top_n``, from each basis set to the next::
+
+    screening:
+      basis_sets: [3-21G, cc-pvdz, aug-cc-pvtz]
+      window: 20.0
+      top_n: 5
+      optimise: true
+"""
+
+from pathlib import Path
+
+import yaml
+from aiida.engine import ProcessBuilder
+from aiida.orm import Node, ProcessNode, SinglefileData, load_group, load_node
+from aiida_chemshell.utils import ChemShellQMTheory
+
+from aiidalab_chemshell.common.chemshell import (
+    BasisSetOptions,
+    NEBExecutionOptions,
+    WorkflowOptions,
+)
+from aiidalab_chemshell.models.workflow import ChemShellWorkflowModel
+from aiidalab_chemshell.process import ChemShellProcess, MainAppModel
+
+
+def load_specs(path: str | Path) -> list[dict]:
+    """
+    Read the submission specifications from a YAML or JSON file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the specification file.
+
+    Returns
+    -------
+    list[dict]
+        The specification of each submission within the file.
+    """
+    path = Path(path)
+    content = yaml.safe_load(path.read_text())
+    specs = content if isinstance(content, list) else [content]
+    for spec in specs:
+        if not isinstance(spec, dict):
+            raise ValueError(f"Invalid submission specification in {path}.")
+        # Resolve relative file paths against the specification's directory
+        spec.setdefault("base_dir", str(path.parent))
+    return specs
+
+
+def _load_input(value, base_dir: Path) -> Node:
+    """Create a file node from a path or load an existing node by identifier."""
+    path = Path(str(value)).expanduser()
+    if not path.is_absolute():
+        path = base_dir / path
+    if path.is_file():
+        return SinglefileData(path.resolve())
+    return load_node(value)
+
+
+def build_model(spec: dict) -> MainAppModel:
+    """
+    Populate the main application model from a submission specification.
+
+    Parameters
+    ----------
+    spec : dict
+        The submission specification.
+
+    Returns
+    -------
+    MainAppModel
+        The populated application model.
+    """
+    base_dir = Path(spec.get("base_dir", "."))
+    model = MainAppModel()
+
+    if spec.get("structure_group") is not None:
+        model.structure_model.structure_group = load_group(spec["structure_group"])
+    elif spec.get("structure") is not None:
+        structure = _load_input(spec["structure"], base_dir)
+        if isinstance(structure, SinglefileData):
+            model.structure_model.structure_file = structure
+        else:
+            model.structure_model.structure = structure
+    else:
+        raise ValueError("No structure specified.")
+
+    workflow = model.workflow_model
+    workflow.workflow = WorkflowOptions[spec.get("workflow", "geometry").upper()]
+    workflow.vibrational_analysis = spec.get("vibrational_analysis", False)
+
+    qm = spec.get("qm", {})
+    workflow.qm_theory = ChemShellQMTheory[qm.get("theory", "nwchem").upper()]
+    workflow.use_dft = qm.get("method", "dft").lower() == "dft"
+    workflow.functional = qm.get("functional", workflow.functional)
+    if "basis_quality" in qm:
+        quality = BasisSetOptions[qm["basis_quality"].upper()]
+        workflow.basis_quality = quality
+        workflow.basis_set = quality.label
+    workflow.basis_set = qm.get("basis_set", workflow.basis_set)
+    workflow.gradients = qm.get("gradients", workflow.gradients)
+    workflow.hessian = qm.get("hessian", workflow.hessian)
+
+    mm = spec.get("mm")
+    if mm:
+        workflow.use_mm = True
+        workflow.mm_theory = mm.get("theory", workflow.mm_theory)
+        workflow.qm_region = str(mm.get("qm_region", ""))
+        if "force_field" in mm:
+            workflow.force_field = _load_input(mm["force_field"], base_dir)
+
+    _apply_workflow_options(workflow, spec, base_dir)
+
+    resources = spec.get("resources", {})
+    model.resource_model.code_label = resources.get("code", "")
+    model.resource_model.ncpus = resources.get("ncpus", model.resource_model.ncpus)
+    model.resource_model.auto_select_computer = resources.get("auto_select", False)
+    model.resource_model.process_label = resources.get("label", "")
+    model.resource_model.process_description = resources.get("description", "")
+    return model
+
+
+def _apply_workflow_options(
+    workflow: ChemShellWorkflowModel, spec: dict, base_dir: Path
+) -> None:
+    """Populate the workflow specific settings from a submission specification."""
+    neb = spec.get("neb")
+    if neb:
+        if "product" in neb:
+            workflow.product_structure = _load_input(neb["product"], base_dir)
+        workflow.neb_images = neb.get("images", workflow.neb_images)
+        workflow.neb_interpolation = neb.get(
+            "interpolation", workflow.neb_interpolation
+        )
+        workflow.neb_type = neb.get("type", workflow.neb_type)
+        workflow.neb_spring = neb.get("spring", workflow.neb_spring)
+        if "execution" in neb:
+            workflow.neb_execution = NEBExecutionOptions[neb["execution"].upper()]
+
+    screening = spec.get("screening")
+    if screening:
+        if "basis_sets" in screening:
+            workflow.screening_basis_sets = ", ".join(screening["basis_sets"])
+        workflow.screening_window = screening.get("window", workflow.screening_window)
+        workflow.screening_top_n = screening.get("top_n", workflow.screening_top_n)
+        workflow.screening_optimise = screening.get(
+            "optimise", workflow.screening_optimise
+        )
+    return
+
+
+def _create_process(spec: dict) -> ChemShellProcess:
+    """Create a validated ChemShell process from a specification."""
+    model = build_model(spec)
+    if model.resource_model.auto_select_computer:
+        ChemShellProcess.select_least_loaded_code(model)
+    valid = model.resource_model.validate() and ChemShellProcess.validate_model(model)
+    if not valid:
+        raise ValueError("Input Validation Failed")
+    return ChemShellProcess(model)
+
+
+def build_spec(spec: dict) -> ProcessBuilder | None:
+    """
+    Create the AiiDA process builder for a specification without submitting it.
+
+    Parameters
+    ----------
+    spec : dict
+        The submission specification.
+
+    Returns
+    -------
+    ProcessBuilder | None
+        The process builder which would be submitted, or None if all results
+        of the workflow are already cached.
+    """
+    process = _create_process(spec)
+    builder = process.build_process()
+    if builder is None and process.cached_energies:
+        return None
+    if builder is None:
+        raise ValueError(f"Unsupported workflow {spec.get('workflow')}.")
+    return builder
+
+
+def submit_spec(spec: dict) -> ProcessNode | None:
+    """
+    Submit the ChemShell workflow described by a specification.
+
+    Parameters
+    ----------
+    spec : dict
+        The submission specification.
+
+    Returns
+    -------
+    ProcessNode | None
+        The node of the submitted process, or None if all results of the
+        workflow are already cached.
+    """
+    process = _create_process(spec)
+    process.submit_process()
+    if process.node is None and process.cached_energies:
+        return None
+    if process.node is None:
+        raise ValueError(f"Unsupported workflow {spec.get('workflow')}.")
+    return process.node
@@ -0,0 +1,76 @@
+"""Command line interface for submitting ChemShell workflows headlessly."""
+
+import click
+from aiida import load_profile
+from aiida.common.exceptions import (
+    MissingConfigurationError,
+    ProfileConfigurationError,
+)
+from aiida.manage import get_manager
+
+from aiidalab_chemshell.api import build_spec, load_specs, submit_spec
+from aiidalab_chemshell.common.structure_metadata import backfill_structure_metadata
+
+
+@click.group()
+@click.option(
+    "-p", "--profile", default=None, help="AiiDA profile to use, defaults to default."
+)
+def cli(profile: str | None) -> None:
+    """Submit AiiDAlab ChemShell workflows without the notebook UI."""
+    if profile is not None or get_manager().get_profile() is None:
+        try:
+            load_profile(profile)
+        except (MissingConfigurationError, ProfileConfigurationError) as e:
+            raise click.ClickException(str(e)) from e
+    return
+
+
+@cli.command()
+@click.argument("specs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--dry-run", is_flag=True, help="Validate and build the processes only.")
+def submit(specs: tuple[str, ...], dry_run: bool) -> None:
+    """Submit the workflows described by the YAML/JSON specification files."""
+    failed = 0
+    for path in specs:
+        for i, spec in enumerate(load_specs(path)):
+            try:
+                if dry_run:
+                    builder = build_spec(spec)
+                    if builder is None:
+                        click.echo(f"{path}[{i}]: valid, all results cached")
+                    else:
+                        name = builder.process_class.__name__
+                        click.echo(f"{path}[{i}]: valid {name}")
+                else:
+                    node = submit_spec(spec)
+                    if node is None:
+                        click.echo(f"{path}[{i}]: skipped, all results cached")
+                    else:
+                        click.echo(
+                            f"{path}[{i}]: submitted {node.process_label}<{node.pk}>"
+                        )
+            except Exception as e:
+                failed += 1
+                click.echo(f"{path}[{i}]: failed, {e}", err=True)
+    if failed:
+        raise click.ClickException(f"{failed} submission(s) failed.")
+    return
+
+
+@cli.command()
+@click.option(
+    "--batch-size", default=500, show_default=True, help="Nodes updated at once."
+)
+@click.option(
+    "--workers", default=None, type=int, help="Parser processes, defaults to CPUs."
+)
+def backfill(batch_size: int, workers: int | None) -> None:
+    """Set the formula, element and fingerprint extras of existing structures."""
+    updated = backfill_structure_metadata(
+        batch_size=batch_size,
+        max_workers=workers,
+        progress=lambda count: click.echo(f"Processed {count} structures"),
+    )
+    click.echo(f"Set the metadata of {updated} structures.")
+    return
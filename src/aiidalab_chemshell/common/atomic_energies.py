@@ -0,0 +1,400 @@
+"""Module for reusing previously calculated isolated atom energies."""
+
+from collections import Counter
+
+from aiida.common.exceptions import NotExistent
+from aiida.common.links import LinkType
+from aiida.manage import get_manager
+from aiida.orm import (
+    CalcJobNode,
+    Dict,
+    Float,
+    ProcessNode,
+    QueryBuilder,
+    SinglefileData,
+    StructureData,
+    WorkChainNode,
+    load_node,
+)
+
+from aiidalab_chemshell.common.comparison import CHEMSHELL_PROCESS_TYPE
+from aiidalab_chemshell.common.structure_ingest import read_atoms
+
+# Spacing (Angstrom) between the atoms submitted for the uncached elements
+ATOM_SPACING = 10.0
+
+# Process type of the workflow whose calculations are the isolated atom energies
+ATOMIC_ENERGIES_PROCESS_TYPE = "aiida.workflows:chemshell.atomic_energies"
+
+# Extra storing the UUID of the structure an isolated atom workflow was run for,
+# as only its uncached elements may have been submitted
+ATOMISATION_STRUCTURE_EXTRA = "chemshell_atomisation_structure"
+
+# Defaults ChemShell assumes for parameters not given in the QM parameters
+_QM_DEFAULTS = {"method": "hf", "charge": 0, "mult": 1}
+
+# The QM parameters projected for each calculation, in the order of the cache key
+_QM_PROJECTIONS = [
+    "attributes.basis",
+    "attributes.functional",
+    "attributes.method",
+    "attributes.charge",
+    "attributes.mult",
+]
+
+
+def structure_elements(structure: StructureData | SinglefileData) -> Counter:
+    """
+    Count the atoms of each element within a structure.
+
+    Parameters
+    ----------
+    structure : StructureData | SinglefileData
+        The structure, or a structure file readable by ASE.
+
+    Returns
+    -------
+    Counter
+        The number of atoms of each element, empty if the file is unreadable.
+    """
+    if isinstance(structure, StructureData):
+        kinds = {kind.name: kind.symbol for kind in structure.kinds}
+        return Counter(kinds[site.kind_name] for site in structure.sites)
+    try:
+        atoms = read_atoms(structure)
+    except ValueError:
+        return Counter()
+    return Counter(atoms.get_chemical_symbols())
+
+
+def qm_cache_key(qm_parameters: dict) -> tuple[str, str, str, str]:
+    """
+    Return the key energies are cached under for a set of QM parameters.
+
+    Parameters
+    ----------
+    qm_parameters : dict
+        The QM parameters of the calculations.
+
+    Returns
+    -------
+    tuple[str, str, str, str]
+        The QM backend, method, basis set and functional, where the names
+        ChemShell treats as case insensitive are lower case.
+    """
+    return (
+        qm_parameters["theory"],
+        str(qm_parameters.get("method", _QM_DEFAULTS["method"])).lower(),
+        str(qm_parameters.get("basis", "")).lower(),
+        str(qm_parameters.get("functional", "")).lower(),
+    )
+
+
+def _matches(row: list, key: tuple[str, str, str, str]) -> bool:
+    """Check the projected QM parameters of a calculation match a cache key."""
+    basis, functional, method, charge, mult = row
+    if (basis or "").lower() != key[2] or (functional or "").lower() != key[3]:
+        return False
+    if (method or _QM_DEFAULTS["method"]).lower() != key[1]:
+        return False
+    # Only neutral singlet molecules are submitted by the app
+    return (charge or 0) == _QM_DEFAULTS["charge"] and (
+        mult or _QM_DEFAULTS["mult"]
+    ) == _QM_DEFAULTS["mult"]
+
+
+def isolated_atoms_structure(elements: list[str]) -> StructureData:
+    """Create a structure with one well separated atom of each element."""
+    structure = StructureData()
+    for i, element in enumerate(sorted(elements)):
+        structure.append_atom(position=(i * ATOM_SPACING, 0.0, 0.0), symbols=element)
+    structure.set_pbc((False, False, False))
+    structure.label = f"Isolated atoms: {', '.join(sorted(elements))}"
+    return structure
+
+
+class AtomicEnergyCache:
+    """
+    Cache of isolated atom energies keyed on element, backend, method and basis.
+
+    Every successful ChemShell calculation run by an isolated atom workflow in
+    the database is a cache entry, matched on the functional too, so energies
+    computed by any previous workflow are found with a single query rather
+    than being recalculated. Single atom calculations run otherwise (e.g. ions
+    or other spin states) are not reused.
+    """
+
+    def __init__(self):
+        """AtomicEnergyCache constructor."""
+        self._energies: dict[tuple[str, str, str, str, str], float] = {}
+        return
+
+    def lookup(
+        self, elements: list[str], theory: str, method: str, basis: str, functional: str
+    ) -> dict[str, float]:
+        """
+        Return the cached energies of the given elements.
+
+        Parameters
+        ----------
+        elements : list[str]
+            The chemical symbols of the elements.
+        theory : str
+            The QM backend.
+        method : str
+            The QM method, e.g. dft or hf.
+        basis : str
+            The basis set.
+        functional : str
+            The DFT functional.
+
+        Returns
+        -------
+        dict[str, float]
+            The energy (Hartree) of each element with a cached energy.
+        """
+        key = (theory, method.lower(), basis.lower(), functional.lower())
+        missing = [e for e in elements if (e, *key) not in self._energies]
+        if missing:
+            self._query(missing, key)
+        energies = {e: self._energies.get((e, *key)) for e in elements}
+        return {e: energy for e, energy in energies.items() if energy is not None}
+
+    def missing(
+        self, elements: list[str], theory: str, method: str, basis: str, functional: str
+    ) -> list[str]:
+        """Return the elements without a cached energy."""
+        cached = self.lookup(elements, theory, method, basis, functional)
+        return [e for e in elements if e not in cached]
+
+    @staticmethod
+    def _calculation_query(theory: str, isolated_atoms: bool) -> QueryBuilder:
+        """
+        Create the query of successful calculations and their QM parameters.
+
+        If ``isolated_atoms`` is True only the calculations called by an
+        isolated atom workflow are included.
+        """
+        qb = QueryBuilder()
+        if isolated_atoms:
+            qb.append(
+                WorkChainNode,
+                filters={"process_type": ATOMIC_ENERGIES_PROCESS_TYPE},
+                tag="workflow",
+            )
+        qb.append(
+            CalcJobNode,
+            tag="calc",
+            filters={
+                "process_type": CHEMSHELL_PROCESS_TYPE,
+                "attributes.exit_status": 0,
+            },
+            **(
+                {
+                    "with_incoming": "workflow",
+                    "edge_filters": {"type": LinkType.CALL_CALC.value},
+                }
+                if isolated_atoms
+                else {}
+            ),
+        )
+        qb.append(
+            Dict,
+            with_outgoing="calc",
+            edge_filters={"label": "qm_parameters"},
+            filters={"attributes.theory": theory},
+            project=_QM_PROJECTIONS,
+        )
+        qb.order_by({"calc": {"ctime": "desc"}})
+        return qb
+
+    def _query(self, elements: list[str], key: tuple[str, str, str, str]) -> None:
+        """Find the most recent energy of each element in the database."""
+        qb = self._calculation_query(key[0], isolated_atoms=True)
+        qb.append(
+            StructureData,
+            with_outgoing="calc",
+            edge_filters={"label": "structure"},
+            filters={"attributes.sites": {"of_length": 1}},
+            project="attributes.kinds",
+        )
+        qb.append(
+            Float,
+            with_incoming="calc",
+            edge_filters={"label": "energy"},
+            project="attributes.value",
+        )
+        for *parameters, kinds, energy in qb.iterall():
+            if not _matches(parameters, key):
+                continue
+            element = "".join(kinds[0]["symbols"])
+            if element in elements:
+                self._energies.setdefault((element, *key), energy)
+        return
+
+    def structure_energy(
+        self,
+        structure: StructureData | SinglefileData,
+        theory: str,
+        method: str,
+        basis: str,
+        functional: str,
+    ) -> float | None:
+        """
+        Return the most recent energy calculated for a structure node.
+
+        Parameters
+        ----------
+        structure : StructureData | SinglefileData
+            The stored structure node.
+        theory : str
+            The QM backend.
+        method : str
+            The QM method, e.g. dft or hf.
+        basis : str
+            The basis set.
+        functional : str
+            The DFT functional.
+
+        Returns
+        -------
+        float | None
+            The energy (Hartree), or None if the neutral singlet structure has
+            not been calculated with these parameters.
+        """
+        if not structure.is_stored:
+            return None
+        key = (theory, method.lower(), basis.lower(), functional.lower())
+        qb = self._calculation_query(theory, isolated_atoms=False)
+        qb.append(
+            (StructureData, SinglefileData),
+            with_outgoing="calc",
+            edge_filters={"label": "structure"},
+            filters={"id": structure.pk},
+        )
+        qb.append(
+            Float,
+            with_incoming="calc",
+            edge_filters={"label": "energy"},
+            project="attributes.value",
+        )
+        for *parameters, energy in qb.iterall():
+            if _matches(parameters, key):
+                return energy
+        return None
+
+    def atomisation_energy(
+        self,
+        counts: Counter,
+        molecule_energy: float,
+        theory: str,
+        method: str,
+        basis: str,
+        functional: str,
+    ) -> float | None:
+        """
+        Compute the atomisation energy of a structure from the cached energies.
+
+        Parameters
+        ----------
+        counts : Counter
+            The number of atoms of each element in the structure.
+        molecule_energy : float
+            The total energy (Hartree) of the structure.
+        theory : str
+            The QM backend.
+        method : str
+            The QM method, e.g. dft or hf.
+        basis : str
+            The basis set.
+        functional : str
+            The DFT functional.
+
+        Returns
+        -------
+        float | None
+            The energy (Hartree) required to separate the structure into
+            isolated atoms, or None if any element has no cached energy.
+        """
+        energies = self.lookup(list(counts), theory, method, basis, functional)
+        if len(energies) != len(counts):
+            return None
+        atoms = sum(n * energies[element] for element, n in counts.items())
+        return atoms - molecule_energy
+
+    def clear(self) -> None:
+        """Discard all energies held in memory."""
+        self._energies.clear()
+        return
+
+
+_CACHES: dict[str, AtomicEnergyCache] = {}
+
+
+def get_atomic_energy_cache() -> AtomicEnergyCache:
+    """Return the isolated atom energy cache for the loaded profile."""
+    profile = get_manager().get_profile()
+    name = profile.name if profile is not None else ""
+    return _CACHES.setdefault(name, AtomicEnergyCache())
+
+
+def atomisation_energy_message(
+    structure: StructureData | SinglefileData, qm_parameters: dict
+) -> str:
+    """
+    Describe the atomisation energy of a structure.
+
+    Parameters
+    ----------
+    structure : StructureData | SinglefileData
+        The structure.
+    qm_parameters : dict
+        The QM parameters of the isolated atom calculations.
+
+    Returns
+    -------
+    str
+        The atomisation energy, or what is still needed to compute it.
+    """
+    key = qm_cache_key(qm_parameters)
+    cache = get_atomic_energy_cache()
+    energy = cache.structure_energy(structure, *key)
+    if energy is None:
+        return "Run a single point energy to obtain the atomisation energy."
+    counts = structure_elements(structure)
+    atomisation = cache.atomisation_energy(counts, energy, *key)
+    if atomisation is None:
+        missing = cache.missing(list(counts), *key)
+        return f"No isolated atom energy is available for {', '.join(missing)}."
+    return f"Atomisation energy: {atomisation:.8f} Hartree"
+
+
+def process_atomisation_energy_message(process: ProcessNode) -> str:
+    """
+    Describe the atomisation energy of the structure of an isolated atom workflow.
+
+    Parameters
+    ----------
+    process : ProcessNode
+        The isolated atom workflow.
+
+    Returns
+    -------
+    str
+        The atomisation energy once the workflow has finished successfully,
+        otherwise its progress.
+    """
+    if not process.is_terminated:
+        return "Waiting for the isolated atom calculations to finish..."
+    if not process.is_finished_ok:
+        return "The isolated atom calculations did not finish successfully."
+    structure = process.inputs.structure
+    uuid = process.base.extras.get(ATOMISATION_STRUCTURE_EXTRA, None)
+    if uuid is not None:
+        try:
+            structure = load_node(uuid)
+        except NotExistent:
+            return "The structure of the isolated atom calculations was deleted."
+    return atomisation_energy_message(
+        structure, process.inputs.qm_parameters.get_dict()
+    )
@@ -0,0 +1,151 @@
+"""Module for caching the reusable parts of ChemShell process builders."""
+
+import json
+from threading import Lock
+
+from aiida.common.hashing import make_hash
+from aiida.engine import Process, ProcessBuilder
+from aiida.manage import get_manager
+from aiida.orm import AbstractCode, Dict, QueryBuilder, load_code
+
+
+class BuilderTemplateCache:
+    """
+    Cache of resolved process inputs reused across repeated submissions.
+
+    Templates are keyed by the process class, code and the parameter
+    dictionaries passed to the process. The code is loaded once per label and
+    each parameter dictionary is resolved to an identical ``Dict`` node already
+    in the database (found through AiiDA's node hash) rather than storing a
+    duplicate for each submission. New parameter nodes are left unstored, so
+    they are only stored if a process using them is submitted. Cached nodes
+    may be deleted or relabelled, so the cache should be cleared whenever the
+    available codes are refreshed.
+    """
+
+    def __init__(self):
+        """BuilderTemplateCache constructor."""
+        self._codes: dict[str, AbstractCode] = {}
+        self._parameters: dict[str, Dict] = {}
+        self._templates: dict[tuple, dict] = {}
+        self._lock = Lock()
+        return
+
+    def code(self, label: str) -> AbstractCode:
+        """
+        Return the code with the given label, loading it only once.
+
+        Parameters
+        ----------
+        label : str
+            The code's label or full label (code@computer).
+
+        Returns
+        -------
+        AbstractCode
+            The loaded code node.
+        """
+        with self._lock:
+            if label not in self._codes:
+                self._codes[label] = load_code(label)
+            return self._codes[label]
+
+    def parameters(self, values: dict) -> Dict:
+        """
+        Return a Dict node with the given contents.
+
+        Parameters
+        ----------
+        values : dict
+            The parameter dictionary.
+
+        Returns
+        -------
+        Dict
+            An existing stored node with identical contents if available,
+            otherwise a new unstored node which is stored on submission.
+        """
+        node = Dict(values)
+        # The hash AiiDA stores for every node, computed here before storing
+        node_hash = make_hash(node.base.caching.get_objects_to_hash())
+        with self._lock:
+            cached = self._parameters.get(node_hash)
+            if cached is not None:
+                return cached
+            qb = QueryBuilder().append(
+                Dict,
+                filters={"extras._aiida_hash": node_hash},
+                subclassing=False,
+                project="*",
+            )
+            stored = qb.first(flat=True)
+            if stored is not None and stored.get_dict() == node.get_dict():
+                node = stored
+            self._parameters[node_hash] = node
+            return node
+
+    def builder(
+        self,
+        process_class: type[Process],
+        code_label: str,
+        parameters: dict[str, dict],
+        code_port: str = "code",
+    ) -> ProcessBuilder:
+        """
+        Create a process builder pre-populated with the cached template inputs.
+
+        Parameters
+        ----------
+        process_class : type[Process]
+            The AiiDA process class to create the builder for.
+        code_label : str
+            The label of the ChemShell code to run.
+        parameters : dict[str, dict]
+            Parameter dictionaries keyed by their (dot separated) input port.
+        code_port : str
+            The (dot separated) input port for the code.
+
+        Returns
+        -------
+        ProcessBuilder
+            A new builder with the code and parameter inputs set.
+        """
+        key = (
+            process_class,
+            code_label,
+            json.dumps(parameters, sort_keys=True, default=str),
+        )
+        template = self._templates.get(key)
+        if template is None:
+            template = {code_port: self.code(code_label)}
+            for port, values in parameters.items():
+                template[port] = self.parameters(values)
+            with self._lock:
+                self._templates[key] = template
+
+        builder = process_class.get_builder()
+        for port, node in template.items():
+            *namespaces, name = port.split(".")
+            target = builder
+            for namespace in namespaces:
+                target = target[namespace]
+            target[name] = node
+        return builder
+
+    def clear(self) -> None:
+        """Discard all cached codes, parameters and templates."""
+        with self._lock:
+            self._codes.clear()
+            self._parameters.clear()
+            self._templates.clear()
+        return
+
+
+_TEMPLATE_CACHES: dict[str, BuilderTemplateCache] = {}
+
+
+def get_builder_template_cache() -> BuilderTemplateCache:
+    """Return the builder template cache for the loaded profile."""
+    profile = get_manager().get_profile()
+    name = profile.name if profile is not None else ""
+    return _TEMPLATE_CACHES.setdefault(name, BuilderTemplateCache())
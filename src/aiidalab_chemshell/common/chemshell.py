@@ -23,6 +23,14 @@ class BasisSetOptions(Enum):
             case "":
                 return ""
 
+    @classmethod
+    def from_label(cls, label: str) -> "BasisSetOptions | None":
+        """Return the level using the given basis set, None for any other basis."""
+        for option in cls:
+            if option.label.lower() == label.lower():
+                return option
+        return None
+
 
 class WorkflowOptions(Enum):
     """Enum defining the available ChemShell based AiiDA workflows."""
@@ -30,7 +38,8 @@ class WorkflowOptions(Enum):
     GEOMETRY = 0
     SINGLE_POINT = auto()
     ATOMIC_ENERGIES = auto()
-    # NEB = auto()
+    NEB = auto()
+    SCREENING = auto()
 
     @property
     def label(self) -> str:
@@ -42,8 +51,10 @@ class WorkflowOptions(Enum):
                 return "Single Point Energy"
             case WorkflowOptions.ATOMIC_ENERGIES:
                 return "Isolated Atomic Energies"
-            # case WorkflowOptions.NEB:
-            #     return "Nudged Elastic Band"
+            case WorkflowOptions.NEB:
+                return "Nudged Elastic Band"
+            case WorkflowOptions.SCREENING:
+                return "Basis Set Screening"
             case _:
                 return ""
 
@@ -57,7 +68,27 @@ class WorkflowOptions(Enum):
                 return "SP Energy"
             case WorkflowOptions.ATOMIC_ENERGIES:
                 return "Atomic Energies"
-            # case WorkflowOptions.NEB:
-            #     return "NEB"
+            case WorkflowOptions.NEB:
+                return "NEB"
+            case WorkflowOptions.SCREENING:
+                return "Screening"
             case _:
                 return "ChemShell"
+
+
+class NEBExecutionOptions(Enum):
+    """Enum defining how the images of a nudged elastic band are calculated."""
+
+    IMAGES = 0
+    OPTIMISATION = auto()
+
+    @property
+    def label(self) -> str:
+        """Convert enum value into a more human readable string."""
+        match self:
+            case NEBExecutionOptions.IMAGES:
+                return "Fixed Path Single Points"
+            case NEBExecutionOptions.OPTIMISATION:
+                return "DL-FIND NEB Optimisation"
+            case _:
+                return ""
@@ -0,0 +1,181 @@
+"""Module providing a shared, cached index of ChemShell compatible codes."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+
+from aiida.common import timezone
+from aiida.manage import get_manager
+from aiida.orm import AbstractCode, Computer, QueryBuilder
+
+CHEMSHELL_PLUGIN = "chemshell"
+
+
+@dataclass(frozen=True)
+class CodeEntry:
+    """Summary of a ChemShell code and the computer it is installed on."""
+
+    pk: int
+    uuid: str
+    label: str
+    computer: str | None = None
+    scheduler: str | None = None
+    max_cores: int | None = None
+    memory_kb: int | None = None
+
+    @property
+    def full_label(self) -> str:
+        """The code label qualified with the computer label (i.e. code@computer)."""
+        if self.computer is None:
+            return self.label
+        return f"{self.label}@{self.computer}"
+
+
+class CodeIndex:
+    """
+    Cached index of the ChemShell codes stored in the AiiDA database.
+
+    Only codes whose default calculation plugin is the ``chemshell`` entry point
+    are indexed. The first refresh queries all matching codes (and their
+    computers) in a single projected query, subsequent refreshes only fetch
+    codes added or modified (e.g. relabelled or un-hidden) since the last
+    refresh and drop any which have since been deleted or hidden. Computers
+    carry no modification time, so changes to their metadata are only picked
+    up by a full refresh.
+    """
+
+    def __init__(self, plugin: str = CHEMSHELL_PLUGIN):
+        """
+        CodeIndex constructor.
+
+        Parameters
+        ----------
+        plugin : str
+            The calculation job entry point the indexed codes must use.
+        """
+        self.plugin = plugin
+        self._entries: dict[int, CodeEntry] = {}
+        self._lock = Lock()
+        self._loaded = False
+        self._refreshed: datetime | None = None
+        return
+
+    @property
+    def _filters(self) -> dict:
+        """Query filters selecting visible codes using the indexed plugin."""
+        return {
+            "attributes.input_plugin": self.plugin,
+            "or": [
+                {"extras": {"!has_key": "hidden"}},
+                {"extras.hidden": False},
+            ],
+        }
+
+    def entries(self) -> list[CodeEntry]:
+        """Return the indexed codes ordered by their full label."""
+        if not self._loaded:
+            self.refresh()
+        with self._lock:
+            return sorted(self._entries.values(), key=lambda e: e.full_label)
+
+    def get(self, full_label: str) -> CodeEntry | None:
+        """
+        Return the indexed code matching the given label.
+
+        Parameters
+        ----------
+        full_label : str
+            Either the full label (code@computer) or the plain code label.
+
+        Returns
+        -------
+        CodeEntry | None
+            The first matching entry or None if no code matches.
+        """
+        for entry in self.entries():
+            if full_label in (entry.full_label, entry.label):
+                return entry
+        return None
+
+    def refresh(self, full: bool = False) -> list[CodeEntry]:
+        """
+        Update the index with any changes made to the database.
+
+        Parameters
+        ----------
+        full : bool
+            If True the index is rebuilt from scratch, otherwise only codes
+            added or modified since the last refresh are queried.
+
+        Returns
+        -------
+        list[CodeEntry]
+            The indexed codes ordered by their full label.
+        """
+        with self._lock:
+            if full:
+                self._entries.clear()
+            if self._entries:
+                current = {
+                    pk
+                    for (pk,) in QueryBuilder()
+                    .append(AbstractCode, filters=self._filters, project="id")
+                    .iterall()
+                }
+                for pk in set(self._entries).difference(current):
+                    del self._entries[pk]
+            filters = self._filters
+            if self._entries and self._refreshed is not None:
+                changed = [
+                    {"id": {">": max(self._entries)}},
+                    {"mtime": {">=": self._refreshed}},
+                ]
+                filters = {"and": [filters, {"or": changed}]}
+            self._refreshed = timezone.now()
+
+            qb = QueryBuilder()
+            qb.append(
+                AbstractCode,
+                filters=filters,
+                project=["id", "uuid", "label"],
+                tag="code",
+            )
+            qb.append(
+                Computer,
+                with_node="code",
+                project=["label", "scheduler_type", "metadata"],
+                outerjoin=True,
+            )
+            for pk, uuid, label, computer, scheduler, metadata in qb.iterall():
+                self._entries[pk] = CodeEntry(
+                    pk=pk,
+                    uuid=uuid,
+                    label=label,
+                    computer=computer,
+                    scheduler=scheduler,
+                    max_cores=(metadata or {}).get("default_mpiprocs_per_machine"),
+                    memory_kb=(metadata or {}).get("default_memory_per_machine"),
+                )
+            self._loaded = True
+        return self.entries()
+
+
+_CODE_INDICES: dict[str, CodeIndex] = {}
+_CODE_INDICES_LOCK = Lock()
+
+
+def get_code_index() -> CodeIndex:
+    """
+    Return the code index shared by all app instances for the loaded profile.
+
+    Returns
+    -------
+    CodeIndex
+        The shared code index.
+    """
+    profile = get_manager().get_profile()
+    name = profile.name if profile is not None else ""
+    with _CODE_INDICES_LOCK:
+        if name not in _CODE_INDICES:
+            _CODE_INDICES[name] = CodeIndex()
+        return _CODE_INDICES[name]
@@ -0,0 +1,265 @@
+"""Module for comparing results across many ChemShell calculations."""
+
+from collections import Counter
+from pathlib import Path
+
+import ipywidgets as ipw
+import pandas as pd
+import traitlets as tl
+from aiida.common.links import LinkType
+from aiida.orm import (
+    CalcJobNode,
+    Dict,
+    Float,
+    Group,
+    ProcessNode,
+    QueryBuilder,
+    SinglefileData,
+    StructureData,
+)
+
+CHEMSHELL_PROCESS_TYPE = "aiida.calculations:chemshell"
+
+COMPARISON_COLUMNS = (
+    "pk",
+    "label",
+    "ctime",
+    "energy",
+    "theory",
+    "basis",
+    "functional",
+    "formula",
+    "walltime",
+)
+
+
+def _energy_query(filters: dict | None = None) -> QueryBuilder:
+    """Create the query joining each ChemShell calculation to its results."""
+    qb = QueryBuilder()
+    qb.append(
+        CalcJobNode,
+        tag="calc",
+        filters={"process_type": CHEMSHELL_PROCESS_TYPE, **(filters or {})},
+        project=[
+            "id",
+            "label",
+            "ctime",
+            "attributes.last_job_info.wallclock_time_seconds",
+        ],
+    )
+    qb.append(
+        Float,
+        with_incoming="calc",
+        edge_filters={"label": "energy"},
+        project="attributes.value",
+    )
+    qb.append(
+        Dict,
+        with_outgoing="calc",
+        edge_filters={"label": "qm_parameters"},
+        project=["attributes.theory", "attributes.basis", "attributes.functional"],
+    )
+    qb.append(
+        (StructureData, SinglefileData),
+        with_outgoing="calc",
+        edge_filters={"label": "structure"},
+        project=["attributes.kinds", "attributes.sites", "attributes.filename"],
+    )
+    return qb
+
+
+def _formula(kinds: list | None, sites: list | None, filename: str | None) -> str:
+    """Return the chemical formula from projected StructureData attributes."""
+    if not sites:
+        return filename or ""
+    symbols = {kind["name"]: "".join(kind["symbols"]) for kind in kinds or []}
+    counts = Counter(symbols.get(site["kind_name"], "X") for site in sites)
+    return "".join(f"{s}{n if n > 1 else ''}" for s, n in sorted(counts.items()))
+
+
+def query_energies(
+    group: Group | None = None, filters: dict | None = None
+) -> pd.DataFrame:
+    """
+    Tabulate the final energy and key inputs of ChemShell calculations.
+
+    All values are projected directly from the database with a single join per
+    query, so no nodes are loaded. Only calculations which produced a final
+    energy are included. If a group is given, calculations belonging
+    to it and those called by workflows belonging to it are both included (one
+    query for each).
+
+    Parameters
+    ----------
+    group : Group | None
+        Only include calculations in, or called by workflows in, this group.
+    filters : dict | None
+        Additional QueryBuilder filters applied to the calculation nodes.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per calculation with the columns in COMPARISON_COLUMNS.
+    """
+    if group is None:
+        queries = [_energy_query(filters)]
+    else:
+        members = _energy_query(filters)
+        members.append(Group, with_node="calc", filters={"id": group.pk})
+        callers = _energy_query(filters)
+        callers.append(
+            ProcessNode,
+            tag="caller",
+            with_outgoing="calc",
+            edge_filters={"type": LinkType.CALL_CALC.value},
+        )
+        callers.append(Group, with_node="caller", filters={"id": group.pk})
+        queries = [members, callers]
+
+    rows = {}
+    for qb in queries:
+        for row in qb.iterall():
+            pk, label, ctime, walltime, energy, theory, basis, functional = row[:8]
+            rows[pk] = {
+                "pk": pk,
+                "label": label,
+                "ctime": ctime,
+                "energy": energy,
+                "theory": theory,
+                "basis": basis,
+                "functional": functional,
+                "formula": _formula(*row[8:]),
+                "walltime": walltime,
+            }
+    return pd.DataFrame(list(rows.values()), columns=list(COMPARISON_COLUMNS))
+
+
+def export_table(table: pd.DataFrame, path: str | Path) -> Path:
+    """
+    Export a comparison table to CSV or Parquet, chosen by the file extension.
+
+    Parameters
+    ----------
+    table : pd.DataFrame
+        The comparison table.
+    path : str | Path
+        The output file path, ending in ``.csv`` or ``.parquet``.
+
+    Returns
+    -------
+    Path
+        The path of the written file.
+    """
+    path = Path(path).expanduser()
+    if path.suffix == ".parquet":
+        try:
+            table.to_parquet(path, index=False)
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires the optional 'export' dependencies, "
+                "install them with `pip install aiidalab-chemshell[export]`."
+            ) from e
+    elif path.suffix == ".csv":
+        table.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported export format '{path.suffix}'.")
+    return path
+
+
+class EnergyComparisonWidget(ipw.VBox, tl.HasTraits):
+    """Widget tabulating the final energies of many ChemShell calculations."""
+
+    table = tl.Instance(pd.DataFrame, allow_none=True)
+
+    def __init__(self, **kwargs):
+        """
+        EnergyComparisonWidget constructor.
+
+        Parameters
+        ----------
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.group = ipw.Dropdown(description="Group: ", layout={"width": "45%"})
+        self.label_filter = ipw.Text(
+            value="",
+            placeholder="Process label contains...",
+            description="Label: ",
+            layout={"width": "45%"},
+        )
+        self.search_btn = ipw.Button(
+            description="Compare",
+            button_style="info",
+            icon="search",
+            layout={"width": "20%"},
+        )
+        self.search_btn.on_click(self.search)
+        self.sort_by = ipw.Dropdown(
+            options=COMPARISON_COLUMNS,
+            value="energy",
+            description="Sort by: ",
+            layout={"width": "45%"},
+        )
+        self.ascending = ipw.ToggleButton(
+            value=True, description="Ascending", icon="sort", layout={"width": "20%"}
+        )
+        self.sort_by.observe(self._render, "value")
+        self.ascending.observe(self._render, "value")
+        self.export_path = ipw.Text(
+            value="energies.csv", description="Export: ", layout={"width": "45%"}
+        )
+        self.export_btn = ipw.Button(
+            description="Export", icon="download", layout={"width": "20%"}
+        )
+        self.export_btn.on_click(self._export)
+        self.message = ipw.HTML("")
+        self.output = ipw.HTML("")
+        self.children = [
+            ipw.HBox([self.group, self.label_filter, self.search_btn]),
+            ipw.HBox([self.sort_by, self.ascending]),
+            self.output,
+            ipw.HBox([self.export_path, self.export_btn]),
+            self.message,
+        ]
+        self.update_groups()
+        return
+
+    def update_groups(self) -> None:
+        """Update the available groups."""
+        qb = QueryBuilder().append(Group, project=["label", "id"])
+        self.group.options = [("All", None), *sorted(qb.all())]
+        return
+
+    def search(self, _=None) -> None:
+        """Query the calculations matching the selected group and filter."""
+        group = Group.collection.get(id=self.group.value) if self.group.value else None
+        filters = {}
+        if self.label_filter.value:
+            filters["label"] = {"like": f"%{self.label_filter.value}%"}
+        self.table = query_energies(group, filters)
+        self._render()
+        return
+
+    def _render(self, _=None) -> None:
+        """Render the table sorted by the selected column."""
+        if self.table is None:
+            return
+        table = self.table.sort_values(
+            self.sort_by.value, ascending=self.ascending.value, na_position="last"
+        )
+        self.output.value = table.to_html(index=False, na_rep="", float_format="%.8f")
+        return
+
+    def _export(self, _=None) -> None:
+        """Export the current table."""
+        if self.table is None:
+            self.message.value = "<p>ERROR: No calculations to export.</p>"
+            return
+        try:
+            path = export_table(self.table, self.export_path.value)
+        except (ImportError, ValueError, OSError) as e:
+            self.message.value = f"<p>ERROR: {e}</p>"
+            return
+        self.message.value = f"<p>Exported {len(self.table)} rows to {path}</p>"
+        return
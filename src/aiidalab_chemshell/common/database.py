@@ -12,6 +12,8 @@ from aiida.orm import (
     WorkChainNode,
 )
 
+from aiidalab_chemshell.common.structure_metadata import ELEMENTS_EXTRA, FORMULA_EXTRA
+
 
 class AiiDADatabaseWidget(ipw.VBox, tl.HasTraits):
     """Widget for AiiDA database querying."""
@@ -56,6 +58,12 @@ class AiiDADatabaseWidget(ipw.VBox, tl.HasTraits):
             value="", description="From: ", style={"description_width": "120px"}
         )
         self.end_date_widget = ipw.Text(value="", description="To: ")
+        self.elements_widget = ipw.Text(
+            value="",
+            description="Elements: ",
+            placeholder="e.g. C, O",
+            style={"description_width": "120px"},
+        )
 
         # Search button.
         btn_search = ipw.Button(
@@ -69,6 +77,7 @@ class AiiDADatabaseWidget(ipw.VBox, tl.HasTraits):
             [
                 date_text,
                 ipw.HBox([self.start_date_widget, self.end_date_widget, btn_search]),
+                self.elements_widget,
             ],
             layout={"border": "1px solid #fafafa", "padding": "1em"},
         )
@@ -104,6 +113,11 @@ class AiiDADatabaseWidget(ipw.VBox, tl.HasTraits):
 
         filters = {}
         filters["ctime"] = {"and": [{">": start_date}, {"<=": end_date}]}
+        # Filter on the cached element extras rather than loading every structure
+        elements = [e.strip() for e in self.elements_widget.value.split(",")]
+        elements = [e for e in elements if e]
+        if elements:
+            filters[f"extras.{ELEMENTS_EXTRA}"] = {"contains": elements}
 
         if self.mode.value == "uploaded":
             qbuild2 = (
@@ -150,7 +164,7 @@ class AiiDADatabaseWidget(ipw.VBox, tl.HasTraits):
         for mch in matches:
             label = f"PK: {mch.pk}"
             label += " | " + mch.ctime.strftime("%Y-%m-%d %H:%M")
-            label += " | " + mch.base.extras.get("formula", "")
+            label += " | " + mch.base.extras.get(FORMULA_EXTRA, "")
             label += " | " + mch.node_type.split(".")[-2]
             label += " | " + mch.label
             label += " | " + mch.description
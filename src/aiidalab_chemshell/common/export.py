@@ -0,0 +1,406 @@
+"""Module for exporting the key results of many processes to a single bundle."""
+
+import html
+import importlib
+import math
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+
+import ipywidgets as ipw
+import numpy as np
+import pandas as pd
+import traitlets as tl
+from aiida.orm import CalcJobNode, ProcessNode, load_node
+
+from aiidalab_chemshell.common.comparison import CHEMSHELL_PROCESS_TYPE
+from aiidalab_chemshell.common.structure_ingest import read_atoms
+from aiidalab_chemshell.common.vibrations import MODE_COLUMNS, get_vibrational_data
+
+# Scalar columns with one value per calculation in every bundle format
+SCALAR_COLUMNS = {
+    "pk": "int64",
+    "process_pk": "int64",
+    "uuid": "str",
+    "label": "str",
+    "formula": "str",
+    "energy": "float64",
+}
+
+BUNDLE_FORMATS = {".h5": "hdf5", ".hdf5": "hdf5", ".parquet": "parquet"}
+
+
+def _optional_import(module: str):
+    """Import an optional export dependency with an installation hint."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"Exporting a bundle requires '{module}' from the optional 'export' "
+            "dependencies, install them with `pip install aiidalab-chemshell[export]`."
+        ) from e
+
+
+def _chemshell_calculations(process: ProcessNode) -> list[CalcJobNode]:
+    """Return the ChemShell calculations run by a process, oldest first."""
+    if isinstance(process, CalcJobNode):
+        calcjobs = [process]
+    else:
+        calcjobs = [n for n in process.called_descendants if isinstance(n, CalcJobNode)]
+    calcjobs = [n for n in calcjobs if n.process_type == CHEMSHELL_PROCESS_TYPE]
+    return sorted(calcjobs, key=lambda node: node.ctime)
+
+
+def _calculation_record(process: ProcessNode, calc: CalcJobNode) -> dict:
+    """Collect the key outputs of a single ChemShell calculation."""
+    outputs = calc.outputs
+    structure = (
+        outputs.optimised_structure
+        if "optimised_structure" in outputs
+        else calc.inputs.structure
+    )
+    try:
+        atoms = read_atoms(structure)
+        symbols, positions = atoms.get_chemical_symbols(), atoms.positions
+        formula = atoms.get_chemical_formula()
+    except ValueError:
+        # Structures which ASE cannot read (e.g. punch files) carry no atoms
+        symbols, positions, formula = [], np.empty((0, 3)), ""
+
+    gradients = None
+    if "gradients" in outputs and "gradients" in outputs.gradients.get_arraynames():
+        gradients = outputs.gradients.get_array("gradients").reshape(-1, 3)
+        if len(gradients) != len(symbols):
+            gradients = None
+    modes = None
+    if "vibrational_modes" in outputs:
+        modes = get_vibrational_data(outputs.vibrational_modes).modes
+
+    return {
+        "pk": calc.pk,
+        "process_pk": process.pk,
+        "uuid": calc.uuid,
+        "label": calc.label or process.label,
+        "formula": formula,
+        "energy": outputs.energy.value if "energy" in outputs else math.nan,
+        "symbols": symbols,
+        "positions": np.asarray(positions, dtype=float),
+        "gradients": gradients,
+        "modes": modes,
+    }
+
+
+def iter_bundle_records(processes: Iterable[int | ProcessNode]) -> Iterator[dict]:
+    """
+    Stream the key results of every ChemShell calculation run by the processes.
+
+    Nodes are loaded one process at a time, so only the records of the
+    current process are held in memory.
+
+    Parameters
+    ----------
+    processes : Iterable[int | ProcessNode]
+        The processes (or their PKs) to export, either ChemShell calculations
+        or workflows calling them.
+
+    Yields
+    ------
+    dict
+        The scalar results, final structure (symbols and positions), energy
+        gradients and vibrational modes of each calculation with an energy.
+    """
+    for process in processes:
+        if not isinstance(process, ProcessNode):
+            process = load_node(process)
+        for calc in _chemshell_calculations(process):
+            if "energy" in calc.outputs:
+                yield _calculation_record(process, calc)
+    return
+
+
+class _HDF5BundleWriter:
+    """
+    Write bundle records to resizable, chunked HDF5 datasets.
+
+    Per atom and per mode arrays of all calculations are concatenated into
+    single datasets, indexed by the offset and count columns of the
+    ``calculations`` group.
+    """
+
+    def __init__(self, path: Path, chunk_size: int):
+        h5py = _optional_import("h5py")
+        self.chunk_size = chunk_size
+        self.file = h5py.File(path, "w")
+        text = h5py.string_dtype()
+        columns = {
+            **SCALAR_COLUMNS,
+            "atom_offset": "int64",
+            "natoms": "int64",
+            "mode_offset": "int64",
+            "nmodes": "int64",
+        }
+        for name, dtype in columns.items():
+            self._create(f"calculations/{name}", text if dtype == "str" else dtype)
+        self._create("atoms/symbols", text)
+        self._create("atoms/positions", "float64", width=3)
+        self._create("atoms/gradients", "float64", width=3)
+        for name in MODE_COLUMNS:
+            self._create(f"modes/{name}", "float64")
+        return
+
+    def _create(self, name: str, dtype, width: int | None = None) -> None:
+        shape = (0,) if width is None else (0, width)
+        self.file.create_dataset(
+            name,
+            shape=shape,
+            maxshape=(None, *shape[1:]),
+            chunks=(self.chunk_size, *shape[1:]),
+            dtype=dtype,
+        )
+        return
+
+    def _append(self, name: str, values) -> None:
+        if len(values) == 0:
+            return
+        dataset = self.file[name]
+        start = dataset.shape[0]
+        dataset.resize(start + len(values), axis=0)
+        dataset[start:] = values
+        return
+
+    def write(self, records: list[dict]) -> None:
+        """Append a chunk of records to the datasets."""
+        atom_offset = self.file["atoms/positions"].shape[0]
+        mode_offset = self.file[f"modes/{MODE_COLUMNS[0]}"].shape[0]
+        columns = {name: [] for name in self.file["calculations"]}
+        for record in records:
+            natoms = len(record["symbols"])
+            nmodes = 0 if record["modes"] is None else len(record["modes"])
+            for name in SCALAR_COLUMNS:
+                columns[name].append(record[name])
+            columns["atom_offset"].append(atom_offset)
+            columns["natoms"].append(natoms)
+            columns["mode_offset"].append(mode_offset)
+            columns["nmodes"].append(nmodes)
+            atom_offset += natoms
+            mode_offset += nmodes
+
+        for name, values in columns.items():
+            self._append(f"calculations/{name}", values)
+        self._append("atoms/symbols", [s for r in records for s in r["symbols"]])
+        self._append(
+            "atoms/positions", np.concatenate([r["positions"] for r in records])
+        )
+        # Missing gradients are stored as NaN so the atom datasets stay aligned
+        self._append(
+            "atoms/gradients",
+            np.concatenate(
+                [
+                    np.full_like(r["positions"], np.nan)
+                    if r["gradients"] is None
+                    else r["gradients"]
+                    for r in records
+                ]
+            ),
+        )
+        modes = [r["modes"] for r in records if r["modes"] is not None]
+        if modes:
+            modes = np.concatenate(modes)
+            for i, name in enumerate(MODE_COLUMNS):
+                self._append(f"modes/{name}", modes[:, i])
+        return
+
+    def close(self) -> None:
+        """Close the HDF5 file."""
+        self.file.close()
+        return
+
+
+class _ParquetBundleWriter:
+    """
+    Write bundle records to a Parquet file, one row group per chunk.
+
+    Every calculation is one row, with its per atom and per mode arrays as
+    (flattened) list columns. Mode columns are prefixed with ``mode_``.
+    """
+
+    def __init__(self, path: Path):
+        pa = _optional_import("pyarrow")
+        self.pa = pa
+        self.pq = _optional_import("pyarrow.parquet")
+        types = {"int64": pa.int64(), "float64": pa.float64(), "str": pa.string()}
+        floats = pa.list_(pa.float64())
+        self.schema = pa.schema(
+            [
+                *((name, types[dtype]) for name, dtype in SCALAR_COLUMNS.items()),
+                ("symbols", pa.list_(pa.string())),
+                ("positions", floats),
+                ("gradients", floats),
+                *((f"mode_{name}", floats) for name in MODE_COLUMNS),
+            ]
+        )
+        self.writer = self.pq.ParquetWriter(path, self.schema)
+        return
+
+    def write(self, records: list[dict]) -> None:
+        """Write a chunk of records as a row group."""
+        rows = []
+        for record in records:
+            row = {name: record[name] for name in SCALAR_COLUMNS}
+            row["symbols"] = record["symbols"]
+            row["positions"] = record["positions"].ravel().tolist()
+            gradients = record["gradients"]
+            row["gradients"] = None if gradients is None else gradients.ravel().tolist()
+            for i, name in enumerate(MODE_COLUMNS):
+                modes = record["modes"]
+                row[f"mode_{name}"] = None if modes is None else modes[:, i].tolist()
+            rows.append(row)
+        self.writer.write_table(self.pa.Table.from_pylist(rows, schema=self.schema))
+        return
+
+    def close(self) -> None:
+        """Close the Parquet writer."""
+        self.writer.close()
+        return
+
+
+def export_bundle(
+    processes: Iterable[int | ProcessNode],
+    path: str | Path,
+    chunk_size: int = 256,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Export the key results of processes to an HDF5 or Parquet bundle.
+
+    Records are streamed from the database and written in chunks, so at most
+    one chunk of results is held in memory regardless of the number of
+    processes.
+
+    Parameters
+    ----------
+    processes : Iterable[int | ProcessNode]
+        The processes (or their PKs) to export.
+    path : str | Path
+        The output file path, ending in ``.h5``, ``.hdf5`` or ``.parquet``.
+    chunk_size : int
+        The number of calculations written at once.
+    progress : Callable[[int], None] | None
+        Called with the total number of exported calculations after each chunk.
+
+    Returns
+    -------
+    int
+        The number of exported calculations.
+    """
+    path = Path(path).expanduser()
+    match BUNDLE_FORMATS.get(path.suffix):
+        case "hdf5":
+            writer = _HDF5BundleWriter(path, chunk_size)
+        case "parquet":
+            writer = _ParquetBundleWriter(path)
+        case _:
+            raise ValueError(f"Unsupported bundle format '{path.suffix}'.")
+    count = 0
+    records = iter_bundle_records(processes)
+    try:
+        while chunk := list(islice(records, chunk_size)):
+            writer.write(chunk)
+            count += len(chunk)
+            if progress is not None:
+                progress(count)
+    finally:
+        writer.close()
+    return count
+
+
+class ExportBundleWidget(ipw.VBox, tl.HasTraits):
+    """Widget exporting the results of selected processes to a bundle file."""
+
+    table = tl.Instance(pd.DataFrame, allow_none=True)
+
+    def __init__(self, **kwargs):
+        """
+        ExportBundleWidget constructor.
+
+        Parameters
+        ----------
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.guide = ipw.HTML(
+            """
+            <p>
+            Select calculations from the energy comparison to export their final
+            structures, energies, gradients and vibrational modes to a single
+            HDF5 (<code>.h5</code>) or Parquet (<code>.parquet</code>) file.
+            </p>
+            """
+        )
+        self.processes = ipw.SelectMultiple(
+            options=[], rows=8, description="Processes: ", layout={"width": "90%"}
+        )
+        self.select_all_btn = ipw.Button(
+            description="Select All", icon="check-square", layout={"width": "20%"}
+        )
+        self.select_all_btn.on_click(self._select_all)
+        self.path = ipw.Text(
+            value="results.h5", description="Bundle: ", layout={"width": "45%"}
+        )
+        self.export_btn = ipw.Button(
+            description="Export", icon="download", layout={"width": "20%"}
+        )
+        self.export_btn.on_click(self._export)
+        self.message = ipw.HTML("")
+        self.children = [
+            self.guide,
+            self.processes,
+            ipw.HBox([self.select_all_btn]),
+            ipw.HBox([self.path, self.export_btn]),
+            self.message,
+        ]
+        return
+
+    @tl.observe("table")
+    def _update_options(self, change) -> None:
+        """Offer the processes of the comparison table for export."""
+        table = change["new"]
+        if table is None:
+            self.processes.options = []
+            return
+        self.processes.options = [
+            (f"<{row.pk}> {row.label} | {row.formula}", row.pk)
+            for row in table.itertuples()
+        ]
+        return
+
+    def _select_all(self, _=None) -> None:
+        """Select every listed process."""
+        self.processes.value = tuple(value for _, value in self.processes.options)
+        return
+
+    def _export(self, _=None) -> None:
+        """Export the selected processes."""
+        if not self.processes.value:
+            self.message.value = "<p>ERROR: No processes selected.</p>"
+            return
+
+        def _progress(count: int) -> None:
+            self.message.value = f"<p>Exported {count} calculations...</p>"
+            return
+
+        self.export_btn.disabled = True
+        try:
+            count = export_bundle(
+                self.processes.value, self.path.value, progress=_progress
+            )
+        except (ImportError, ValueError, OSError) as e:
+            self.message.value = f"<p>ERROR: {html.escape(str(e))}</p>"
+            return
+        finally:
+            self.export_btn.disabled = False
+        self.message.value = (
+            f"<p>Exported {count} calculations to {self.path.value}</p>"
+        )
+        return
@@ -40,6 +40,7 @@ class FileUploadWidget(HBox, tl.HasTraits):
         self.children = [self.file_handle, self.file_upload]
 
         self.file_upload.observe(self._on_file_upload, names="value")
+        self.observe(self._show_filename, names="file")
 
         return
 
@@ -65,6 +66,12 @@ class FileUploadWidget(HBox, tl.HasTraits):
             self.file_handle.value = ""
         return
 
+    def _show_filename(self, change: dict) -> None:
+        """Show the name of a file set without an upload, e.g. when restored."""
+        if change["new"] is not None:
+            self.file_handle.value = change["new"].filename
+        return
+
     def get_file_contents(self) -> BytesIO | None:
         """Get the contents of the uploaded file as a BytesIO object."""
         if self.file_dict is not None:
@@ -0,0 +1,103 @@
+"""Module for fingerprinting structures to detect duplicates in the database."""
+
+import hashlib
+import json
+
+import numpy as np
+from aiida.orm import Node, ProcessNode, QueryBuilder, SinglefileData, StructureData
+from ase import Atoms
+
+# Extra storing the canonical fingerprint of a structure node
+FINGERPRINT_EXTRA = "chemshell_fingerprint"
+
+# Positions (and cell vectors) are compared to this number of decimal places (Å)
+POSITION_DECIMALS = 3
+
+
+def atoms_fingerprint(atoms: Atoms, decimals: int = POSITION_DECIMALS) -> str:
+    """
+    Create a canonical fingerprint of a set of atoms.
+
+    The atoms are sorted by species and rounded position, so the fingerprint
+    does not depend on the order of the atoms within the structure. Positions
+    which differ by less than the rounding tolerance generally give the same
+    fingerprint, although two positions either side of a rounding boundary
+    do not.
+
+    Parameters
+    ----------
+    atoms : Atoms
+        The structure to fingerprint.
+    decimals : int
+        The number of decimal places positions are rounded to.
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the canonical structure.
+    """
+    symbols = np.array(atoms.get_chemical_symbols())
+    # Adding zero turns any negative zero from rounding into a positive zero
+    positions = np.round(atoms.positions, decimals) + 0.0
+    order = np.lexsort((*positions.T[::-1], symbols))
+    canonical = {
+        "symbols": symbols[order].tolist(),
+        "positions": positions[order].tolist(),
+        "cell": (np.round(atoms.cell.array, decimals) + 0.0).tolist(),
+        "pbc": [bool(p) for p in atoms.pbc],
+    }
+    content = json.dumps(canonical, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def find_duplicates(fingerprint: str, exclude: Node | None = None) -> list[Node]:
+    """
+    Find the stored structures with the given fingerprint.
+
+    Parameters
+    ----------
+    fingerprint : str
+        The structure fingerprint.
+    exclude : Node | None
+        A node to leave out of the results, e.g. the structure itself.
+
+    Returns
+    -------
+    list[Node]
+        The matching structure nodes, oldest first.
+    """
+    filters = {f"extras.{FINGERPRINT_EXTRA}": fingerprint}
+    if exclude is not None and exclude.is_stored:
+        filters["id"] = {"!==": exclude.pk}
+    qb = QueryBuilder().append(
+        (StructureData, SinglefileData), filters=filters, project="*", tag="structure"
+    )
+    qb.order_by({"structure": {"ctime": "asc"}})
+    return qb.all(flat=True)
+
+
+def completed_calculations(structure: Node) -> list[ProcessNode]:
+    """
+    Return the successfully completed processes that used a structure as input.
+
+    Parameters
+    ----------
+    structure : Node
+        The stored structure node.
+
+    Returns
+    -------
+    list[ProcessNode]
+        The processes, most recent first.
+    """
+    qb = QueryBuilder()
+    qb.append(Node, filters={"id": structure.pk}, tag="structure")
+    qb.append(
+        ProcessNode,
+        with_incoming="structure",
+        filters={"attributes.exit_status": 0},
+        project="*",
+        tag="process",
+    )
+    qb.order_by({"process": {"ctime": "desc"}})
+    return qb.distinct().all(flat=True)
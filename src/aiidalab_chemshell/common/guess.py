@@ -0,0 +1,185 @@
+"""Module for reusing the converged wavefunction of a related calculation."""
+
+import posixpath
+import shlex
+from fnmatch import fnmatch
+
+from aiida.orm import (
+    CalcJobNode,
+    Computer,
+    Data,
+    Dict,
+    QueryBuilder,
+    SinglefileData,
+    StructureData,
+)
+
+from aiidalab_chemshell.common.comparison import CHEMSHELL_PROCESS_TYPE
+from aiidalab_chemshell.common.transport_pool import get_transport_pool
+
+# Extra storing the UUID of the calculation whose wavefunction was the guess
+GUESS_EXTRA = "chemshell_guess_from"
+
+# Wavefunction files left in the working directory by each QM backend, which the
+# backend reads back as the initial guess when run with ``restart=True``
+GUESS_FILES = {
+    "NWCHEM": ("*.movecs",),
+    "ORCA": ("*.gbw",),
+    "PYSCF": ("*.chk",),
+    "GAMESS_UK": ("*.ed3",),
+    "GAUSSIAN": ("*.chk",),
+    "CP2K": ("*.wfn",),
+    "TURBOMOLE": ("mos", "alpha", "beta"),
+}
+
+# Defaults ChemShell assumes for parameters not given in the QM parameters
+_QM_DEFAULTS = {"charge": 0, "mult": 1}
+
+
+def _compatible(previous: dict, current: dict) -> bool:
+    """Return whether two sets of QM parameters share a wavefunction."""
+    for key in ("theory", "basis"):
+        if str(previous.get(key, "")).lower() != str(current.get(key, "")).lower():
+            return False
+    return all(
+        previous.get(key, default) == current.get(key, default)
+        for key, default in _QM_DEFAULTS.items()
+    )
+
+
+def find_guess_calculation(
+    structure: StructureData | SinglefileData,
+    qm_parameters: dict,
+    computer: Computer,
+) -> CalcJobNode | None:
+    """
+    Find the latest completed calculation whose wavefunction can be reused.
+
+    Parameters
+    ----------
+    structure : StructureData | SinglefileData
+        The input structure, matched by the content hash AiiDA computes when a
+        node is stored so that an identical structure stored again is also
+        found. No calculation is found for an unstored structure.
+    qm_parameters : dict
+        The QM parameters of the new calculation, the theory, basis set,
+        charge and multiplicity must be the same.
+    computer : Computer
+        The computer the new calculation runs on, which must hold the working
+        directory of the previous calculation.
+
+    Returns
+    -------
+    CalcJobNode | None
+        The calculation to take the initial guess from, or None if there is no
+        compatible calculation whose working directory has not been cleaned.
+        Whether its wavefunction files still exist is checked by
+        ``guess_files``.
+    """
+    content_hash = structure.base.caching.get_hash()
+    if content_hash is None or qm_parameters.get("theory", "").upper() not in (
+        GUESS_FILES
+    ):
+        return None
+    calc_filters = {
+        "process_type": CHEMSHELL_PROCESS_TYPE,
+        "attributes.exit_status": 0,
+        "dbcomputer_id": computer.pk,
+    }
+    # Matching the structure hash scans the extras of all data nodes, so it is
+    # skipped if the computer has no completed calculation to start with
+    candidates = QueryBuilder().append(CalcJobNode, filters=calc_filters, project="id")
+    if candidates.first() is None:
+        return None
+    qb = QueryBuilder()
+    qb.append(
+        Data,
+        filters={"extras._aiida_hash": content_hash},
+        tag="structure",
+    )
+    qb.append(
+        CalcJobNode,
+        with_incoming="structure",
+        edge_filters={"label": "structure"},
+        filters=calc_filters,
+        tag="calc",
+        project="*",
+    )
+    qb.append(
+        Dict,
+        with_outgoing="calc",
+        edge_filters={"label": "qm_parameters"},
+        project="attributes",
+    )
+    qb.order_by({"calc": {"ctime": "desc"}})
+    for calc, previous in qb.iterall():
+        if _compatible(previous, qm_parameters) and has_guess_files(calc):
+            return calc
+    return None
+
+
+def has_guess_files(calc: CalcJobNode) -> bool:
+    """Return whether a calculation may have left a reusable wavefunction."""
+    if "qm_parameters" not in calc.inputs or "mm_parameters" in calc.inputs:
+        return False
+    if "remote_folder" not in calc.outputs:
+        return False
+    theory = calc.inputs.qm_parameters.get("theory", "").upper()
+    remote = calc.outputs.remote_folder
+    return theory in GUESS_FILES and not remote.base.extras.get("cleaned", False)
+
+
+def guess_files(calc: CalcJobNode) -> list[str]:
+    """
+    List the wavefunction files left in the working directory of a calculation.
+
+    The working directory is listed with a pooled transport to the computer.
+
+    Parameters
+    ----------
+    calc : CalcJobNode
+        The calculation to take the guess from.
+
+    Returns
+    -------
+    list[str]
+        The names of the wavefunction files, empty if the calculation cannot
+        have left any or its working directory cannot be listed.
+    """
+    if not has_guess_files(calc):
+        return []
+    theory = calc.inputs.qm_parameters.get("theory", "").upper()
+    path = calc.outputs.remote_folder.get_remote_path()
+    try:
+        with get_transport_pool().get(calc.computer).connect() as transport:
+            names = transport.listdir(path)
+    except OSError:
+        return []
+    return sorted(
+        name
+        for name in names
+        if any(fnmatch(name, pattern) for pattern in GUESS_FILES[theory])
+    )
+
+
+def guess_prepend_text(calc: CalcJobNode, files: list[str]) -> str:
+    """
+    Create the job script lines staging the wavefunction of a calculation.
+
+    Parameters
+    ----------
+    calc : CalcJobNode
+        The calculation to take the guess from.
+    files : list[str]
+        The wavefunction files found by ``guess_files``.
+
+    Returns
+    -------
+    str
+        Shell commands copying the wavefunction files of the calculation into
+        the new working directory.
+    """
+    path = calc.outputs.remote_folder.get_remote_path()
+    return "\n".join(
+        f"cp {shlex.quote(posixpath.join(path, name))} ." for name in files
+    )
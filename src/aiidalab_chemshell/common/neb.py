@@ -0,0 +1,176 @@
+"""Module for generating nudged elastic band (NEB) image paths."""
+
+import numpy as np
+from aiida.orm import SinglefileData, StructureData, TrajectoryData
+
+from aiidalab_chemshell.common.structure_ingest import read_atoms
+
+INTERPOLATION_METHODS = ("idpp", "linear")
+
+
+def linear_interpolation(
+    reactant: np.ndarray, product: np.ndarray, nimages: int
+) -> np.ndarray:
+    """
+    Linearly interpolate the Cartesian positions between two end points.
+
+    Parameters
+    ----------
+    reactant : np.ndarray
+        The ``(natoms, 3)`` positions of the initial structure.
+    product : np.ndarray
+        The ``(natoms, 3)`` positions of the final structure.
+    nimages : int
+        The number of intermediate images.
+
+    Returns
+    -------
+    np.ndarray
+        The ``(nimages + 2, natoms, 3)`` positions of the whole path including
+        both end points.
+    """
+    t = np.linspace(0.0, 1.0, nimages + 2)[:, np.newaxis, np.newaxis]
+    return (1.0 - t) * reactant[np.newaxis] + t * product[np.newaxis]
+
+
+def _pair_vectors(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the pairwise separation vectors and distances of each image."""
+    vectors = positions[..., :, np.newaxis, :] - positions[..., np.newaxis, :, :]
+    return vectors, np.linalg.norm(vectors, axis=-1)
+
+
+def _tangents(path: np.ndarray) -> np.ndarray:
+    """Return the unit tangent of each intermediate image of a path."""
+    tangents = path[2:] - path[:-2]
+    norms = np.linalg.norm(tangents.reshape(len(tangents), -1), axis=1)
+    return tangents / norms[:, np.newaxis, np.newaxis]
+
+
+def idpp_interpolation(
+    reactant: np.ndarray,
+    product: np.ndarray,
+    nimages: int,
+    fmax: float = 0.01,
+    max_steps: int = 1000,
+    step_size: float = 0.05,
+    spring: float = 1.0,
+) -> np.ndarray:
+    """
+    Interpolate a path with the image dependent pair potential (IDPP) method.
+
+    The linearly interpolated path is relaxed by a NEB on the IDPP surface,
+    whose minimum has interatomic distances interpolated between those of the
+    end points, avoiding the unphysically short distances of a linear path.
+    All images are relaxed simultaneously as one array.
+
+    Parameters
+    ----------
+    reactant : np.ndarray
+        The ``(natoms, 3)`` positions of the initial structure.
+    product : np.ndarray
+        The ``(natoms, 3)`` positions of the final structure.
+    nimages : int
+        The number of intermediate images.
+    fmax : float
+        Convergence threshold on the largest atomic NEB force.
+    max_steps : int
+        Maximum number of steepest descent steps.
+    step_size : float
+        Steepest descent step size.
+    spring : float
+        Spring constant keeping the images evenly spaced.
+
+    Returns
+    -------
+    np.ndarray
+        The ``(nimages + 2, natoms, 3)`` positions of the whole path including
+        both end points.
+    """
+    path = linear_interpolation(reactant, product, nimages)
+    if nimages < 1:
+        return path
+    natoms = reactant.shape[0]
+    off_diagonal = ~np.eye(natoms, dtype=bool)
+    _, reactant_distances = _pair_vectors(reactant)
+    _, product_distances = _pair_vectors(product)
+    t = np.linspace(0.0, 1.0, nimages + 2)[1:-1, np.newaxis, np.newaxis]
+    targets = (1.0 - t) * reactant_distances + t * product_distances
+
+    for _ in range(max_steps):
+        images = path[1:-1]
+        vectors, distances = _pair_vectors(images)
+        distances = np.where(off_diagonal, distances, 1.0)
+        # Derivative of the weighted objective sum w (d - d_target)^2 with the
+        # weight w = d^-4 with respect to each pair distance
+        residuals = distances - targets
+        d_objective = (2.0 * residuals - 4.0 * residuals**2 / distances) / distances**4
+        d_objective = np.where(off_diagonal, d_objective, 0.0)
+        forces = -np.einsum("mij,mijk->mik", d_objective / distances, vectors)
+
+        # Project out the force along the path and add the spring force instead
+        tangents = _tangents(path)
+        parallel = np.einsum("mik,mik->m", forces, tangents)
+        segments = np.linalg.norm(
+            (path[1:] - path[:-1]).reshape(nimages + 1, -1), axis=1
+        )
+        springs = spring * (segments[1:] - segments[:-1])
+        forces += (springs - parallel)[:, np.newaxis, np.newaxis] * tangents
+
+        if np.linalg.norm(forces, axis=-1).max() < fmax:
+            break
+        path[1:-1] += step_size * forces
+    return path
+
+
+def interpolate_images(
+    reactant: StructureData | SinglefileData,
+    product: StructureData | SinglefileData,
+    nimages: int,
+    method: str = "idpp",
+) -> TrajectoryData:
+    """
+    Create the path of images between two structures.
+
+    Parameters
+    ----------
+    reactant : StructureData | SinglefileData
+        The initial structure.
+    product : StructureData | SinglefileData
+        The final structure, with the atoms in the same order.
+    nimages : int
+        The number of intermediate images.
+    method : str
+        The interpolation method, one of INTERPOLATION_METHODS.
+
+    Returns
+    -------
+    TrajectoryData
+        The ``nimages + 2`` images of the whole path, including both end points.
+
+    Raises
+    ------
+    ValueError
+        If the end points contain different atoms or the method is unknown.
+    """
+    start, end = read_atoms(reactant), read_atoms(product)
+    if start.get_chemical_symbols() != end.get_chemical_symbols():
+        raise ValueError("The reactant and product must contain the same atoms.")
+    match method:
+        case "idpp":
+            path = idpp_interpolation(start.positions, end.positions, nimages)
+        case "linear":
+            path = linear_interpolation(start.positions, end.positions, nimages)
+        case _:
+            raise ValueError(f"Unknown interpolation method '{method}'.")
+    cells = None
+    if start.cell.rank == 3:
+        cells = np.repeat(start.cell.array[np.newaxis], len(path), axis=0)
+    trajectory = TrajectoryData()
+    trajectory.set_trajectory(
+        start.get_chemical_symbols(),
+        path,
+        cells=cells,
+        pbc=tuple(bool(p) for p in start.pbc),
+    )
+    trajectory.label = f"NEB images ({method})"
+    return trajectory
@@ -1,13 +1,28 @@
 """Defines a custom AiiDA node visualiser."""
 
+from io import BytesIO
+
+import numpy as np
 from aiida.orm import ArrayData, Float, Node, ProcessNode, SinglefileData, StructureData
 from aiidalab_widgets_base.loaders import LoadingWidget
 from aiidalab_widgets_base.viewers import AIIDA_VIEWER_MAPPING
 from IPython.display import clear_output, display
-from ipywidgets import HTML, DOMWidget, Dropdown, Output, VBox
+from ipywidgets import (
+    HTML,
+    DOMWidget,
+    Dropdown,
+    FloatSlider,
+    Image,
+    Output,
+    Text,
+    ToggleButton,
+    VBox,
+)
+from matplotlib.figure import Figure
 from traitlets import Instance, observe
 
 from aiidalab_chemshell.common.structure_viewer import StructureViewWidget
+from aiidalab_chemshell.common.vibrations import get_vibrational_data
 
 
 class CustomAiidaNodeViewWidget(VBox):
@@ -68,7 +83,7 @@ class CustomAiidaNodeViewWidget(VBox):
                 return _viewer
 
         if isinstance(node, StructureData):
-            _viewer = StructureData(**kwargs)
+            _viewer = StructureViewWidget(**kwargs)
             _viewer.assign_structure_from_ase(node.get_ase())
             return _viewer
 
@@ -151,22 +166,97 @@ class VibrationalModesViewWidget(VBox):
         """
         super().__init__(**kwargs)
         self.array = array
-        values = self.array.get_array("Modes")
-        # Construct HTML Table
+        self.data = get_vibrational_data(array)
+
+        self.temperatures = Text(
+            value="298.15",
+            description="T / K:",
+            tooltip="Comma separated temperatures",
+            layout={"width": "50%"},
+        )
+        self.temperatures.observe(self._render_thermochemistry, "value")
+        self.thermochemistry = HTML()
+        self.fwhm = FloatSlider(
+            value=10.0, min=1.0, max=100.0, description="FWHM / cm-1:"
+        )
+        self.fwhm.observe(self._render_spectrum, "value")
+        self.spectrum = Image(format="png", layout={"width": "80%"})
+        self.modes_btn = ToggleButton(description="Show Modes", icon="table")
+        self.modes_btn.observe(self._render_modes, "value")
+        self.modes = HTML()
+
+        self._render_thermochemistry()
+        self._render_spectrum()
+        self.children = [
+            self.temperatures,
+            self.thermochemistry,
+            self.fwhm,
+            self.spectrum,
+            self.modes_btn,
+            self.modes,
+        ]
+        return
+
+    def _render_thermochemistry(self, _=None) -> None:
+        """Tabulate the thermochemistry at the requested temperatures."""
+        try:
+            temperatures = [float(t) for t in self.temperatures.value.split(",")]
+        except ValueError:
+            self.thermochemistry.value = "<p>Invalid temperatures.</p>"
+            return
+        thermo = self.data.thermochemistry(temperatures)
+        rows = "".join(
+            f"<tr><td>{t:.2f}</td><td>{u:.6f}</td><td>{ts:.6f}</td>"
+            f"<td>{f:.6f}</td></tr>"
+            for t, u, ts, f in zip(
+                thermo.temperatures,
+                thermo.energy,
+                thermo.temperatures * thermo.entropy,
+                thermo.free_energy,
+                strict=True,
+            )
+        )
+        self.thermochemistry.value = (
+            f"<p>Zero point energy: {thermo.zpe:.6f} Hartree</p>"
+            "<table style='width:100%; border: 1px solid #ddd; text-align: left;'>"
+            "<tr style='background-color: #2196F3; color: white;'>"
+            "<th>T / K</th><th>Energy / H</th><th>TS / H</th><th>Free Energy / H</th>"
+            f"</tr>{rows}</table>"
+        )
+        return
+
+    def _render_spectrum(self, _=None) -> None:
+        """Plot the broadened spectrum of the real vibrations."""
+        frequencies = self.data.real_frequencies()
+        upper = max(frequencies.max(initial=0.0) + 5 * self.fwhm.value, 100.0)
+        grid = np.linspace(0.0, upper, 2000)
+        figure = Figure(figsize=(8, 3), layout="tight")
+        axis = figure.subplots()
+        axis.plot(grid, self.data.spectrum(grid, fwhm=self.fwhm.value))
+        axis.set_xlabel("Wavenumber / cm$^{-1}$")
+        axis.set_ylabel("Intensity / arb. units")
+        buffer = BytesIO()
+        figure.savefig(buffer, format="png")
+        self.spectrum.value = buffer.getvalue()
+        return
+
+    def _render_modes(self, change) -> None:
+        """Construct the per-mode HTML table only when requested."""
+        if not change["new"]:
+            self.modes.value = ""
+            return
         html = "<table style='width:100%; border: 1px solid #ddd; text-align: left; "
         html += "border-collapse: collapse;'>"
         html += "<tr style='background-color: #2196F3; color: white;'>"
         html += "<th>Mode</th><th>Frequency</th><th>Vib T / K</th><th>ZPE / H</th>"
         html += "</th><th>Energy / H</th></th><th>-TS / H</th></tr>"
-
-        for idx, row in enumerate(values):
+        rows = []
+        for idx, row in enumerate(self.data.modes):
             bg_color = "#f9f9f9" if idx % 2 == 0 else "#ffffff"
-            html += f"<tr style='background-color: {bg_color};'>"
-            html += f"<td><b>{idx}</b></td><td>{row[0]:.6f}</td><td>{row[1]:.6f}</td>"
-            html += f"<td>{row[2]:.6f}</td><td>{row[3]:.6f}</td><td>{row[4]:.6f}</td>"
-            html += "</tr>"
-        html += "</table>"
-
-        self.children = [HTML(html)]
-
+            cells = "".join(f"<td>{value:.6f}</td>" for value in row)
+            rows.append(
+                f"<tr style='background-color: {bg_color};'><td><b>{idx}</b></td>"
+                f"{cells}</tr>"
+            )
+        self.modes.value = html + "".join(rows) + "</table>"
         return
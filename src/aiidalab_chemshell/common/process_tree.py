@@ -0,0 +1,393 @@
+"""Module for browsing the provenance of large workflows incrementally."""
+
+from dataclasses import dataclass
+
+import ipytree
+import ipywidgets as ipw
+import traitlets as tl
+from aiida.common.links import LinkType
+from aiida.orm import Node, ProcessNode, QueryBuilder, load_node
+
+# Number of children loaded at once when a process is expanded
+PAGE_SIZE = 50
+
+# Columns projected for each process shown in the tree
+PROCESS_PROJECTIONS = (
+    "id",
+    "label",
+    "attributes.process_state",
+    "attributes.exit_status",
+    "attributes.process_label",
+    "process_type",
+    "node_type",
+)
+
+PROCESS_STATE_STYLE = {
+    "created": "default",
+    "waiting": "info",
+    "running": "info",
+    "finished": "success",
+    "excepted": "danger",
+    "killed": "warning",
+}
+
+
+@dataclass(frozen=True)
+class ProcessRow:
+    """The projected columns of a process shown in the tree."""
+
+    pk: int
+    label: str
+    process_state: str | None
+    exit_status: int | None
+    process_label: str | None
+    process_type: str | None
+    node_type: str
+
+    @property
+    def is_workflow(self) -> bool:
+        """True if the process can call other processes."""
+        return self.node_type.startswith("process.workflow.")
+
+    @property
+    def name(self) -> str:
+        """The description of the process shown in the tree."""
+        name = self.process_label or self.process_type or "Process"
+        state = (self.process_state or "created").capitalize()
+        if self.exit_status is not None:
+            state = f"{state} [{self.exit_status}]"
+        label = f" ({self.label})" if self.label else ""
+        return f"{name}<{self.pk}>{label} {state}"
+
+    @property
+    def icon(self) -> str:
+        """The icon of the process type."""
+        if self.is_workflow:
+            return "chain"
+        if self.node_type.startswith("process.calculation.calcjob."):
+            return "gears"
+        return "gear"
+
+    @property
+    def icon_style(self) -> str:
+        """The icon style of the process state."""
+        if self.process_state == "finished" and self.exit_status:
+            return "danger"
+        return PROCESS_STATE_STYLE.get(self.process_state or "created", "default")
+
+
+def query_process(identifier: int | str) -> ProcessRow | None:
+    """Return the projected columns of a process by PK or UUID, None if missing."""
+    key = "uuid" if isinstance(identifier, str) else "id"
+    qb = QueryBuilder().append(
+        ProcessNode, filters={key: identifier}, project=list(PROCESS_PROJECTIONS)
+    )
+    rows = qb.all()
+    return ProcessRow(*rows[0]) if rows else None
+
+
+def query_called(
+    pk: int, offset: int = 0, limit: int | None = None
+) -> list[ProcessRow]:
+    """
+    Return a page of the processes called by a process with a single query.
+
+    Parameters
+    ----------
+    pk : int
+        The PK of the calling process.
+    offset : int
+        The number of called processes skipped.
+    limit : int | None
+        The maximum number of called processes returned, None for all.
+
+    Returns
+    -------
+    list[ProcessRow]
+        The called processes in the order they were created.
+    """
+    qb = QueryBuilder()
+    qb.append(ProcessNode, filters={"id": pk}, tag="caller")
+    qb.append(
+        ProcessNode,
+        with_incoming="caller",
+        edge_filters={
+            "type": {"in": [LinkType.CALL_CALC.value, LinkType.CALL_WORK.value]}
+        },
+        project=list(PROCESS_PROJECTIONS),
+        tag="called",
+    )
+    qb.order_by({"called": [{"ctime": "asc"}, {"id": "asc"}]})
+    qb.offset(offset)
+    if limit is not None:
+        qb.limit(limit)
+    return [ProcessRow(*row) for row in qb.all()]
+
+
+def query_outputs(pk: int) -> list[tuple[int, str, str]]:
+    """
+    Return the outputs of a process with a single query.
+
+    Parameters
+    ----------
+    pk : int
+        The PK of the process.
+
+    Returns
+    -------
+    list[tuple[int, str, str]]
+        The PK, link label and node type of each output, sorted by link label.
+    """
+    qb = QueryBuilder()
+    qb.append(ProcessNode, filters={"id": pk}, tag="process")
+    qb.append(
+        Node,
+        with_incoming="process",
+        edge_filters={"type": {"in": [LinkType.CREATE.value, LinkType.RETURN.value]}},
+        edge_project="label",
+        edge_tag="link",
+        project=["id", "node_type"],
+        tag="output",
+    )
+    outputs = [
+        (row["output"]["id"], row["link"]["label"], row["output"]["node_type"])
+        for row in qb.dict()
+    ]
+    return sorted(outputs, key=lambda output: output[1])
+
+
+class ProcessTreeNode(ipytree.Node):
+    """Tree node of a process whose children are loaded when it is opened."""
+
+    def __init__(self, row: ProcessRow, **kwargs):
+        """
+        ProcessTreeNode constructor.
+
+        Parameters
+        ----------
+        row : ProcessRow
+            The projected columns of the process.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        self.pk = row.pk
+        self.is_workflow = row.is_workflow
+        # The number of called processes loaded so far, None until first opened
+        self.loaded: int | None = None
+        super().__init__(name=row.name, opened=False, **kwargs)
+        self.refresh(row)
+        # The placeholder makes the node expandable before its children are loaded
+        self.nodes = [PlaceholderTreeNode()]
+        return
+
+    def refresh(self, row: ProcessRow) -> None:
+        """Update the description and state of the process."""
+        self.name = row.name
+        self.icon = row.icon
+        self.icon_style = row.icon_style
+        return
+
+
+class OutputsTreeNode(ipytree.Node):
+    """Tree node of the outputs of a process, loaded when it is opened."""
+
+    def __init__(self, pk: int, **kwargs):
+        """
+        OutputsTreeNode constructor.
+
+        Parameters
+        ----------
+        pk : int
+            The PK of the process.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        self.pk = pk
+        self.loaded = False
+        super().__init__(name="Outputs", icon="folder", opened=False, **kwargs)
+        self.nodes = [PlaceholderTreeNode()]
+        return
+
+
+class DataTreeNode(ipytree.Node):
+    """Tree node of a single output."""
+
+    def __init__(self, pk: int, label: str, node_type: str, **kwargs):
+        """
+        DataTreeNode constructor.
+
+        Parameters
+        ----------
+        pk : int
+            The PK of the output node.
+        label : str
+            The link label of the output.
+        node_type : str
+            The node type string of the output.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        self.pk = pk
+        class_name = node_type.rstrip(".").rsplit(".", 1)[-1]
+        name = f"{label.replace('__', '.')}<{pk}> {class_name}"
+        super().__init__(name=name, icon="file", opened=False, **kwargs)
+        return
+
+
+class PlaceholderTreeNode(ipytree.Node):
+    """Tree node standing in for children which have not been loaded yet."""
+
+    def __init__(self, **kwargs):
+        """PlaceholderTreeNode constructor."""
+        super().__init__(name="Loading...", icon="spinner", disabled=True, **kwargs)
+        return
+
+
+class LoadMoreTreeNode(ipytree.Node):
+    """Tree node loading the next page of called processes when selected."""
+
+    def __init__(self, parent: ProcessTreeNode, **kwargs):
+        """
+        LoadMoreTreeNode constructor.
+
+        Parameters
+        ----------
+        parent : ProcessTreeNode
+            The process whose children are paged.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        self.parent = parent
+        super().__init__(name="Show more...", icon="ellipsis", opened=False, **kwargs)
+        return
+
+
+class LazyProcessTreeWidget(ipw.VBox):
+    """
+    Provenance tree of a process loading its called processes on demand.
+
+    In contrast to a fully loaded tree, only the children of an expanded process
+    are fetched, with a single projected query per page of ``page_size``
+    processes, so workflows calling thousands of processes (e.g. sweeps or NEB
+    images) stay interactive. The outputs of a process are likewise loaded when
+    its outputs folder is opened, and only the selected node is loaded in full.
+    """
+
+    value = tl.Unicode(allow_none=True)
+    selected_nodes = tl.Tuple(read_only=True).tag(trait=tl.Instance(Node))
+
+    def __init__(
+        self, title: str = "Process Tree", page_size: int = PAGE_SIZE, **kwargs
+    ):
+        """
+        LazyProcessTreeWidget constructor.
+
+        Parameters
+        ----------
+        title : str
+            The title shown above the tree.
+        page_size : int
+            The number of called processes loaded at once.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        self.title = title
+        self.page_size = page_size
+        self._processes: dict[int, ProcessTreeNode] = {}
+        self._tree = ipytree.Tree(multiple_selection=False)
+        self._tree.observe(self._on_select, "selected_nodes")
+        super().__init__(children=[ipw.HTML(f"<h4>{title}</h4>"), self._tree], **kwargs)
+        return
+
+    @tl.observe("value")
+    def _on_value(self, change) -> None:
+        self._processes = {}
+        self._tree.nodes = []
+        self.set_trait("selected_nodes", ())
+        if change["new"]:
+            row = query_process(change["new"])
+            if row is not None:
+                self._tree.nodes = [self._add_process(row)]
+        return
+
+    def _add_process(self, row: ProcessRow) -> ProcessTreeNode:
+        node = ProcessTreeNode(row)
+        node.observe(self._on_open, "opened")
+        self._processes[row.pk] = node
+        return node
+
+    def _on_open(self, change) -> None:
+        node = change["owner"]
+        if not change["new"]:
+            return
+        if isinstance(node, ProcessTreeNode) and node.loaded is None:
+            outputs = OutputsTreeNode(node.pk)
+            outputs.observe(self._on_open, "opened")
+            node.nodes = [outputs]
+            node.loaded = 0
+            if node.is_workflow:
+                self.load_page(node)
+        elif isinstance(node, OutputsTreeNode) and not node.loaded:
+            node.nodes = [DataTreeNode(*output) for output in query_outputs(node.pk)]
+            node.loaded = True
+        return
+
+    def load_page(self, node: ProcessTreeNode) -> None:
+        """
+        Load the next page of processes called by a process.
+
+        Parameters
+        ----------
+        node : ProcessTreeNode
+            The tree node of the calling process, which must have been opened.
+        """
+        # One more than a page is fetched to tell whether there are further pages
+        rows = query_called(node.pk, node.loaded, self.page_size + 1)
+        children = [self._add_process(row) for row in rows[: self.page_size]]
+        node.loaded += len(children)
+        nodes = [n for n in node.nodes if not isinstance(n, LoadMoreTreeNode)]
+        if len(rows) > self.page_size:
+            children.append(LoadMoreTreeNode(node))
+        # Replace the children at once so the tree is only synced once
+        node.nodes = [*nodes, *children]
+        return
+
+    def _on_select(self, change) -> None:
+        selected = change["new"]
+        if selected and isinstance(selected[0], LoadMoreTreeNode):
+            selected[0].selected = False
+            self.load_page(selected[0].parent)
+            return
+        pks = [n.pk for n in selected if isinstance(n, ProcessTreeNode | DataTreeNode)]
+        self.set_trait("selected_nodes", tuple(load_node(pk) for pk in pks))
+        return
+
+    def update(self) -> None:
+        """
+        Refresh the state of the loaded processes.
+
+        Only the processes already shown are updated, with a query per opened
+        process, and new pages are offered for any processes called since. The
+        opened outputs folders are reloaded.
+        """
+        for pk, node in list(self._processes.items()):
+            if node.loaded is None:
+                continue
+            outputs = node.nodes[0]
+            if outputs.loaded:
+                outputs.nodes = [DataTreeNode(*o) for o in query_outputs(outputs.pk)]
+            if not node.is_workflow:
+                continue
+            rows = query_called(pk, 0, node.loaded + 1)
+            for row in rows[: node.loaded]:
+                if row.pk in self._processes:
+                    self._processes[row.pk].refresh(row)
+            has_more = any(isinstance(n, LoadMoreTreeNode) for n in node.nodes)
+            if len(rows) > node.loaded and not has_more:
+                node.nodes = [*node.nodes, LoadMoreTreeNode(node)]
+        if self._tree.nodes:
+            root = self._tree.nodes[0]
+            row = query_process(root.pk)
+            if row is not None:
+                root.refresh(row)
+        return
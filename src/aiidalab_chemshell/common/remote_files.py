@@ -0,0 +1,402 @@
+"""Module for browsing and reading the remote working directories of calculations."""
+
+import asyncio
+import html
+import posixpath
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import ipywidgets as ipw
+from aiida.common.escaping import escape_for_bash
+from aiida.common.exceptions import NotExistent
+from aiida.orm import CalcJobNode, ProcessNode, RemoteData
+from aiida.transports import Transport
+
+from aiidalab_chemshell.common.trajectory import RemoteFileTail
+from aiidalab_chemshell.common.transport_pool import (
+    ComputerTransports,
+    get_transport_pool,
+)
+
+# Lines of ChemShell, NWChem, ORCA and DL-FIND output reporting the progress of the
+# SCF and geometry optimisation, and the colour they are highlighted in
+CONVERGENCE_PATTERNS = {
+    "#c0392b": re.compile(
+        r"\berror\b|not converged|did not converge|failed", re.IGNORECASE
+    ),
+    "#1e8449": re.compile(
+        r"Testing convergence|Converged!|optimi[sz]ation converged|"
+        r"geometry converged|SCF CONVERGED|SCF converged",
+        re.IGNORECASE,
+    ),
+    "#2471a3": re.compile(
+        r"Total (?:DFT|SCF) energy|FINAL SINGLE POINT ENERGY|Energy calculation|"
+        r"^\s*d=\s*\d|convergence\s+iter",
+        re.IGNORECASE,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class RemoteEntry:
+    """An entry of a remote directory listing."""
+
+    name: str
+    size: int
+    is_dir: bool
+
+
+def list_remote_directory(transport: Transport, path: str) -> list[RemoteEntry]:
+    """
+    List the contents of a remote directory.
+
+    Parameters
+    ----------
+    transport : Transport
+        An open transport to the computer holding the directory.
+    path : str
+        The absolute path of the directory.
+
+    Returns
+    -------
+    list[RemoteEntry]
+        The directory's entries, subdirectories first then sorted by name.
+    """
+    entries = [
+        RemoteEntry(entry["name"], entry["attributes"].st_size, entry["isdir"])
+        for entry in transport.listdir_withattributes(path)
+    ]
+    return sorted(entries, key=lambda entry: (not entry.is_dir, entry.name))
+
+
+def _run(transport: Transport, command: str, path: str) -> bytes:
+    """Run a read command, raising an OSError if it reports an error."""
+    retval, stdout, stderr = transport.exec_command_wait_bytes(command)
+    if retval != 0 or stderr:
+        message = stderr.decode(errors="replace").strip()
+        raise OSError(message or f"Could not read {path}")
+    return stdout
+
+
+def read_range(transport: Transport, path: str, offset: int, length: int) -> bytes:
+    """
+    Read a byte range of a remote file without transferring the rest of it.
+
+    Parameters
+    ----------
+    transport : Transport
+        An open transport to the computer holding the file.
+    path : str
+        The absolute path of the file.
+    offset : int
+        The first byte read.
+    length : int
+        The maximum number of bytes read.
+
+    Returns
+    -------
+    bytes
+        The data, shorter than ``length`` if the end of the file is reached.
+    """
+    path_arg = escape_for_bash(path)
+    command = f"tail -c +{offset + 1} {path_arg} | head -c {length}"
+    return _run(transport, command, path)
+
+
+def highlight_convergence(text: str) -> str:
+    """
+    Render program output as HTML, highlighting SCF and optimisation progress.
+
+    Parameters
+    ----------
+    text : str
+        The program output.
+
+    Returns
+    -------
+    str
+        The escaped lines, those matching a convergence pattern wrapped in a
+        coloured span.
+    """
+    lines = []
+    for line in text.splitlines():
+        escaped = html.escape(line)
+        for colour, pattern in CONVERGENCE_PATTERNS.items():
+            if pattern.search(line):
+                escaped = f'<span style="color: {colour}"><b>{escaped}</b></span>'
+                break
+        lines.append(escaped)
+    return "\n".join(lines)
+
+
+def working_directories(process: ProcessNode) -> dict[int, RemoteData]:
+    """
+    Return the remote working directories of the calculations run by a process.
+
+    Parameters
+    ----------
+    process : ProcessNode
+        A calculation, or a workflow calling calculations.
+
+    Returns
+    -------
+    dict[int, RemoteData]
+        The working directory of each calculation keyed by its PK, most recent
+        first.
+    """
+    if isinstance(process, CalcJobNode):
+        calcjobs = [process]
+    else:
+        calcjobs = [n for n in process.called_descendants if isinstance(n, CalcJobNode)]
+    folders = {}
+    for calcjob in sorted(calcjobs, key=lambda node: node.ctime, reverse=True):
+        try:
+            folders[calcjob.pk] = calcjob.outputs.remote_folder
+        except NotExistent:
+            continue
+    return folders
+
+
+class RemoteFolderWidget(ipw.VBox):
+    """
+    Widget browsing the remote working directories of a process.
+
+    Files are read in part, either their last bytes or a byte range, so large
+    log files never have to be downloaded. A followed file is polled until the
+    process terminates, each poll transferring only the data appended since the
+    previous read. Transports are borrowed from the kernel's transport pool, so
+    repeated reads reuse the same connection.
+    """
+
+    def __init__(
+        self,
+        process: ProcessNode,
+        max_bytes: int = 65536,
+        interval: float = 10.0,
+        **kwargs,
+    ):
+        """
+        RemoteFolderWidget constructor.
+
+        Parameters
+        ----------
+        process : ProcessNode
+            The calculation, or a workflow calling calculations.
+        max_bytes : int
+            The maximum number of bytes of a followed file kept on display.
+        interval : float
+            Time (seconds) between polls of a followed file whilst running.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.process = process
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self._folders: dict[int, RemoteData] = {}
+        self._cwd = ""
+        self._tail: RemoteFileTail | None = None
+        self._text = ""
+        self._task: asyncio.Task | None = None
+
+        self.calculation = ipw.Dropdown(description="Calculation: ")
+        self.calculation.observe(self._change_calculation, "value")
+        self.location = ipw.HTML("")
+        self.entries = ipw.Select(options=[], rows=8, layout={"width": "90%"})
+        self.open_btn = ipw.Button(description="Open", icon="folder-open")
+        self.open_btn.on_click(self._open)
+        self.up_btn = ipw.Button(description="Up", icon="arrow-up")
+        self.up_btn.on_click(self._up)
+        self.list_btn = ipw.Button(description="List", icon="arrows-rotate")
+        self.list_btn.on_click(self.list_directory)
+        self.mode = ipw.ToggleButtons(options=["Tail", "Range"], value="Tail")
+        self.offset = ipw.BoundedIntText(
+            value=0, min=0, max=2**62, description="Offset: "
+        )
+        self.length = ipw.BoundedIntText(
+            value=16384, min=1, max=max_bytes, description="Bytes: "
+        )
+        self.follow = ipw.Checkbox(value=False, description="Follow new output")
+        self.follow.observe(self._toggle_follow, "value")
+        self.message = ipw.HTML("")
+        self.output = ipw.HTML("", layout={"max_height": "400px", "overflow": "auto"})
+        self.children = [
+            self.calculation,
+            self.location,
+            self.entries,
+            ipw.HBox([self.open_btn, self.up_btn, self.list_btn]),
+            ipw.HBox([self.mode, self.offset, self.length]),
+            self.follow,
+            self.message,
+            self.output,
+        ]
+        self.update_calculations()
+        return
+
+    def update_calculations(self) -> None:
+        """Update the calculations with a working directory."""
+        if self.process is not None:
+            self._folders = working_directories(self.process)
+        options = [
+            (f"<{pk}> {folder.computer.label}:{folder.get_remote_path()}", pk)
+            for pk, folder in self._folders.items()
+        ]
+        if options != list(self.calculation.options):
+            self.calculation.options = options
+        if not options:
+            self.message.value = "<p>No working directory has been created yet.</p>"
+        return
+
+    def _transports(self) -> ComputerTransports:
+        """Return the pooled transports of the current calculation's computer."""
+        computer = self._folders[self.calculation.value].computer
+        return get_transport_pool().get(computer)
+
+    def _path(self, name: str = "") -> str:
+        """Return the absolute path of an entry of the current directory."""
+        root = self._folders[self.calculation.value].get_remote_path()
+        return posixpath.join(root, self._cwd, name)
+
+    def _change_calculation(self, _=None) -> None:
+        self._cwd = ""
+        self._tail = None
+        self.list_directory()
+        return
+
+    def list_directory(self, _=None) -> None:
+        """List the current directory of the selected working directory."""
+        if self.calculation.value is None:
+            return
+        self.location.value = f"<p><code>{html.escape(self._path())}</code></p>"
+        try:
+            with self._transports().connect() as transport:
+                entries = list_remote_directory(transport, self._path())
+        except OSError as e:
+            self.message.value = f"<p>Could not list the directory: {e}</p>"
+            return
+        self.entries.options = [
+            (f"{e.name}/" if e.is_dir else f"{e.name} ({e.size} B)", e) for e in entries
+        ]
+        self.message.value = ""
+        return
+
+    def _up(self, _=None) -> None:
+        if self._cwd:
+            self._cwd = posixpath.dirname(self._cwd)
+            self.list_directory()
+        return
+
+    def _open(self, _=None) -> None:
+        """Enter the selected directory, or read the selected file."""
+        entry: RemoteEntry | None = self.entries.value
+        if entry is None:
+            return
+        if entry.is_dir:
+            self._cwd = posixpath.join(self._cwd, entry.name)
+            self.list_directory()
+            return
+        path = self._path(entry.name)
+        length = self.length.value
+        try:
+            with self._transports().connect() as transport:
+                # The listed size is stale for a file still being written
+                size = transport.get_attribute(path).st_size
+                if self.mode.value == "Tail":
+                    offset = max(size - length, 0)
+                else:
+                    offset = self.offset.value
+                data = read_range(transport, path, offset, length)
+        except OSError as e:
+            self.message.value = f"<p>Could not read {entry.name}: {e}</p>"
+            return
+        folder = self._folders[self.calculation.value]
+        self._tail = RemoteFileTail(folder, posixpath.join(self._cwd, entry.name))
+        self._tail.offset = offset + len(data)
+        self.message.value = (
+            f"<p>{entry.name}: bytes {offset} to {offset + len(data)} of {size}</p>"
+        )
+        self._text = data.decode(errors="replace")
+        self._render()
+        return
+
+    def _toggle_follow(self, change) -> None:
+        """Start or stop polling the followed file."""
+        if change["new"]:
+            self.start()
+        else:
+            self.stop()
+        return
+
+    def start(self) -> None:
+        """Poll the followed file on the kernel's event loop until the job ends."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._poll())
+        return
+
+    def stop(self) -> None:
+        """Stop polling the followed file."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        return
+
+    def _prepare_read(self) -> Callable[[], bytes]:
+        """Return a read of the followed file which does not access the database."""
+        tail, transports = self._tail, self._transports()
+
+        def _read() -> bytes:
+            with transports.connect() as transport:
+                return tail.read(transport)
+
+        return _read
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            tail = self._tail
+            if tail is not None:
+                try:
+                    data = await loop.run_in_executor(None, self._prepare_read())
+                    # Discard the data if another file was opened meanwhile
+                    if tail is self._tail:
+                        self._append(data)
+                except OSError as e:
+                    # Keep polling, the connection may recover
+                    self.message.value = f"<p>Could not follow the file: {e}</p>"
+            if self.process is None or self.process.is_terminated:
+                return
+            await asyncio.sleep(self.interval)
+
+    def update(self) -> None:
+        """Append any new output of the followed file."""
+        self.update_calculations()
+        if not self.follow.value or self._tail is None:
+            return
+        try:
+            with self._transports().connect() as transport:
+                data = self._tail.read(transport)
+        except OSError as e:
+            self.message.value = f"<p>Could not follow the file: {e}</p>"
+            return
+        self._append(data)
+        return
+
+    def _append(self, data: bytes) -> None:
+        """Append newly read data to the displayed output."""
+        if data:
+            self._text = (self._text + data.decode(errors="replace"))[-self.max_bytes :]
+            self._render()
+        return
+
+    def close(self) -> None:
+        """Close the widget and stop following the file."""
+        self.stop()
+        super().close()
+        return
+
+    def _render(self) -> None:
+        self.output.value = (
+            f"<pre style='line-height: 1.2'>{highlight_convergence(self._text)}</pre>"
+        )
+        return
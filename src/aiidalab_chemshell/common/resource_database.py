@@ -0,0 +1,176 @@
+"""Module for caching the remote computational resources database locally."""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlparse
+from urllib.request import Request, urlopen
+
+import yaml
+
+from aiidalab_chemshell.utils import get_cache_dir, get_py_app_dir
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_SOURCE = (
+    "https://raw.githubusercontent.com/stfc/alc-ux/refs/heads/main/"
+    "resources/remotes.json"
+)
+BUNDLED_DATABASE = get_py_app_dir() / "data" / "remotes.json"
+
+# Values within the database matching this pattern are references to separate
+# computer/code template files which are fetched and inlined.
+_TEMPLATE_REFERENCE = re.compile(r"^(https?|file)://\S+\.(json|ya?ml)$")
+
+
+class ResourceDatabaseCache:
+    """
+    Local cache for remote resource database and template files.
+
+    Remote files are stored in the app's cache directory and are only
+    revalidated (using their ETag) once older than the time-to-live. If the
+    source cannot be reached the cached copy is used, falling back to the
+    database bundled with the app if the source was never fetched. Local
+    sources (``file://`` URLs or paths) are always read directly.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl: float = 86400.0,
+        timeout: float = 5.0,
+        max_workers: int = 8,
+    ):
+        """
+        ResourceDatabaseCache constructor.
+
+        Parameters
+        ----------
+        cache_dir : Path | None
+            Directory to store cached files in, defaults to the app's cache.
+        ttl : float
+            Time (seconds) before a cached file is revalidated with the source.
+        timeout : float
+            Timeout (seconds) for network requests.
+        max_workers : int
+            Maximum number of template files fetched concurrently.
+        """
+        self.cache_dir = cache_dir or get_cache_dir() / "resources"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_workers = max_workers
+        return
+
+    def load(self, source: str = DEFAULT_DATABASE_SOURCE, force: bool = False) -> dict:
+        """
+        Load the resource database with all referenced templates inlined.
+
+        Parameters
+        ----------
+        source : str
+            URL, ``file://`` URL or local path of the database.
+        force : bool
+            If True cached files are revalidated regardless of their age.
+
+        Returns
+        -------
+        dict
+            The resource database, or an empty dictionary if the database
+            could not be loaded from any location.
+        """
+        content = self.fetch(source, force)
+        if content is None:
+            LOGGER.warning("Using the bundled resource database for %s", source)
+            content = BUNDLED_DATABASE.read_bytes()
+        try:
+            database = json.loads(content)
+        except json.JSONDecodeError:
+            return {}
+        return self._inline_templates(database, force)
+
+    def fetch(self, source: str, force: bool = False) -> bytes | None:
+        """
+        Return the contents of the source, using the cached copy where valid.
+
+        Parameters
+        ----------
+        source : str
+            URL, ``file://`` URL or local path to read.
+        force : bool
+            If True the cached copy is revalidated regardless of its age.
+
+        Returns
+        -------
+        bytes | None
+            The file contents or None if unavailable (and never cached).
+        """
+        url = urlparse(source)
+        if url.scheme in ("", "file"):
+            path = Path(unquote(url.path))
+            return path.read_bytes() if path.is_file() else None
+
+        key = hashlib.sha256(source.encode()).hexdigest()
+        data_file = self.cache_dir / f"{key}.data"
+        meta_file = self.cache_dir / f"{key}.meta.json"
+        meta = json.loads(meta_file.read_text()) if meta_file.is_file() else {}
+        cached = data_file.read_bytes() if data_file.is_file() else None
+        if cached is not None and not force:
+            if time.time() - meta.get("fetched", 0.0) < self.ttl:
+                return cached
+
+        headers = {}
+        if cached is not None and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        try:
+            with urlopen(Request(source, headers=headers), timeout=self.timeout) as r:
+                content = r.read()
+                meta["etag"] = r.headers.get("ETag")
+        except HTTPError as e:
+            if e.code != 304:
+                LOGGER.warning("Could not fetch %s: %s", source, e)
+                return cached
+            content = cached
+        except (URLError, TimeoutError, OSError) as e:
+            LOGGER.warning("Could not fetch %s: %s", source, e)
+            return cached
+
+        data_file.write_bytes(content)
+        meta["fetched"] = time.time()
+        meta_file.write_text(json.dumps(meta))
+        return content
+
+    def _inline_templates(self, database: dict, force: bool) -> dict:
+        """Fetch all referenced template files in parallel and inline them."""
+        references = set()
+
+        def _collect(value):
+            if isinstance(value, dict):
+                for item in value.values():
+                    _collect(item)
+            elif isinstance(value, str) and _TEMPLATE_REFERENCE.match(value):
+                references.add(value)
+
+        _collect(database)
+        if not references:
+            return database
+
+        references = sorted(references)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            fetched = pool.map(lambda ref: self.fetch(ref, force), references)
+            contents = dict(zip(references, fetched, strict=True))
+
+        def _replace(value):
+            if isinstance(value, dict):
+                return {key: _replace(item) for key, item in value.items()}
+            if isinstance(value, str) and value in contents:
+                content = contents[value]
+                return yaml.safe_load(content) if content is not None else {}
+            return value
+
+        return _replace(database)
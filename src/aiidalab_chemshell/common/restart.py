@@ -0,0 +1,217 @@
+"""Module for restarting unfinished geometry optimisations."""
+
+import html
+
+import ipywidgets as ipw
+import numpy as np
+import traitlets as tl
+from aiida.common.exceptions import NotExistent
+from aiida.engine import ProcessBuilder, submit
+from aiida.orm import (
+    CalcJobNode,
+    Dict,
+    ProcessNode,
+    SinglefileData,
+    StructureData,
+    TrajectoryData,
+    load_node,
+)
+
+from aiidalab_chemshell.common.guess import guess_files, guess_prepend_text
+from aiidalab_chemshell.common.structure_ingest import read_atoms
+from aiidalab_chemshell.common.trajectory import (
+    PATH_FILE,
+    RemoteFileTail,
+    XYZFrameParser,
+)
+from aiidalab_chemshell.common.transport_pool import get_transport_pool
+
+# Extra storing the UUID of the process a restarted process continues from
+RESTART_EXTRA = "chemshell_restart_of"
+
+
+def is_restartable(process: ProcessNode | None) -> bool:
+    """Return whether a process is a geometry optimisation that did not finish."""
+    if process is None or not (process.process_type or "").endswith("chemshell.opt"):
+        return False
+    return process.is_terminated and not process.is_finished_ok
+
+
+def _optimisation_calcjob(process: ProcessNode) -> CalcJobNode | None:
+    """Return the first ChemShell calculation called, i.e. the optimisation step."""
+    calcjobs = [
+        node for node in process.called_descendants if isinstance(node, CalcJobNode)
+    ]
+    return min(calcjobs, key=lambda node: node.ctime, default=None)
+
+
+def _with_positions(
+    structure: StructureData | SinglefileData, positions: np.ndarray
+) -> StructureData | None:
+    """
+    Create a copy of an input structure with new atomic positions.
+
+    Kinds, cell and periodicity of a StructureData are kept. Structure files are
+    only supported in the (ext)xyz format as other formats (e.g. ChemShell punch
+    files) carry connectivity which is not contained in the trajectory.
+    """
+    if isinstance(structure, SinglefileData) and structure.filename[-4:] != ".xyz":
+        return None
+    atoms = read_atoms(structure)
+    if len(atoms) != len(positions):
+        return None
+    atoms.set_positions(positions)
+    return StructureData(ase=atoms)
+
+
+def last_geometry(process: ProcessNode) -> StructureData | SinglefileData | None:
+    """
+    Find the last geometry reached by a geometry optimisation.
+
+    The optimised structure is used if it was produced (e.g. when a later step
+    failed), followed by the parsed optimisation trajectory and finally the
+    DL-FIND trajectory left in the remote working directory of the calculation.
+
+    Parameters
+    ----------
+    process : ProcessNode
+        The geometry optimisation workflow.
+
+    Returns
+    -------
+    StructureData | SinglefileData | None
+        The last geometry, or None if the optimisation never wrote one.
+    """
+    if "optimised_structure" in process.outputs:
+        return process.outputs.optimised_structure
+    calcjob = _optimisation_calcjob(process)
+    if calcjob is None:
+        return None
+    if "optimised_structure" in calcjob.outputs:
+        return calcjob.outputs.optimised_structure
+    structure = calcjob.inputs.structure
+    if "trajectory_path" in calcjob.outputs:
+        trajectory: TrajectoryData = calcjob.outputs.trajectory_path
+        return _with_positions(structure, trajectory.get_positions()[-1])
+    try:
+        remote = calcjob.outputs.remote_folder
+    except NotExistent:
+        return None
+    tail = RemoteFileTail(remote, PATH_FILE)
+    with get_transport_pool().get(calcjob.computer).connect() as transport:
+        frames = XYZFrameParser().feed(tail.read(transport))
+    if not frames:
+        return None
+    return _with_positions(structure, frames[-1][1])
+
+
+def restart_builder(process: ProcessNode) -> ProcessBuilder:
+    """
+    Create a builder continuing an optimisation from its last geometry.
+
+    Parameters
+    ----------
+    process : ProcessNode
+        The failed, excepted or killed geometry optimisation workflow.
+
+    Returns
+    -------
+    ProcessBuilder
+        A builder with the same inputs as the original workflow except for the
+        starting structure.
+
+    Raises
+    ------
+    ValueError
+        If the process cannot be restarted or has no geometry to restart from.
+    """
+    if not is_restartable(process):
+        raise ValueError(f"Process <{process.pk}> is not an unfinished optimisation.")
+    geometry = last_geometry(process)
+    if geometry is None:
+        raise ValueError(f"No geometry found to restart process <{process.pk}> from.")
+    builder = process.get_builder_restart()
+    builder.chemsh.structure = geometry
+    # Start the SCF from the wavefunction left by the interrupted calculation
+    calcjob = _optimisation_calcjob(process)
+    files = guess_files(calcjob) if calcjob is not None else []
+    if files:
+        builder.chemsh.qm_parameters = Dict(
+            {**calcjob.inputs.qm_parameters.get_dict(), "restart": True}
+        )
+        builder.chemsh.metadata.options.prepend_text = guess_prepend_text(
+            calcjob, files
+        )
+    return builder
+
+
+def submit_restart(process: ProcessNode) -> ProcessNode:
+    """
+    Restart an optimisation from its last geometry.
+
+    Parameters
+    ----------
+    process : ProcessNode
+        The failed, excepted or killed geometry optimisation workflow.
+
+    Returns
+    -------
+    ProcessNode
+        The node of the restarted process.
+    """
+    node = submit(restart_builder(process))
+    label = process.label.removesuffix(" (restart)")
+    node.label = f"{label} (restart)" if label else "Restart"
+    node.description = f"Restart of process <{process.pk}> from its last geometry."
+    node.base.extras.set(RESTART_EXTRA, process.uuid)
+    return node
+
+
+class RestartWidget(ipw.HBox, tl.HasTraits):
+    """Button restarting an unfinished optimisation from its last geometry."""
+
+    process_uuid = tl.Unicode(None, allow_none=True)
+    restarted_uuid = tl.Unicode(None, allow_none=True)
+
+    def __init__(self, **kwargs):
+        """
+        RestartWidget constructor.
+
+        Parameters
+        ----------
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.restart_btn = ipw.Button(
+            description="Restart",
+            button_style="warning",
+            icon="redo",
+            tooltip="Restart the optimisation from its last geometry.",
+            disabled=True,
+            layout={"width": "20%"},
+        )
+        self.restart_btn.on_click(self._restart)
+        self.message = ipw.HTML("")
+        self.children = [self.restart_btn, self.message]
+        return
+
+    @tl.observe("process_uuid")
+    def update(self, _=None) -> None:
+        """Enable the restart button only for unfinished optimisations."""
+        process = load_node(self.process_uuid) if self.process_uuid else None
+        self.restart_btn.disabled = not is_restartable(process)
+        self.message.value = ""
+        return
+
+    def _restart(self, _=None) -> None:
+        """Submit the restarted optimisation."""
+        process = load_node(self.process_uuid)
+        try:
+            node = submit_restart(process)
+        except (ValueError, OSError) as e:
+            self.message.value = f"<p>ERROR: {html.escape(str(e))}</p>"
+            return
+        self.restarted_uuid = node.uuid
+        self.message.value = f"<p>Submitted restart &lt;{node.pk}&gt;.</p>"
+        return
@@ -0,0 +1,218 @@
+"""Module for estimating the queue load of the computers ChemShell can run on."""
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+
+from aiida.orm import Computer, load_computer
+from aiida.schedulers.datastructures import JobInfo, JobState
+
+from aiidalab_chemshell.common.code_index import CodeEntry
+from aiidalab_chemshell.common.transport_pool import get_transport_pool
+
+LOGGER = logging.getLogger(__name__)
+
+# Walltime (seconds) assumed for queued jobs which do not report a request
+DEFAULT_JOB_WALLTIME = 3600.0
+
+# Takes a computer and returns a callable listing its active jobs, all database
+# access must happen in the outer call as the listing runs in a worker thread
+JobLister = Callable[[Computer], Callable[[], list[JobInfo]]]
+
+
+def list_scheduler_jobs(computer: Computer) -> Callable[[], list[JobInfo]]:
+    """
+    Prepare the listing of the active jobs on a computer's AiiDA scheduler.
+
+    Parameters
+    ----------
+    computer : Computer
+        The computer whose scheduler is queried.
+
+    Returns
+    -------
+    Callable[[], list[JobInfo]]
+        Callable returning all jobs currently known to the scheduler (for all
+        users), which does not access the AiiDA database.
+    """
+    scheduler = computer.get_scheduler()
+    transports = get_transport_pool().get(computer)
+
+    def _list_jobs() -> list[JobInfo]:
+        with transports.connect() as transport:
+            scheduler.set_transport(transport)
+            return scheduler.get_jobs(as_dict=False)
+
+    return _list_jobs
+
+
+@dataclass(frozen=True)
+class QueueLoad:
+    """Snapshot of the load on a computer's scheduler queue."""
+
+    running: int = 0
+    queued: int = 0
+    queued_walltime: float = 0.0
+    available: bool = True
+
+    @property
+    def expected_wait(self) -> float:
+        """
+        Rough estimate (seconds) of the wait before a new job would start.
+
+        The requested walltime of all queued jobs is shared between the
+        currently running jobs, which are used as a proxy for the number of job
+        slots on the machine. Unreachable computers never have a finite wait.
+        """
+        if not self.available:
+            return float("inf")
+        return self.queued_walltime / max(self.running, 1)
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[JobInfo]) -> "QueueLoad":
+        """Summarise the load from a list of scheduler jobs."""
+        running = queued = 0
+        walltime = 0.0
+        for job in jobs:
+            state = getattr(job, "job_state", None)
+            if state == JobState.RUNNING:
+                running += 1
+            elif state in (JobState.QUEUED, JobState.QUEUED_HELD):
+                queued += 1
+                requested = getattr(job, "requested_wallclock_time_seconds", None)
+                walltime += requested or DEFAULT_JOB_WALLTIME
+        return cls(running=running, queued=queued, queued_walltime=walltime)
+
+
+class SchedulerLoadMonitor:
+    """
+    Query and cache the scheduler load of AiiDA computers.
+
+    Results are cached per computer for a short time-to-live so that repeated
+    submissions do not query the remote schedulers every time.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        job_lister: JobLister = list_scheduler_jobs,
+        max_workers: int = 4,
+    ):
+        """
+        SchedulerLoadMonitor constructor.
+
+        Parameters
+        ----------
+        ttl : float
+            Time (seconds) for which a queried load is reused.
+        job_lister : JobLister
+            Callable preparing the listing of a computer's active scheduler
+            jobs, this can be replaced with a mock scheduler for offline use.
+        max_workers : int
+            Maximum number of computers queried concurrently.
+        """
+        self.ttl = ttl
+        self.job_lister = job_lister
+        self.max_workers = max_workers
+        self._cache: dict[str, tuple[float, QueueLoad]] = {}
+        self._lock = Lock()
+        return
+
+    def _prepare(self, computer: Computer) -> Callable[[], QueueLoad]:
+        """Prepare the load query of a computer, marking failures as unavailable."""
+        label = computer.label
+        try:
+            list_jobs = self.job_lister(computer)
+        except Exception as e:
+            LOGGER.warning("Could not access the scheduler of %s: %s", label, e)
+            return lambda: QueueLoad(available=False)
+
+        def _query() -> QueueLoad:
+            try:
+                return QueueLoad.from_jobs(list_jobs())
+            # Any failure to reach the scheduler (connection, authentication or
+            # parsing errors) should only exclude this computer from selection
+            except Exception as e:
+                LOGGER.warning("Could not query the scheduler of %s: %s", label, e)
+                return QueueLoad(available=False)
+
+        return _query
+
+    def get_loads(self, computers: Iterable[Computer]) -> dict[str, QueueLoad]:
+        """
+        Return the queue load for each of the given computers.
+
+        Parameters
+        ----------
+        computers : Iterable[Computer]
+            The computers to query, any with a valid cached load are not
+            queried again.
+
+        Returns
+        -------
+        dict[str, QueueLoad]
+            The queue load keyed by computer label.
+        """
+        now = time.monotonic()
+        loads, stale = {}, []
+        with self._lock:
+            for computer in computers:
+                cached = self._cache.get(computer.label)
+                if cached is not None and now - cached[0] < self.ttl:
+                    loads[computer.label] = cached[1]
+                else:
+                    stale.append(computer)
+        if stale:
+            queries = [self._prepare(computer) for computer in stale]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(query) for query in queries]
+                for computer, future in zip(stale, futures, strict=True):
+                    loads[computer.label] = future.result()
+            with self._lock:
+                for computer in stale:
+                    self._cache[computer.label] = (now, loads[computer.label])
+        return loads
+
+    def least_loaded(self, entries: Iterable[CodeEntry]) -> CodeEntry | None:
+        """
+        Select the code installed on the computer with the shortest expected wait.
+
+        Parameters
+        ----------
+        entries : Iterable[CodeEntry]
+            The candidate codes.
+
+        Returns
+        -------
+        CodeEntry | None
+            The code on the least loaded computer, or None if no computer
+            could be queried.
+        """
+        entries = [entry for entry in entries if entry.computer is not None]
+        computers = [load_computer(label) for label in {e.computer for e in entries}]
+        loads = self.get_loads(computers)
+        best = min(
+            entries,
+            key=lambda entry: loads[entry.computer].expected_wait,
+            default=None,
+        )
+        if best is None or not loads[best.computer].available:
+            return None
+        return best
+
+    def clear(self) -> None:
+        """Discard all cached loads."""
+        with self._lock:
+            self._cache.clear()
+        return
+
+
+_MONITOR = SchedulerLoadMonitor()
+
+
+def get_scheduler_load_monitor() -> SchedulerLoadMonitor:
+    """Return the scheduler load monitor shared by all app instances."""
+    return _MONITOR
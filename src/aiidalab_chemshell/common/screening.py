@@ -0,0 +1,233 @@
+"""Module defining the multi-level basis set screening workflow."""
+
+import numpy as np
+from aiida.engine import ToContext, WorkChain, calcfunction, while_
+from aiida.orm import (
+    Bool,
+    Dict,
+    Float,
+    Int,
+    List,
+    SinglefileData,
+    StructureData,
+)
+from aiida.plugins import CalculationFactory
+
+from aiidalab_chemshell.common.chemshell import BasisSetOptions
+
+ChemShellCalculation = CalculationFactory("chemshell")
+
+# The basis sets of each screening level, cheapest first
+DEFAULT_LEVELS = tuple(option.label for option in BasisSetOptions)
+
+
+def select_survivors(
+    energies: dict[str, float],
+    energy_window: float | None = None,
+    top_n: int | None = None,
+) -> list[str]:
+    """
+    Select the lowest energy structures to promote to the next screening level.
+
+    Parameters
+    ----------
+    energies : dict[str, float]
+        The energy of each structure.
+    energy_window : float | None
+        Only keep structures within this energy of the lowest energy structure.
+    top_n : int | None
+        Only keep this number of the lowest energy structures.
+
+    Returns
+    -------
+    list[str]
+        The keys of the selected structures, lowest energy first.
+    """
+    if not energies:
+        return []
+    keys = list(energies)
+    values = np.fromiter(energies.values(), dtype=float, count=len(keys))
+    order = np.argsort(values, kind="stable")
+    if energy_window is not None:
+        order = order[values[order] - values.min() <= energy_window]
+    if top_n is not None:
+        order = order[:top_n]
+    return [keys[i] for i in order]
+
+
+@calcfunction
+def collate_energies(levels: List, **energies: Float) -> Dict:
+    """Collate the energies of every structure (``{key}_level{i}``) by basis set."""
+    collated: dict[str, dict[str, float]] = {}
+    for label, energy in energies.items():
+        key, level = label.rsplit("_level", 1)
+        collated.setdefault(key, {})[levels[int(level)]] = energy.value
+    return Dict(collated)
+
+
+class ScreeningWorkChain(WorkChain):
+    """
+    Screen many structures with a ladder of increasingly expensive basis sets.
+
+    Every structure is calculated with the first basis set, then only those
+    passing the energy window and/or top-N filter are promoted to the next
+    basis set, starting from the geometry reached at the previous level.
+    """
+
+    @classmethod
+    def define(cls, spec) -> None:
+        """Define the AiiDA process specification for the WorkChain."""
+        super().define(spec)
+
+        spec.expose_inputs(
+            ChemShellCalculation,
+            exclude=(
+                "structure",
+                "structure2",
+                "structure_index",
+                "optimisation_parameters",
+                "metadata",
+            ),
+        )
+        spec.expose_inputs(
+            ChemShellCalculation, namespace="calc", include=("metadata",)
+        )
+        spec.input_namespace(
+            "structures",
+            valid_type=(StructureData, SinglefileData),
+            dynamic=True,
+            help="The structures to screen.",
+        )
+        spec.input(
+            "basis_sets",
+            valid_type=List,
+            default=lambda: List(list(DEFAULT_LEVELS)),
+            help="The basis set of each screening level, cheapest first.",
+        )
+        spec.input(
+            "energy_window",
+            valid_type=Float,
+            required=False,
+            help=(
+                "Only promote structures within this energy (Hartree) of the lowest "
+                "energy structure at each level."
+            ),
+        )
+        spec.input(
+            "top_n",
+            valid_type=Int,
+            required=False,
+            help="Only promote this number of the lowest energy structures.",
+        )
+        spec.input(
+            "optimise",
+            valid_type=Bool,
+            default=lambda: Bool(True),
+            help=(
+                "Optimise the geometry at every level, starting from the geometry "
+                "of the previous level, rather than single point energies."
+            ),
+        )
+
+        spec.output(
+            "energies",
+            valid_type=Dict,
+            help="The energy (Hartree) of every structure at each basis set.",
+        )
+        spec.output_namespace(
+            "structures",
+            valid_type=(StructureData, SinglefileData),
+            dynamic=True,
+            help="The final geometry of every structure passing the last level.",
+        )
+
+        spec.exit_code(
+            400,
+            "ERROR_NO_SURVIVORS",
+            message="No structure completed screening level {level}.",
+        )
+
+        spec.outline(
+            cls.setup,
+            while_(cls.has_next_level)(
+                cls.run_level,
+                cls.filter_level,
+            ),
+            cls.result,
+        )
+        return
+
+    def setup(self) -> None:
+        """Start the screening with every input structure."""
+        self.ctx.level = 0
+        self.ctx.geometries = dict(self.inputs.structures)
+        self.ctx.energies = {}
+        return
+
+    def has_next_level(self) -> bool:
+        """Return whether there are further screening levels."""
+        return self.ctx.level < len(self.inputs.basis_sets)
+
+    def run_level(self):
+        """Submit a calculation of every surviving structure at the current level."""
+        inputs = self.exposed_inputs(ChemShellCalculation)
+        inputs.update(self.exposed_inputs(ChemShellCalculation, namespace="calc"))
+        basis = self.inputs.basis_sets[self.ctx.level]
+        if "qm_parameters" in inputs:
+            inputs["qm_parameters"] = Dict(
+                {**inputs["qm_parameters"].get_dict(), "basis": basis}
+            )
+        if self.inputs.optimise:
+            inputs["optimisation_parameters"] = Dict({})
+            inputs.pop("calculation_parameters", None)
+
+        futures = {}
+        for key, structure in self.ctx.geometries.items():
+            future = self.submit(ChemShellCalculation, structure=structure, **inputs)
+            future.label = f"{key} ({basis})"
+            futures[f"{key}_level{self.ctx.level}"] = future
+        self.report(f"Submitted {len(futures)} calculations with basis {basis}")
+        return ToContext(**futures)
+
+    def filter_level(self):
+        """Collect the results of the current level and select the survivors."""
+        level = self.ctx.level
+        energies, geometries = {}, {}
+        for key in self.ctx.geometries:
+            calcjob = self.ctx[f"{key}_level{level}"]
+            if not calcjob.is_finished_ok:
+                self.report(f"{key} failed at level {level} and is dropped")
+                continue
+            energies[key] = calcjob.outputs.energy.value
+            self.ctx.energies[f"{key}_level{level}"] = calcjob.outputs.energy
+            if "optimised_structure" in calcjob.outputs:
+                geometries[key] = calcjob.outputs.optimised_structure
+            else:
+                geometries[key] = self.ctx.geometries[key]
+        if not energies:
+            return self.exit_codes.ERROR_NO_SURVIVORS.format(level=level)
+
+        self.ctx.level += 1
+        if self.has_next_level():
+            window = self.inputs.get("energy_window")
+            top_n = self.inputs.get("top_n")
+            survivors = select_survivors(
+                energies,
+                window.value if window is not None else None,
+                top_n.value if top_n is not None else None,
+            )
+            self.report(f"Promoting {len(survivors)} of {len(energies)} structures")
+        else:
+            survivors = list(energies)
+        self.ctx.geometries = {key: geometries[key] for key in survivors}
+        return None
+
+    def result(self) -> None:
+        """Output the energies of every level and the final geometries."""
+        self.out(
+            "energies",
+            collate_energies(self.inputs.basis_sets, **self.ctx.energies),
+        )
+        for key, geometry in self.ctx.geometries.items():
+            self.out(f"structures.{key}", geometry)
+        return
@@ -0,0 +1,259 @@
+"""Module for persisting the app's input selections between sessions."""
+
+import json
+import os
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+import ipywidgets as ipw
+import traitlets as tl
+from aiida.manage import get_manager
+from aiida.orm import Group, Node, QueryBuilder
+
+from aiidalab_chemshell.utils import get_cache_dir
+
+SESSION_VERSION = 1
+
+# The sub-models of the main application model which are persisted
+SESSION_MODELS = ("structure_model", "workflow_model", "resource_model")
+
+# Transient traits describing the progress of the wizard rather than the inputs
+TRANSIENT_TRAITS = {"submitted", "confirmed", "validation_message"}
+
+
+def _session_traits(model: tl.HasTraits) -> dict[str, tl.TraitType]:
+    """Return the persisted traits of a model in definition order."""
+    traits = {}
+    for cls in reversed(type(model).__mro__):
+        for name, value in vars(cls).items():
+            if isinstance(value, tl.TraitType) and name not in TRANSIENT_TRAITS:
+                traits[name] = value
+    return traits
+
+
+class SessionStore:
+    """
+    Compact local store of the structure, workflow and resource selections.
+
+    Nodes and groups are stored by UUID alongside the other parameters, and
+    only traits differing from their defaults are written. On restore all
+    referenced nodes are loaded with a single query, so a half-configured
+    workflow is recovered without repeating database searches or structure
+    parsing. The store is kept per AiiDA profile in the app's cache directory.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        SessionStore constructor.
+
+        Parameters
+        ----------
+        path : str | Path | None
+            The session file, defaults to one per profile in the cache directory.
+        """
+        if path is None:
+            profile = get_manager().get_profile()
+            name = profile.name if profile is not None else "default"
+            path = get_cache_dir() / f"session-{name}.json"
+        self.path = Path(path)
+        self._content: str | None = None
+        self._restoring = False
+        return
+
+    def _encode(self, model: tl.HasTraits, value):
+        """Encode a trait value, returning None for values which are not kept."""
+        if isinstance(value, Node):
+            if not value.is_stored:
+                # Only inputs locked in by submitting their step are stored
+                if not getattr(model, "submitted", False):
+                    return None
+                value.store()
+            return {"uuid": value.uuid}
+        if isinstance(value, Group):
+            return {"group": value.uuid}
+        if isinstance(value, Enum):
+            return {"enum": value.name}
+        return value
+
+    def dump(self, model) -> dict:
+        """
+        Serialise the persisted sub-models of the main application model.
+
+        Parameters
+        ----------
+        model : MainAppModel
+            The main application model.
+
+        Returns
+        -------
+        dict
+            The session, with the non-default traits of each sub-model.
+        """
+        models = {}
+        for key in SESSION_MODELS:
+            submodel = getattr(model, key)
+            values = {}
+            for name, trait in _session_traits(submodel).items():
+                value = getattr(submodel, name)
+                if value == trait.default():
+                    continue
+                encoded = self._encode(submodel, value)
+                if encoded is not None:
+                    values[name] = encoded
+            models[key] = values
+        return {"version": SESSION_VERSION, "models": models}
+
+    def save(self, model) -> None:
+        """Write the session of the main application model if it has changed."""
+        if self._restoring:
+            return
+        session = self.dump(model)
+        content = json.dumps(session["models"], separators=(",", ":"))
+        if content == self._content:
+            return
+        session["saved"] = datetime.now().isoformat(timespec="seconds")
+        # Write to a temporary file first so a partially written session is
+        # never read back
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(session, separators=(",", ":")))
+        os.replace(tmp_path, self.path)
+        self._content = content
+        return
+
+    def load(self) -> dict | None:
+        """Read the stored session, None if there is no (compatible) session."""
+        try:
+            session = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+        if session.get("version") != SESSION_VERSION:
+            return None
+        return session
+
+    @staticmethod
+    def _load_references(models: dict) -> dict[str, Node | Group]:
+        """Load every node and group referenced by the session at once."""
+        nodes, groups = set(), set()
+        for values in models.values():
+            for value in values.values():
+                if isinstance(value, dict):
+                    nodes.update([value["uuid"]] if "uuid" in value else [])
+                    groups.update([value["group"]] if "group" in value else [])
+        references = {}
+        for cls, uuids in ((Node, nodes), (Group, groups)):
+            if uuids:
+                qb = QueryBuilder().append(
+                    cls, filters={"uuid": {"in": list(uuids)}}, project="*"
+                )
+                references.update({entity.uuid: entity for entity in qb.all(flat=True)})
+        return references
+
+    def restore(self, model) -> bool:
+        """
+        Restore the stored session into the main application model.
+
+        Parameters
+        ----------
+        model : MainAppModel
+            The main application model, whose views should already be linked
+            so they show the restored values.
+
+        Returns
+        -------
+        bool
+            True if a session was restored.
+        """
+        session = self.load()
+        if session is None:
+            return False
+        models = session["models"]
+        references = self._load_references(models)
+        self._restoring = True
+        try:
+            for key, values in models.items():
+                submodel = getattr(model, key)
+                traits = _session_traits(submodel)
+                for name, value in values.items():
+                    if name not in traits:
+                        continue
+                    if isinstance(value, dict) and "enum" in value:
+                        value = traits[name].enum_class[value["enum"]]
+                    elif isinstance(value, dict):
+                        value = references.get(value.get("uuid", value.get("group")))
+                        if value is None:
+                            # The node or group has since been deleted
+                            continue
+                    try:
+                        setattr(submodel, name, value)
+                    except (tl.TraitError, KeyError):
+                        continue
+        finally:
+            self._restoring = False
+        self._content = json.dumps(self.dump(model)["models"], separators=(",", ":"))
+        return any(models.values())
+
+    def track(self, model) -> None:
+        """Save the session whenever a persisted trait of the model changes."""
+        for key in SESSION_MODELS:
+            submodel = getattr(model, key)
+            submodel.observe(
+                lambda _: self.save(model), names=list(_session_traits(submodel))
+            )
+        return
+
+    def reset(self, model) -> None:
+        """Reset the persisted traits to their defaults and clear the store."""
+        self._restoring = True
+        try:
+            for key in SESSION_MODELS:
+                submodel = getattr(model, key)
+                for name, trait in _session_traits(submodel).items():
+                    setattr(submodel, name, trait.default())
+        finally:
+            self._restoring = False
+        self.clear()
+        return
+
+    def clear(self) -> None:
+        """Delete the stored session."""
+        self.path.unlink(missing_ok=True)
+        self._content = None
+        return
+
+
+class SessionNoticeWidget(ipw.HBox):
+    """Notice of a restored session, with the option to start afresh."""
+
+    def __init__(self, store: SessionStore, model, **kwargs):
+        """
+        SessionNoticeWidget constructor.
+
+        Parameters
+        ----------
+        store : SessionStore
+            The session store the model was restored from.
+        model : MainAppModel
+            The main application model.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.store = store
+        self.model = model
+        self.message = ipw.HTML(
+            "<p>The selections of your previous session have been restored.</p>"
+        )
+        self.reset_btn = ipw.Button(
+            description="Start Afresh",
+            icon="rotate-left",
+            tooltip="Discard the restored selections",
+        )
+        self.reset_btn.on_click(self._reset)
+        self.children = [self.message, self.reset_btn]
+        return
+
+    def _reset(self, _=None) -> None:
+        self.store.reset(self.model)
+        self.layout.display = "none"
+        return
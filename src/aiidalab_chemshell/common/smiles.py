@@ -0,0 +1,335 @@
+"""Module for generating 3D structures from SMILES strings in parallel."""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+
+import ipywidgets as ipw
+import traitlets as tl
+from aiida.orm import Group, QueryBuilder, StructureData
+from ase import Atoms
+from rdkit import Chem
+from rdkit.Chem import AllChem
+
+from aiidalab_chemshell.common.structure_metadata import atoms_metadata
+
+# Extra storing the cache key of structures generated from a SMILES string
+CONFORMER_KEY_EXTRA = "chemshell_conformer_key"
+
+
+@dataclass(frozen=True)
+class ConformerParameters:
+    """Parameters controlling the RDKit conformer embedding."""
+
+    random_seed: int = 42
+    optimise: bool = True
+    max_iterations: int = 500
+
+    def key(self, smiles: str) -> str:
+        """Return the cache key for a canonical SMILES string."""
+        content = json.dumps([smiles, asdict(self)], sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+
+def canonical_smiles(smiles: str) -> str:
+    """
+    Return the canonical form of a SMILES string.
+
+    Parameters
+    ----------
+    smiles : str
+        The SMILES string.
+
+    Returns
+    -------
+    str
+        The canonical SMILES string.
+
+    Raises
+    ------
+    ValueError
+        If the SMILES string is invalid.
+    """
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        raise ValueError(f"Invalid SMILES string '{smiles}'.")
+    return Chem.MolToSmiles(mol)
+
+
+def embed_smiles(
+    smiles: str, parameters: ConformerParameters
+) -> tuple[list[str], list[list[float]]]:
+    """
+    Generate a 3D conformer for a SMILES string.
+
+    This only depends on RDKit so that it can be run in a worker process.
+
+    Parameters
+    ----------
+    smiles : str
+        The SMILES string.
+    parameters : ConformerParameters
+        The embedding parameters.
+
+    Returns
+    -------
+    tuple[list[str], list[list[float]]]
+        The chemical symbols and positions (Angstrom) of all atoms.
+    """
+    mol = Chem.AddHs(Chem.MolFromSmiles(smiles))
+    options = AllChem.ETKDGv3()
+    options.randomSeed = parameters.random_seed
+    if AllChem.EmbedMolecule(mol, options) != 0:
+        raise ValueError(f"Could not embed a conformer for '{smiles}'.")
+    if parameters.optimise:
+        AllChem.MMFFOptimizeMolecule(mol, maxIters=parameters.max_iterations)
+    symbols = [atom.GetSymbol() for atom in mol.GetAtoms()]
+    return symbols, mol.GetConformer().GetPositions().tolist()
+
+
+class ConformerGenerator:
+    """
+    Generate StructureData nodes from SMILES strings using a process pool.
+
+    Generated structures are stored with a cache key of their canonical SMILES
+    and the embedding parameters, so each molecule is only embedded once per
+    set of parameters. Worker processes only compute the coordinates, the
+    nodes are always created and stored by the calling thread. The workers are
+    spawned rather than forked, as forking a kernel with open database
+    connections and running threads is unsafe.
+    """
+
+    def __init__(
+        self,
+        parameters: ConformerParameters | None = None,
+        max_workers: int | None = None,
+    ):
+        """
+        ConformerGenerator constructor.
+
+        Parameters
+        ----------
+        parameters : ConformerParameters | None
+            The embedding parameters, defaults are used if not given.
+        max_workers : int | None
+            Maximum number of worker processes, defaults to the CPU count.
+        """
+        self.parameters = parameters or ConformerParameters()
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        return
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """The process pool, started on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def lookup(self, smiles: Iterable[str]) -> dict[str, StructureData]:
+        """
+        Return the cached structures of canonical SMILES strings with one query.
+
+        Parameters
+        ----------
+        smiles : Iterable[str]
+            The canonical SMILES strings.
+
+        Returns
+        -------
+        dict[str, StructureData]
+            The cached structure of each SMILES string, missing ones are omitted.
+        """
+        keys = {self.parameters.key(s): s for s in smiles}
+        if not keys:
+            return {}
+        qb = QueryBuilder().append(
+            StructureData,
+            filters={f"extras.{CONFORMER_KEY_EXTRA}": {"in": list(keys)}},
+            project=[f"extras.{CONFORMER_KEY_EXTRA}", "*"],
+        )
+        return {keys[key]: node for key, node in qb.iterall()}
+
+    def submit(self, smiles: str) -> Future:
+        """Embed a canonical SMILES string in a worker process."""
+        return self.pool.submit(embed_smiles, smiles, self.parameters)
+
+    def store(
+        self, smiles: str, result: tuple[list[str], list[list[float]]]
+    ) -> StructureData:
+        """Store the embedded structure of a canonical SMILES string."""
+        symbols, positions = result
+        node = StructureData(ase=Atoms(symbols=symbols, positions=positions))
+        node.label = smiles
+        node.base.extras.set_many(
+            {
+                "smiles": smiles,
+                CONFORMER_KEY_EXTRA: self.parameters.key(smiles),
+                **atoms_metadata(node.get_ase()),
+            }
+        )
+        return node.store()
+
+    def generate(self, smiles: Iterable[str]) -> list[StructureData]:
+        """
+        Return a structure for each SMILES string, embedding any not cached.
+
+        Parameters
+        ----------
+        smiles : Iterable[str]
+            The SMILES strings.
+
+        Returns
+        -------
+        list[StructureData]
+            The stored structure for each (unique) SMILES string in order.
+        """
+        canonical = list(dict.fromkeys(canonical_smiles(s) for s in smiles))
+        nodes = self.lookup(canonical)
+        futures = {s: self.submit(s) for s in canonical if s not in nodes}
+        for s, future in futures.items():
+            nodes[s] = self.store(s, future.result())
+        return [nodes[s] for s in canonical]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        return
+
+
+class SmilesBatchWidget(ipw.VBox, tl.HasTraits):
+    """Widget generating a group of structures from a list of SMILES strings."""
+
+    group = tl.Instance(Group, allow_none=True)
+
+    def __init__(self, generator: ConformerGenerator | None = None, **kwargs):
+        """
+        SmilesBatchWidget constructor.
+
+        Parameters
+        ----------
+        generator : ConformerGenerator | None
+            The conformer generator to use, a default one is created if not given.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.generator = generator or ConformerGenerator()
+        self.smiles = ipw.Textarea(
+            value="",
+            placeholder="One SMILES string per line",
+            description="SMILES: ",
+            layout={"width": "90%", "height": "150px"},
+        )
+        self.group_label = ipw.Text(
+            value="", description="Group: ", layout={"width": "70%"}
+        )
+        self.generate_btn = ipw.Button(
+            description="Generate",
+            button_style="info",
+            tooltip="Generate 3D structures and add them to the group",
+            icon="cogs",
+            layout={"width": "20%"},
+        )
+        self.generate_btn.on_click(self._generate)
+        self.progress = ipw.IntProgress(value=0, min=0, max=1, layout={"width": "90%"})
+        self.message = ipw.HTML("")
+        self.children = [
+            self.smiles,
+            ipw.HBox([self.group_label, self.generate_btn]),
+            self.progress,
+            self.message,
+        ]
+        self._pending = 0
+        self._failed: list[str] = []
+        return
+
+    def _generate(self, _=None) -> None:
+        """Start generating the structures without blocking the kernel."""
+        if not self.group_label.value:
+            self.message.value = "<p>ERROR: No group label provided.</p>"
+            return
+        canonical, self._failed = [], []
+        for line in self.smiles.value.splitlines():
+            if line.strip():
+                try:
+                    canonical.append(canonical_smiles(line.strip()))
+                except ValueError:
+                    self._failed.append(line.strip())
+        canonical = list(dict.fromkeys(canonical))
+        self._group, _ = Group.collection.get_or_create(label=self.group_label.value)
+        self.progress.max = max(len(canonical), 1)
+        self.progress.value = 0
+        self.generate_btn.disabled = True
+
+        # Results are handed back to the kernel's event loop so that nodes are
+        # only ever stored from the main thread
+        loop = asyncio.get_event_loop()
+        self._pending = len(canonical)
+        cached = self.generator.lookup(canonical)
+        for smiles in canonical:
+            if smiles in cached:
+                self._add(smiles, cached[smiles])
+                continue
+            future = self.generator.submit(smiles)
+            future.add_done_callback(
+                lambda f, s=smiles: loop.call_soon_threadsafe(self._on_result, s, f)
+            )
+        if self._pending == 0:
+            self._finish()
+        return
+
+    def _on_result(self, smiles: str, future: Future) -> None:
+        """Store a generated structure."""
+        try:
+            node = self.generator.store(smiles, future.result())
+        except Exception:
+            self._failed.append(smiles)
+            node = None
+        self._add(smiles, node)
+        if self._pending == 0:
+            self._finish()
+        return
+
+    def _add(self, smiles: str, node: StructureData | None) -> None:
+        """Add a structure to the group and update the progress."""
+        if node is not None:
+            self._group.add_nodes(node)
+        self._pending -= 1
+        self.progress.value += 1
+        self.message.value = f"<p>Generated {self.progress.value} structures...</p>"
+        return
+
+    def _finish(self) -> None:
+        """Report the generated structures and attach the group."""
+        self.generate_btn.disabled = False
+        message = (
+            f"Group '{self._group.label}' contains {self._group.count()} structures."
+        )
+        if self._failed:
+            message += f" Failed: {', '.join(self._failed)}"
+        self.message.value = f"<p>{message}</p>"
+        self.group = None
+        self.group = self._group
+        return
+
+    def disable(self, val: bool) -> None:
+        """Disable the SMILES inputs."""
+        self.smiles.disabled = val
+        self.generate_btn.disabled = val
+        return
+
+    def close(self) -> None:
+        """Close the widget and stop the worker processes."""
+        self.generator.shutdown()
+        super().close()
+        return
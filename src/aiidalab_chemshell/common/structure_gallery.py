@@ -0,0 +1,445 @@
+"""Module for browsing the final geometries of many calculations side by side."""
+
+import asyncio
+import html
+import io
+import multiprocessing
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import ipywidgets as ipw
+import numpy as np
+import pandas as pd
+import traitlets as tl
+from aiida.orm import (
+    CalcJobNode,
+    QueryBuilder,
+    SinglefileData,
+    StructureData,
+    load_node,
+)
+from ase import Atoms
+from ase import io as ase_io
+from ase.data import covalent_radii
+from ase.data.colors import jmol_colors
+
+from aiidalab_chemshell.common.structure_ingest import ASE_FORMATS, BINARY_FORMATS
+from aiidalab_chemshell.common.structure_viewer import StructureViewWidget
+
+# Larger structures are drawn from an evenly spaced subset of their atoms
+MAX_THUMBNAIL_ATOMS = 2000
+
+# Projected attributes of the structure nodes, enough to build their atoms
+STRUCTURE_PROJECTIONS = (
+    "id",
+    "node_type",
+    "attributes.kinds",
+    "attributes.sites",
+    "attributes.cell",
+    "attributes.pbc1",
+    "attributes.pbc2",
+    "attributes.pbc3",
+    "attributes.filename",
+)
+
+
+@dataclass(frozen=True)
+class GalleryEntry:
+    """
+    The raw data of a calculation's final structure.
+
+    Either the projected StructureData attributes or the contents of a structure
+    file are held, so the structure can be parsed away from the database.
+    """
+
+    pk: int
+    label: str
+    structure_pk: int
+    kinds: list | None = None
+    sites: list | None = None
+    cell: list | None = None
+    pbc: tuple[bool, bool, bool] = (False, False, False)
+    filename: str | None = None
+    content: bytes | None = None
+
+    def to_atoms(self) -> Atoms:
+        """
+        Build the atoms of the structure.
+
+        Returns
+        -------
+        Atoms
+            The structure's atoms (the first frame of multi-frame files).
+
+        Raises
+        ------
+        ValueError
+            If the structure file cannot be read by ASE.
+        """
+        if self.filename is None:
+            symbols = {kind["name"]: kind["symbols"][0] for kind in self.kinds or []}
+            return Atoms(
+                symbols=[symbols[site["kind_name"]] for site in self.sites or []],
+                positions=[site["position"] for site in self.sites or []],
+                cell=self.cell,
+                pbc=self.pbc,
+            )
+        fmt = ASE_FORMATS.get(Path(self.filename).suffix.lower())
+        if fmt is None:
+            raise ValueError(f"Cannot read the atoms of '{self.filename}'.")
+        stream = io.BytesIO(self.content or b"")
+        if fmt not in BINARY_FORMATS:
+            stream = io.TextIOWrapper(stream)
+        return ase_io.read(stream, index=0, format=fmt)
+
+
+def _structure_query(pks: list[int], label: str, output: bool) -> QueryBuilder:
+    """Create the query projecting a linked structure of each calculation."""
+    qb = QueryBuilder()
+    qb.append(
+        CalcJobNode, filters={"id": {"in": pks}}, project=["id", "label"], tag="calc"
+    )
+    link = {"with_incoming" if output else "with_outgoing": "calc"}
+    qb.append(
+        (StructureData, SinglefileData),
+        edge_filters={"label": label},
+        project=list(STRUCTURE_PROJECTIONS),
+        **link,
+    )
+    return qb
+
+
+def gallery_entries(pks: Iterable[int]) -> list[GalleryEntry]:
+    """
+    Collect the final structure of each calculation for the gallery.
+
+    The optimised structure is used where there is one, otherwise the input
+    structure. StructureData attributes are projected with one query for each,
+    so only structure files are read from the repository. This accesses the
+    database so must be called from the main thread.
+
+    Parameters
+    ----------
+    pks : Iterable[int]
+        The PKs of the ChemShell calculations.
+
+    Returns
+    -------
+    list[GalleryEntry]
+        The final structure of each calculation with one, in the given order.
+    """
+    pks = list(dict.fromkeys(pks))
+    rows = {}
+    # Optimised structures replace the input structures of the same calculation
+    for label, output in (("structure", False), ("optimised_structure", True)):
+        for row in _structure_query(pks, label, output).iterall():
+            rows[row[0]] = row
+    entries = []
+    for pk in pks:
+        if pk not in rows:
+            continue
+        _, label, spk, node_type, kinds, sites, cell, *pbc, filename = rows[pk]
+        if node_type.startswith("data.core.structure."):
+            entry = GalleryEntry(pk, label, spk, kinds, sites, cell, tuple(pbc))
+        else:
+            content = load_node(spk).get_content(mode="rb")
+            entry = GalleryEntry(pk, label, spk, filename=filename, content=content)
+        entries.append(entry)
+    return entries
+
+
+def render_thumbnail(atoms: Atoms, size: int = 160) -> str:
+    """
+    Draw a lightweight SVG image of a structure.
+
+    The atoms are drawn as spheres in the plane of their two largest principal
+    axes, furthest first, so no 3D viewer is needed.
+
+    Parameters
+    ----------
+    atoms : Atoms
+        The structure.
+    size : int
+        The width and height of the image in pixels.
+
+    Returns
+    -------
+    str
+        The SVG image.
+    """
+    header = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+        f'viewBox="0 0 {size} {size}"><rect width="100%" height="100%" fill="white"/>'
+    )
+    if len(atoms) == 0:
+        return header + "</svg>"
+    index = np.arange(len(atoms))
+    if len(atoms) > MAX_THUMBNAIL_ATOMS:
+        index = np.linspace(0, len(atoms) - 1, MAX_THUMBNAIL_ATOMS).astype(int)
+    numbers = atoms.numbers[index]
+    centred = atoms.positions[index] - atoms.positions[index].mean(axis=0)
+    _, _, axes = np.linalg.svd(centred)
+    projected = centred @ axes.T
+    radii = 0.6 * covalent_radii[numbers]
+    extent = np.max(np.abs(projected[:, :2]) + radii[:, None])
+    scale = (size / 2 - 2) / extent if extent > 0 else 1.0
+    circles = []
+    for i in np.argsort(projected[:, 2]):
+        x, y, _ = projected[i]
+        r, g, b = (255 * jmol_colors[numbers[i]]).astype(int)
+        circles.append(
+            f'<circle cx="{size / 2 + x * scale:.1f}" cy="{size / 2 - y * scale:.1f}" '
+            f'r="{max(radii[i] * scale, 1.0):.1f}" fill="rgb({r},{g},{b})" '
+            'stroke="#333" stroke-width="0.5"/>'
+        )
+    return header + "".join(circles) + "</svg>"
+
+
+def render_entry(entry: GalleryEntry, size: int = 160) -> tuple[Atoms, str]:
+    """Parse a structure and draw its thumbnail, run in a worker process."""
+    atoms = entry.to_atoms()
+    return atoms, render_thumbnail(atoms, size)
+
+
+class StructureTile(ipw.VBox):
+    """Thumbnail of a single structure, filled in once it has been rendered."""
+
+    def __init__(self, entry: GalleryEntry, size: int, **kwargs):
+        """
+        StructureTile constructor.
+
+        Parameters
+        ----------
+        entry : GalleryEntry
+            The structure shown.
+        size : int
+            The width and height of the thumbnail in pixels.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.entry = entry
+        self.atoms: Atoms | None = None
+        # Resolved once the thumbnail (or an error) is shown
+        self.ready: Future = Future()
+        self.thumbnail = ipw.HTML(
+            f"<div style='width: {size}px; height: {size}px'>Loading...</div>"
+        )
+        self.caption = ipw.HTML(f"<p>&lt;{entry.pk}&gt; {html.escape(entry.label)}</p>")
+        self.view_btn = ipw.Button(
+            description="View", icon="eye", disabled=True, layout={"width": "auto"}
+        )
+        self.children = [self.thumbnail, self.caption, self.view_btn]
+        return
+
+    def show(self, future: Future) -> None:
+        """Show the rendered structure, called when its worker has finished."""
+        if future.cancelled():
+            self.thumbnail.value = "<p>Rendering cancelled.</p>"
+            self.ready.set_result(None)
+            return
+        try:
+            atoms, svg = future.result()
+        except Exception as e:
+            self.thumbnail.value = f"<p>Could not read the structure: {e}</p>"
+        else:
+            self.atoms = atoms
+            self.thumbnail.value = svg
+            self.caption.value = (
+                f"<p>&lt;{self.entry.pk}&gt; {html.escape(self.entry.label)} | "
+                f"{atoms.get_chemical_formula()}</p>"
+            )
+            self.view_btn.disabled = False
+        self.ready.set_result(None)
+        return
+
+
+class StructureGalleryWidget(ipw.VBox, tl.HasTraits):
+    """
+    Grid of structure thumbnails for comparing the geometries of many runs.
+
+    Structures are parsed and drawn as SVG thumbnails by a pool of worker
+    processes, each thumbnail appearing as soon as it is ready, so the kernel
+    stays responsive whilst many structures are loaded. The rendered
+    thumbnails are handed back to the kernel's event loop, so the widgets are
+    only updated from the main thread. A full interactive viewer is only
+    created for the structure being viewed. Closing the widget stops the
+    worker processes.
+    """
+
+    table = tl.Instance(pd.DataFrame, allow_none=True)
+
+    def __init__(
+        self,
+        columns: int = 5,
+        thumbnail_size: int = 160,
+        max_workers: int | None = None,
+        **kwargs,
+    ):
+        """
+        StructureGalleryWidget constructor.
+
+        Parameters
+        ----------
+        columns : int
+            The number of thumbnails in each row of the grid.
+        thumbnail_size : int
+            The width and height of the thumbnails in pixels.
+        max_workers : int | None
+            Maximum number of worker processes, defaults to the CPU count.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.thumbnail_size = thumbnail_size
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self.tiles: list[StructureTile] = []
+        self._futures: list[Future] = []
+        self._viewer: StructureViewWidget | None = None
+
+        self.guide = ipw.HTML(
+            """
+            <p>
+            Select calculations from the energy comparison to compare their final
+            structures, then view any of them interactively.
+            </p>
+            """
+        )
+        self.processes = ipw.SelectMultiple(
+            options=[], rows=8, description="Processes: ", layout={"width": "90%"}
+        )
+        self.select_all_btn = ipw.Button(
+            description="Select All", icon="check-square", layout={"width": "20%"}
+        )
+        self.select_all_btn.on_click(self._select_all)
+        self.show_btn = ipw.Button(
+            description="Show", icon="table-cells", layout={"width": "20%"}
+        )
+        self.show_btn.on_click(self._show)
+        self.message = ipw.HTML("")
+        self.grid = ipw.GridBox(
+            layout={
+                "grid_template_columns": f"repeat({columns}, {thumbnail_size + 20}px)"
+            }
+        )
+        self.detail = ipw.VBox()
+        self.children = [
+            self.guide,
+            self.processes,
+            ipw.HBox([self.select_all_btn, self.show_btn]),
+            self.message,
+            self.grid,
+            self.detail,
+        ]
+        return
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """The process pool, started on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    @tl.observe("table")
+    def _update_options(self, change) -> None:
+        """Offer the processes of the comparison table."""
+        table = change["new"]
+        if table is None:
+            self.processes.options = []
+            return
+        self.processes.options = [
+            (f"<{row.pk}> {row.label} | {row.formula}", row.pk)
+            for row in table.itertuples()
+        ]
+        return
+
+    def _select_all(self, _=None) -> None:
+        """Select every listed process."""
+        self.processes.value = tuple(value for _, value in self.processes.options)
+        return
+
+    def _show(self, _=None) -> None:
+        """Show the selected processes."""
+        if not self.processes.value:
+            self.message.value = "<p>ERROR: No processes selected.</p>"
+            return
+        self.load(self.processes.value)
+        return
+
+    def load(self, pks: Iterable[int]) -> list[StructureTile]:
+        """
+        Show the final structures of calculations, rendered in the background.
+
+        Parameters
+        ----------
+        pks : Iterable[int]
+            The PKs of the ChemShell calculations.
+
+        Returns
+        -------
+        list[StructureTile]
+            The tiles of the structures, filled in as they are rendered.
+        """
+        for future in self._futures:
+            future.cancel()
+        for tile in self.tiles:
+            tile.close()
+        entries = gallery_entries(pks)
+        self.tiles = [StructureTile(entry, self.thumbnail_size) for entry in entries]
+        self._futures = []
+        loop = asyncio.get_event_loop()
+        for tile in self.tiles:
+            tile.view_btn.on_click(lambda _, tile=tile: self.view(tile))
+            future = self.pool.submit(render_entry, tile.entry, self.thumbnail_size)
+            future.add_done_callback(
+                lambda f, tile=tile: loop.call_soon_threadsafe(tile.show, f)
+            )
+            self._futures.append(future)
+        self.grid.children = self.tiles
+        self.message.value = f"<p>Showing {len(self.tiles)} structures.</p>"
+        return self.tiles
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Wait for every thumbnail to be shown, returning False on timeout."""
+        if not self.tiles:
+            return True
+        ready = [asyncio.wrap_future(tile.ready) for tile in self.tiles]
+        _, pending = await asyncio.wait(ready, timeout=timeout)
+        return not pending
+
+    def view(self, tile: StructureTile) -> None:
+        """Open the interactive viewer of a structure, replacing the previous one."""
+        if tile.atoms is None:
+            return
+        if self._viewer is not None:
+            if self._viewer.viewer is not None:
+                self._viewer.viewer.close()
+            self._viewer.close()
+        self._viewer = StructureViewWidget()
+        self._viewer.assign_structure_from_ase(tile.atoms)
+        self.detail.children = [
+            ipw.HTML(f"<h4>{tile.caption.value}</h4>"),
+            self._viewer,
+        ]
+        return
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        return
+
+    def close(self) -> None:
+        """Close the widget and stop the worker processes."""
+        self.shutdown()
+        if self._viewer is not None and self._viewer.viewer is not None:
+            self._viewer.viewer.close()
+        super().close()
+        return
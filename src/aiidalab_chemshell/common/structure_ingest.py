@@ -0,0 +1,357 @@
+"""Module for ingesting batches of structures into the AiiDA database."""
+
+import html
+import io
+import zipfile
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import IO
+
+import ipywidgets as ipw
+import traitlets as tl
+from aiida.manage import get_manager
+from aiida.orm import Group, Node, SinglefileData, StructureData
+from ase import Atoms
+from ase import io as ase_io
+
+# File formats read frame by frame into StructureData nodes, any other file is
+# stored as a SinglefileData node for ChemShell to read directly.
+ASE_FORMATS = {
+    ".xyz": "extxyz",
+    ".extxyz": "extxyz",
+    ".traj": "traj",
+    ".pdb": "proteindatabank",
+    ".cif": "cif",
+}
+BINARY_FORMATS = {"traj"}
+# Structure files ChemShell reads itself, stored as SinglefileData nodes
+CHEMSHELL_FORMATS = {".pun"}
+
+# A named source of structure data and a callable opening it as a binary stream
+StructureSource = tuple[str, Callable[[], AbstractContextManager[IO[bytes]]]]
+
+
+def read_atoms(structure: StructureData | SinglefileData) -> Atoms:
+    """
+    Read a single structure node into an ASE Atoms object.
+
+    Parameters
+    ----------
+    structure : StructureData | SinglefileData
+        The structure, or a structure file in one of the ASE_FORMATS.
+
+    Returns
+    -------
+    Atoms
+        The structure's atoms (the first frame of multi-frame files).
+
+    Raises
+    ------
+    ValueError
+        If the file format cannot be read by ASE.
+    """
+    if isinstance(structure, StructureData):
+        return structure.get_ase()
+    fmt = ASE_FORMATS.get(Path(structure.filename).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Cannot read the atoms of '{structure.filename}'.")
+    with structure.open(mode="rb") as handle:
+        stream = handle if fmt in BINARY_FORMATS else io.TextIOWrapper(handle)
+        return ase_io.read(stream, index=0, format=fmt)
+
+
+def iter_sources(
+    source: str | Path | bytes, name: str = ""
+) -> Iterator[StructureSource]:
+    """
+    Iterate over the individual structure files within a source.
+
+    Parameters
+    ----------
+    source : str | Path | bytes
+        A directory, a zip archive or a single (possibly multi-frame) structure
+        file, given either as a path or the raw contents of an uploaded file.
+    name : str
+        The filename of the source when given as raw contents.
+
+    Yields
+    ------
+    StructureSource
+        The filename of each structure file, including its path within a zip
+        archive, and a callable opening it.
+    """
+    if isinstance(source, bytes):
+        if zipfile.is_zipfile(io.BytesIO(source)):
+            yield from _iter_archive(io.BytesIO(source))
+        else:
+            yield name, lambda: io.BytesIO(source)
+        return
+
+    path = Path(source).expanduser()
+    if path.is_dir():
+        for file in sorted(p for p in path.rglob("*") if p.is_file()):
+            yield from iter_sources(file)
+    elif zipfile.is_zipfile(path):
+        yield from _iter_archive(path)
+    else:
+        yield path.name, lambda: path.open("rb")
+    return
+
+
+def _iter_archive(archive: Path | IO[bytes]) -> Iterator[StructureSource]:
+    """Iterate over the files within a zip archive without extracting it."""
+    with zipfile.ZipFile(archive) as zfile:
+        for info in zfile.infolist():
+            if not info.is_dir():
+                yield info.filename, lambda info=info: zfile.open(info)
+    return
+
+
+def is_structure_file(filename: str) -> bool:
+    """
+    Check whether a file is a structure file which can be ingested.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file, optionally including its path within an archive.
+
+    Returns
+    -------
+    bool
+        True for files in one of the ASE_FORMATS or CHEMSHELL_FORMATS, False
+        otherwise (e.g. READMEs, logs, hidden files or macOS archive metadata).
+    """
+    path = Path(filename)
+    if "__MACOSX" in path.parts or path.name.startswith("."):
+        return False
+    suffix = path.suffix.lower()
+    return suffix in ASE_FORMATS or suffix in CHEMSHELL_FORMATS
+
+
+def iter_structure_nodes(
+    source: str | Path | bytes, name: str = "", skipped: list[str] | None = None
+) -> Iterator[Node]:
+    """
+    Stream unstored structure nodes from a source, one frame at a time.
+
+    Parameters
+    ----------
+    source : str | Path | bytes
+        A directory, a zip archive or a single (possibly multi-frame) structure
+        file, given either as a path or the raw contents of an uploaded file.
+    name : str
+        The filename of the source when given as raw contents.
+    skipped : list[str] | None
+        If given, the names of the files which are not structure files are
+        appended to it.
+
+    Yields
+    ------
+    Node
+        A StructureData node for every frame of a file format readable by ASE,
+        with its metadata and fingerprint set as extras, otherwise a
+        SinglefileData node for a file in one of the CHEMSHELL_FORMATS.
+    """
+    # Imported here as the metadata module reads structures with this module
+    from aiidalab_chemshell.common.structure_metadata import atoms_metadata
+
+    for filename, opener in iter_sources(source, name):
+        if not is_structure_file(filename):
+            if skipped is not None:
+                skipped.append(filename)
+            continue
+        fmt = ASE_FORMATS.get(Path(filename).suffix.lower())
+        with opener() as handle:
+            if fmt is None:
+                yield SinglefileData(handle, filename=Path(filename).name)
+                continue
+            stream = handle if fmt in BINARY_FORMATS else io.TextIOWrapper(handle)
+            for i, atoms in enumerate(ase_io.iread(stream, index=":", format=fmt)):
+                node = StructureData(ase=atoms)
+                node.label = f"{Path(filename).stem}-{i}"
+                node.base.extras.set_many(atoms_metadata(atoms))
+                yield node
+    return
+
+
+def ingest_structures(
+    source: str | Path | bytes,
+    group_label: str,
+    name: str = "",
+    chunk_size: int = 100,
+    progress: Callable[[int], None] | None = None,
+    skipped: list[str] | None = None,
+) -> Group:
+    """
+    Store all structures within a source and add them to a group.
+
+    Nodes are created as the source is read and stored in bulk, one database
+    transaction per chunk, so the full set of structures is never held in
+    memory.
+
+    Parameters
+    ----------
+    source : str | Path | bytes
+        A directory, a zip archive or a single (possibly multi-frame) structure
+        file, given either as a path or the raw contents of an uploaded file.
+    group_label : str
+        Label of the group to add the structures to, created if necessary.
+    name : str
+        The filename of the source when given as raw contents.
+    chunk_size : int
+        The number of nodes stored per database transaction.
+    progress : Callable[[int], None] | None
+        Called with the total number of stored nodes after each chunk.
+    skipped : list[str] | None
+        If given, the names of the files which are not structure files are
+        appended to it.
+
+    Returns
+    -------
+    Group
+        The group containing the ingested structures.
+    """
+    group, _ = Group.collection.get_or_create(label=group_label)
+    storage = get_manager().get_profile_storage()
+    count = 0
+    chunk: list[Node] = []
+
+    def _flush() -> None:
+        nonlocal count
+        with storage.transaction():
+            for node in chunk:
+                node.store()
+        group.add_nodes(chunk)
+        count += len(chunk)
+        chunk.clear()
+        if progress is not None:
+            progress(count)
+        return
+
+    for node in iter_structure_nodes(source, name, skipped):
+        chunk.append(node)
+        if len(chunk) >= chunk_size:
+            _flush()
+    if chunk:
+        _flush()
+    return group
+
+
+class StructureIngestWidget(ipw.VBox, tl.HasTraits):
+    """Widget for ingesting a batch of structures into an AiiDA group."""
+
+    group = tl.Instance(Group, allow_none=True)
+
+    def __init__(self, **kwargs):
+        """
+        StructureIngestWidget constructor.
+
+        Parameters
+        ----------
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.info = ipw.HTML(
+            """
+                <p>
+                    Load a batch of structures from a multi-frame XYZ/trajectory
+                    file, a zip archive or a directory. Every structure is added to
+                    the named group which is then processed as a batch.
+                </p>
+            """
+        )
+        self.path = ipw.Text(
+            value="",
+            placeholder="Path to a file, zip archive or directory",
+            description="Path: ",
+            layout={"width": "70%"},
+        )
+        self.file_upload = ipw.FileUpload(
+            accept=",".join([*ASE_FORMATS, *CHEMSHELL_FORMATS, ".zip"]),
+            multiple=True,
+            description="Upload",
+            layout={"width": "20%"},
+        )
+        self.group_label = ipw.Text(
+            value="", description="Group: ", layout={"width": "70%"}
+        )
+        self.ingest_btn = ipw.Button(
+            description="Load Structures",
+            button_style="info",
+            tooltip="Store the structures and add them to the group",
+            icon="upload",
+            layout={"width": "20%"},
+        )
+        self.ingest_btn.on_click(self._ingest)
+        self.message = ipw.HTML("")
+        self.children = [
+            self.info,
+            ipw.HBox([self.path, self.file_upload]),
+            ipw.HBox([self.group_label, self.ingest_btn]),
+            self.message,
+        ]
+        return
+
+    def _uploads(self) -> list[tuple[str, bytes]]:
+        """Return the name and contents of each uploaded file."""
+        value = self.file_upload.value
+        if isinstance(value, dict):
+            # ipywidgets 7 stores uploads by name with nested metadata
+            return [(name, bytes(item["content"])) for name, item in value.items()]
+        return [(item["name"], bytes(item["content"])) for item in value]
+
+    def _ingest(self, _=None) -> None:
+        """Ingest the selected structures into the group."""
+        if not self.group_label.value:
+            self.message.value = "<p>ERROR: No group label provided.</p>"
+            return
+        sources = [(content, name) for name, content in self._uploads()]
+        if self.path.value:
+            sources.append((self.path.value, ""))
+        if not sources:
+            self.message.value = "<p>ERROR: No structures provided.</p>"
+            return
+
+        stored = current = 0
+        skipped: list[str] = []
+
+        def _progress(count: int) -> None:
+            nonlocal current
+            current = count
+            self.message.value = f"<p>Stored {stored + count} structures...</p>"
+
+        self.ingest_btn.disabled = True
+        try:
+            for source, name in sources:
+                current = 0
+                group = ingest_structures(
+                    source,
+                    self.group_label.value,
+                    name=name,
+                    progress=_progress,
+                    skipped=skipped,
+                )
+                stored += current
+        except (OSError, ValueError) as e:
+            self.message.value = f"<p>ERROR: Could not load structures, {e}</p>"
+            return
+        finally:
+            self.ingest_btn.disabled = False
+        message = f"<p>Group '{group.label}' contains {group.count()} structures.</p>"
+        if skipped:
+            message += (
+                f"<p>Skipped {len(skipped)} unsupported files: "
+                f"{', '.join(html.escape(f) for f in skipped)}</p>"
+            )
+        self.message.value = message
+        self.group = group
+        return
+
+    def disable(self, val: bool) -> None:
+        """Disable the ingestion inputs."""
+        self.file_upload.disabled = val
+        self.ingest_btn.disabled = val
+        return
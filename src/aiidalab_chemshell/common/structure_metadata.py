@@ -0,0 +1,173 @@
+"""Module for caching searchable structure metadata as node extras."""
+
+import io
+import multiprocessing
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from aiida.manage import get_manager
+from aiida.orm import QueryBuilder, SinglefileData, StructureData
+from ase import Atoms
+from ase import io as ase_io
+
+from aiidalab_chemshell.common.fingerprint import FINGERPRINT_EXTRA, atoms_fingerprint
+from aiidalab_chemshell.common.structure_ingest import (
+    ASE_FORMATS,
+    BINARY_FORMATS,
+    read_atoms,
+)
+
+# Extras describing the contents of a structure node, the formula is shown by the
+# database search and the others allow cheap filtering
+FORMULA_EXTRA = "formula"
+ELEMENTS_EXTRA = "elements"
+NATOMS_EXTRA = "natoms"
+PERIODICITY_EXTRA = "periodicity"
+
+
+def atoms_metadata(atoms: Atoms) -> dict:
+    """
+    Create the metadata extras of a structure.
+
+    Parameters
+    ----------
+    atoms : Atoms
+        The structure's atoms.
+
+    Returns
+    -------
+    dict
+        The formula, sorted unique elements, number of atoms, number of
+        periodic directions and the fingerprint of the structure.
+    """
+    return {
+        FORMULA_EXTRA: atoms.get_chemical_formula(),
+        ELEMENTS_EXTRA: sorted(set(atoms.get_chemical_symbols())),
+        NATOMS_EXTRA: len(atoms),
+        PERIODICITY_EXTRA: int(sum(bool(p) for p in atoms.pbc)),
+        FINGERPRINT_EXTRA: atoms_fingerprint(atoms),
+    }
+
+
+def _file_metadata(filename: str, content: bytes) -> dict | None:
+    """Parse the contents of a structure file, run in a worker process."""
+    fmt = ASE_FORMATS.get(Path(filename).suffix.lower())
+    if fmt is None:
+        return None
+    stream = io.BytesIO(content)
+    if fmt not in BINARY_FORMATS:
+        stream = io.TextIOWrapper(stream)
+    try:
+        return atoms_metadata(ase_io.read(stream, index=0, format=fmt))
+    except Exception:
+        # Malformed files are left without metadata rather than failing the batch
+        return None
+
+
+def set_structure_metadata(node: StructureData | SinglefileData) -> dict:
+    """
+    Set the metadata extras of a structure node if they are not already set.
+
+    Parameters
+    ----------
+    node : StructureData | SinglefileData
+        The (stored or unstored) structure node.
+
+    Returns
+    -------
+    dict
+        The node's metadata extras, empty if the structure cannot be read.
+    """
+    extras = node.base.extras.all
+    if FORMULA_EXTRA in extras and FINGERPRINT_EXTRA in extras:
+        return extras
+    try:
+        metadata = atoms_metadata(read_atoms(node))
+    except ValueError:
+        return {}
+    node.base.extras.set_many(metadata)
+    return metadata
+
+
+def _batched(iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+    return
+
+
+def backfill_structure_metadata(
+    batch_size: int = 500,
+    max_workers: int | None = None,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Set the metadata extras of every stored structure node missing them.
+
+    The nodes are streamed from the database in batches. StructureData nodes
+    are converted in the calling process, while the contents of structure
+    files are parsed by a pool of worker processes. Workers only receive the
+    file name and contents, all database access stays in the calling thread,
+    and each batch of extras is written in a single transaction.
+
+    Parameters
+    ----------
+    batch_size : int
+        The number of nodes loaded, parsed and updated at once.
+    max_workers : int | None
+        Maximum number of worker processes, defaults to the CPU count.
+    progress : Callable[[int], None] | None
+        Called with the total number of processed nodes after each batch.
+
+    Returns
+    -------
+    int
+        The number of nodes whose metadata was set.
+    """
+    # Only the ids are held in memory, as updating extras while iterating over
+    # the same query is not supported by every storage backend
+    qb = QueryBuilder().append(
+        (StructureData, SinglefileData),
+        filters={"extras": {"!has_key": FORMULA_EXTRA}},
+        project="id",
+    )
+    ids = qb.all(flat=True)
+    storage = get_manager().get_profile_storage()
+    processed = updated = 0
+    # The workers are spawned as forking with open storage connections is unsafe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        for batch in _batched(ids, batch_size):
+            nodes = (
+                QueryBuilder()
+                .append(
+                    (StructureData, SinglefileData),
+                    filters={"id": {"in": batch}},
+                    project="*",
+                )
+                .all(flat=True)
+            )
+            files = [node for node in nodes if isinstance(node, SinglefileData)]
+            results = pool.map(
+                _file_metadata,
+                [node.filename for node in files],
+                [node.get_content(mode="rb") for node in files],
+            )
+            metadata = dict(zip((node.pk for node in files), results, strict=True))
+            with storage.transaction():
+                for node in nodes:
+                    if isinstance(node, StructureData):
+                        extras = atoms_metadata(node.get_ase())
+                    else:
+                        # Unreadable files get an empty formula so they are not
+                        # parsed again by the next backfill
+                        extras = metadata[node.pk] or {FORMULA_EXTRA: ""}
+                    node.base.extras.set_many(extras)
+                    updated += len(extras) > 1
+            processed += len(nodes)
+            if progress is not None:
+                progress(processed)
+    return updated
@@ -0,0 +1,412 @@
+"""Module for streaming geometry optimisation trajectories from running jobs."""
+
+import asyncio
+import io
+import posixpath
+import re
+from collections.abc import Callable
+
+import ipywidgets as ipw
+import numpy as np
+from aiida.common.escaping import escape_for_bash
+from aiida.common.exceptions import NotExistent
+from aiida.orm import CalcJobNode, ProcessNode, RemoteData
+from aiida.transports import Transport
+from matplotlib.figure import Figure
+
+from aiidalab_chemshell.common.transport_pool import get_transport_pool
+
+# DL-FIND trajectory files written to the remote working directory
+PATH_FILE = "_dl_find/path.xyz"
+FORCE_FILE = "_dl_find/path_force.xyz"
+
+_FLOAT = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eEdD][-+]?\d+)?")
+
+
+class RemoteFileTail:
+    """
+    Incrementally read a file within a remote working directory.
+
+    The byte offset already read is tracked so that each read only transfers
+    the data appended to the file since the previous read.
+    """
+
+    def __init__(self, remote: RemoteData, relpath: str):
+        """
+        RemoteFileTail constructor.
+
+        Parameters
+        ----------
+        remote : RemoteData
+            The remote working directory.
+        relpath : str
+            Path of the file relative to the working directory.
+        """
+        self.path = posixpath.join(remote.get_remote_path(), relpath)
+        self.offset = 0
+        return
+
+    def read(self, transport: Transport) -> bytes:
+        """
+        Read any data appended to the file since the last read.
+
+        Parameters
+        ----------
+        transport : Transport
+            An open transport to the computer holding the file.
+
+        Returns
+        -------
+        bytes
+            The new data, empty if the file does not (yet) exist.
+        """
+        command = f"tail -c +{self.offset + 1} {escape_for_bash(self.path)}"
+        retval, stdout, _ = transport.exec_command_wait_bytes(command)
+        if retval != 0:
+            return b""
+        self.offset += len(stdout)
+        return stdout
+
+
+class XYZFrameParser:
+    """Incremental parser for (possibly partially written) multi-frame XYZ data."""
+
+    def __init__(self):
+        """XYZFrameParser constructor."""
+        self._buffer = b""
+        self._lines: list[str] = []
+        # Frames completed before a malformed frame, returned by the next feed
+        self._frames: list[tuple[list[str], np.ndarray, str]] = []
+        return
+
+    def feed(self, data: bytes) -> list[tuple[list[str], np.ndarray, str]]:
+        """
+        Parse all frames completed by the given data.
+
+        Parameters
+        ----------
+        data : bytes
+            New data appended to the XYZ file.
+
+        Returns
+        -------
+        list[tuple[list[str], np.ndarray, str]]
+            The symbols, ``(natoms, 3)`` coordinates and comment line of each
+            completed frame, incomplete frames are kept until more data arrives.
+
+        Raises
+        ------
+        ValueError
+            If a frame is malformed. The malformed lines are discarded, up to
+            the next atom count, so parsing resumes with the next feed, which
+            also returns any frames completed before the malformed one.
+        """
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        self._lines.extend(line.decode(errors="replace").strip() for line in lines)
+        frames, self._frames = self._frames, []
+        while self._lines:
+            if not self._lines[0]:
+                self._lines.pop(0)
+                continue
+            try:
+                frame = self._parse_frame()
+            except ValueError as e:
+                self._frames = frames
+                self._discard_frame()
+                raise ValueError(f"Malformed XYZ frame, {e}") from e
+            if frame is None:
+                break
+            frames.append(frame)
+        return frames
+
+    def _parse_frame(self) -> tuple[list[str], np.ndarray, str] | None:
+        """Parse the first buffered frame, None if it is not complete yet."""
+        natoms = int(self._lines[0])
+        if len(self._lines) < natoms + 2:
+            return None
+        comment = self._lines[1]
+        atoms = [line.split() for line in self._lines[2 : natoms + 2]]
+        if any(len(atom) < 4 for atom in atoms):
+            raise ValueError(f"expected {natoms} atoms with 3 coordinates")
+        symbols = [atom[0] for atom in atoms]
+        positions = np.array([atom[1:4] for atom in atoms], dtype=float)
+        del self._lines[: natoms + 2]
+        return symbols, positions, comment
+
+    def _discard_frame(self) -> None:
+        """Discard buffered lines up to the atom count of the next frame."""
+        self._lines.pop(0)
+        while self._lines and not self._lines[0].isdigit():
+            self._lines.pop(0)
+        return
+
+
+class TrajectoryStore:
+    """
+    Compact array-backed store of optimisation frames.
+
+    Positions, energies and gradient norms are held in preallocated NumPy
+    arrays which grow geometrically, so appending frames never copies the
+    whole trajectory per frame.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        TrajectoryStore constructor.
+
+        Parameters
+        ----------
+        capacity : int
+            Initial number of frames allocated.
+        """
+        self.symbols: list[str] = []
+        self.nframes = 0
+        self.ngradients = 0
+        self._capacity = capacity
+        self._positions = np.empty((0, 0, 3))
+        self._energies = np.full(capacity, np.nan)
+        self._gradient_norms = np.full(capacity, np.nan)
+        return
+
+    @property
+    def positions(self) -> np.ndarray:
+        """The ``(nframes, natoms, 3)`` positions of all frames."""
+        return self._positions[: self.nframes]
+
+    @property
+    def energies(self) -> np.ndarray:
+        """The energy of each frame (NaN where not reported)."""
+        return self._energies[: self.nframes]
+
+    @property
+    def gradient_norms(self) -> np.ndarray:
+        """The norm of the energy gradient of each frame (NaN if not yet read)."""
+        return self._gradient_norms[: self.nframes]
+
+    def _reserve(self, nframes: int) -> None:
+        """Grow the arrays to hold at least the given number of frames."""
+        if nframes <= self._capacity:
+            return
+        capacity = max(nframes, 2 * self._capacity)
+        positions = np.empty((capacity, *self._positions.shape[1:]))
+        positions[: self.nframes] = self.positions
+        self._positions = positions
+        for name in ("_energies", "_gradient_norms"):
+            values = np.full(capacity, np.nan)
+            values[: self._capacity] = getattr(self, name)
+            setattr(self, name, values)
+        self._capacity = capacity
+        return
+
+    def append_frame(
+        self, symbols: list[str], positions: np.ndarray, energy: float = np.nan
+    ) -> None:
+        """Append a frame to the trajectory."""
+        if self.nframes == 0:
+            self.symbols = symbols
+            self._positions = np.empty((self._capacity, len(symbols), 3))
+        self._reserve(self.nframes + 1)
+        self._positions[self.nframes] = positions
+        self._energies[self.nframes] = energy
+        self.nframes += 1
+        return
+
+    def append_gradients(self, gradients: np.ndarray) -> None:
+        """Set the gradients of the next frame without gradients."""
+        self._reserve(self.ngradients + 1)
+        self._gradient_norms[self.ngradients] = np.linalg.norm(gradients)
+        self.ngradients += 1
+        return
+
+
+class OptimisationTrajectory:
+    """
+    Stream the DL-FIND optimisation trajectory of a running ChemShell job.
+
+    The trajectory and gradient files are tail-read from the remote working
+    directory. As with the scheduler queries, all database access happens in
+    :py:meth:`prepare_read` so the returned read can be run in a worker thread.
+    """
+
+    def __init__(self, process: ProcessNode):
+        """
+        OptimisationTrajectory constructor.
+
+        Parameters
+        ----------
+        process : ProcessNode
+            The ChemShell calculation, or a workflow calling it.
+        """
+        self.process = process
+        self.store = TrajectoryStore()
+        self._calcjob: CalcJobNode | None = None
+        self._tails: list[RemoteFileTail] = []
+        self._parsers = (XYZFrameParser(), XYZFrameParser())
+        return
+
+    def _resolve_calcjob(self) -> CalcJobNode | None:
+        """Return the most recently created ChemShell calculation of the process."""
+        if isinstance(self.process, CalcJobNode):
+            return self.process
+        calcjobs = [
+            node
+            for node in self.process.called_descendants
+            if isinstance(node, CalcJobNode)
+        ]
+        return max(calcjobs, key=lambda node: node.ctime, default=None)
+
+    def prepare_read(self) -> Callable[[], tuple[bytes, bytes]] | None:
+        """
+        Prepare reading the new trajectory and gradient data.
+
+        Returns
+        -------
+        Callable[[], tuple[bytes, bytes]] | None
+            Callable returning the new data of both files, which does not access
+            the AiiDA database, or None if no working directory exists yet.
+        """
+        calcjob = self._resolve_calcjob()
+        if calcjob is None:
+            return None
+        if calcjob.pk != getattr(self._calcjob, "pk", None):
+            try:
+                remote = calcjob.outputs.remote_folder
+            except NotExistent:
+                return None
+            self._calcjob = calcjob
+            self._tails = [RemoteFileTail(remote, f) for f in (PATH_FILE, FORCE_FILE)]
+            self._parsers = (XYZFrameParser(), XYZFrameParser())
+            self.store = TrajectoryStore()
+        transports = get_transport_pool().get(calcjob.computer)
+        path_tail, force_tail = self._tails
+
+        def _read() -> tuple[bytes, bytes]:
+            with transports.connect() as transport:
+                return path_tail.read(transport), force_tail.read(transport)
+
+        return _read
+
+    def ingest(self, path_data: bytes, force_data: bytes) -> int:
+        """
+        Append the frames within newly read data to the store.
+
+        Parameters
+        ----------
+        path_data : bytes
+            New data of the trajectory file.
+        force_data : bytes
+            New data of the gradient file.
+
+        Returns
+        -------
+        int
+            The number of new frames.
+
+        Raises
+        ------
+        ValueError
+            If either file contains a malformed frame, after storing the valid
+            frames of both files.
+        """
+        path_parser, force_parser = self._parsers
+        error = None
+        try:
+            frames = path_parser.feed(path_data)
+        except ValueError as e:
+            frames, error = [], e
+        for symbols, positions, comment in frames:
+            # The energy is the last number reported in the comment line
+            values = _FLOAT.findall(comment)
+            energy = float(values[-1].replace("D", "E")) if values else np.nan
+            self.store.append_frame(symbols, positions, energy)
+        try:
+            for _, gradients, _ in force_parser.feed(force_data):
+                self.store.append_gradients(gradients)
+        except ValueError as e:
+            error = error or e
+        if error is not None:
+            raise error
+        return len(frames)
+
+    def update(self) -> int:
+        """Read and store any new frames, returning the number of new frames."""
+        read = self.prepare_read()
+        if read is None:
+            return 0
+        return self.ingest(*read())
+
+
+class TrajectoryMonitorWidget(ipw.VBox):
+    """Widget plotting the convergence of a running geometry optimisation."""
+
+    def __init__(self, process: ProcessNode, interval: float = 10.0, **kwargs):
+        """
+        TrajectoryMonitorWidget constructor.
+
+        Parameters
+        ----------
+        process : ProcessNode
+            The ChemShell calculation, or a workflow calling it.
+        interval : float
+            Time (seconds) between polls of the remote files whilst running.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.trajectory = OptimisationTrajectory(process)
+        self.interval = interval
+        self.message = ipw.HTML("<p>Waiting for the optimisation to start...</p>")
+        self.plot = ipw.Image(format="png", layout={"width": "90%"})
+        self.children = [self.message]
+        self._task: asyncio.Task | None = None
+        return
+
+    def start(self) -> None:
+        """Poll the remote files on the kernel's event loop until the job ends."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._poll())
+        return
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            read = self.trajectory.prepare_read()
+            if read is not None:
+                try:
+                    data = await loop.run_in_executor(None, read)
+                    if self.trajectory.ingest(*data):
+                        self.render()
+                except (OSError, ValueError) as e:
+                    # Keep polling, later data may still be readable
+                    self.message.value = f"<p>Could not read trajectory: {e}</p>"
+            if self.trajectory.process.is_terminated:
+                return
+            await asyncio.sleep(self.interval)
+
+    def update(self) -> None:
+        """Read any new frames and redraw the plot."""
+        try:
+            if self.trajectory.update():
+                self.render()
+        except (OSError, ValueError) as e:
+            self.message.value = f"<p>Could not read trajectory: {e}</p>"
+        return
+
+    def render(self) -> None:
+        """Plot the energy and gradient norm against the optimisation step."""
+        store = self.trajectory.store
+        steps = np.arange(store.nframes)
+        figure = Figure(figsize=(8, 3), layout="tight")
+        energy_axis, gradient_axis = figure.subplots(1, 2)
+        energy_axis.plot(steps, store.energies, marker="o")
+        energy_axis.set_xlabel("Step")
+        energy_axis.set_ylabel("Energy / Hartree")
+        gradient_axis.semilogy(steps, store.gradient_norms, marker="o")
+        gradient_axis.set_xlabel("Step")
+        gradient_axis.set_ylabel("Gradient Norm / a.u.")
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png")
+        self.plot.value = buffer.getvalue()
+        self.message.value = f"<p>Optimisation step {store.nframes}</p>"
+        self.children = [self.message, self.plot]
+        return
@@ -0,0 +1,252 @@
+"""Module for pooling the transports used to reach remote computers."""
+
+import atexit
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+
+from aiida.orm import Computer, User
+from aiida.plugins import TransportFactory
+from aiida.transports import Transport
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Connection:
+    """An open transport and the time it was last returned to the pool."""
+
+    transport: Transport
+    last_used: float
+
+
+class ComputerTransports:
+    """
+    The pooled transports of a single computer.
+
+    Transports are opened on demand, up to the concurrency limit, and returned
+    to the pool after use rather than closed. A transport is only ever used by
+    one thread at a time. No database access happens here, so
+    :py:meth:`connect` can be called from worker threads.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Transport],
+        max_connections: int,
+        keepalive_interval: float,
+        clock: Callable[[], float],
+    ):
+        """
+        ComputerTransports constructor.
+
+        Parameters
+        ----------
+        factory : Callable[[], Transport]
+            Callable creating a new (closed) transport to the computer.
+        max_connections : int
+            Maximum number of transports open to the computer at once.
+        keepalive_interval : float
+            Idle time (seconds) after which a transport is checked to still be
+            connected before it is reused.
+        clock : Callable[[], float]
+            Monotonic clock returning the current time in seconds.
+        """
+        self._factory = factory
+        self._slots = BoundedSemaphore(max_connections)
+        self._lock = Lock()
+        self._idle: list[_Connection] = []
+        self.keepalive_interval = keepalive_interval
+        self._clock = clock
+        self.opened = 0
+        return
+
+    @property
+    def idle(self) -> int:
+        """The number of open transports waiting in the pool."""
+        return len(self._idle)
+
+    def _open(self) -> _Connection:
+        transport = self._factory()
+        # Entering the transport once keeps it open through any nested ``with``
+        # blocks of the code using it
+        transport.__enter__()
+        self.opened += 1
+        return _Connection(transport, self._clock())
+
+    @staticmethod
+    def _close(connection: _Connection) -> None:
+        try:
+            connection.transport.__exit__(None, None, None)
+        except Exception as e:
+            LOGGER.debug("Could not close a pooled transport: %s", e)
+        return
+
+    def _is_alive(self, connection: _Connection) -> bool:
+        """Check a long idle transport is still connected."""
+        if self._clock() - connection.last_used < self.keepalive_interval:
+            return True
+        try:
+            retval, _, _ = connection.transport.exec_command_wait("true")
+        except Exception:
+            return False
+        return retval == 0
+
+    def _checkout(self) -> _Connection:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                connection = self._idle.pop()
+            if self._is_alive(connection):
+                return connection
+            self._close(connection)
+        return self._open()
+
+    @contextmanager
+    def connect(self) -> Iterator[Transport]:
+        """
+        Borrow an open transport, waiting if the concurrency limit is reached.
+
+        Yields
+        ------
+        Transport
+            An open transport, which must not be closed by the caller. If the
+            block raises the transport is discarded, as it may be broken.
+        """
+        with self._slots:
+            connection = self._checkout()
+            try:
+                yield connection.transport
+            except BaseException:
+                self._close(connection)
+                raise
+            connection.last_used = self._clock()
+            with self._lock:
+                self._idle.append(connection)
+        return
+
+    def close_idle(self, idle_timeout: float = 0.0) -> int:
+        """
+        Close the transports which have been idle for at least the given time.
+
+        Parameters
+        ----------
+        idle_timeout : float
+            Idle time (seconds) after which a transport is closed.
+
+        Returns
+        -------
+        int
+            The number of closed transports.
+        """
+        now = self._clock()
+        with self._lock:
+            expired = [c for c in self._idle if now - c.last_used >= idle_timeout]
+            self._idle = [c for c in self._idle if c not in expired]
+        for connection in expired:
+            self._close(connection)
+        return len(expired)
+
+
+def _transport_factory(computer: Computer) -> Callable[[], Transport]:
+    """Prepare the creation of transports to a computer without database access."""
+    authinfo = computer.get_authinfo(User.collection.get_default())
+    transport_class = TransportFactory(computer.transport_type)
+    parameters = {"machine": computer.hostname, **authinfo.get_auth_params()}
+    return lambda: transport_class(**parameters)
+
+
+class TransportPool:
+    """
+    Per-kernel pool of open transports keyed by computer.
+
+    Every remote operation of the app borrows its transport from here, so
+    interactive operations reuse open (e.g. SSH) connections rather than
+    repeating the connection handshake. Transports idle for longer than the
+    idle timeout are closed whenever a computer is next requested.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 2,
+        idle_timeout: float = 300.0,
+        keepalive_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        TransportPool constructor.
+
+        Parameters
+        ----------
+        max_connections : int
+            Maximum number of transports open to each computer at once.
+        idle_timeout : float
+            Idle time (seconds) after which an open transport is closed.
+        keepalive_interval : float
+            Idle time (seconds) after which a transport is checked to still be
+            connected before it is reused.
+        clock : Callable[[], float]
+            Monotonic clock returning the current time in seconds.
+        """
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self._clock = clock
+        self._computers: dict[str, ComputerTransports] = {}
+        self._lock = Lock()
+        return
+
+    def get(self, computer: Computer) -> ComputerTransports:
+        """
+        Return the pooled transports of a computer.
+
+        This accesses the database so must be called from the main thread,
+        whereas the returned transports can be borrowed from any thread.
+
+        Parameters
+        ----------
+        computer : Computer
+            The computer to connect to.
+
+        Returns
+        -------
+        ComputerTransports
+            The computer's pooled transports.
+        """
+        self.close_idle(self.idle_timeout)
+        with self._lock:
+            transports = self._computers.get(computer.uuid)
+        if transports is None:
+            transports = ComputerTransports(
+                _transport_factory(computer),
+                self.max_connections,
+                self.keepalive_interval,
+                self._clock,
+            )
+            with self._lock:
+                transports = self._computers.setdefault(computer.uuid, transports)
+        return transports
+
+    def close_idle(self, idle_timeout: float = 0.0) -> int:
+        """Close the transports of every computer idle for the given time."""
+        with self._lock:
+            computers = list(self._computers.values())
+        return sum(transports.close_idle(idle_timeout) for transports in computers)
+
+    def close(self) -> None:
+        """Close all idle transports."""
+        self.close_idle()
+        return
+
+
+_POOL = TransportPool()
+atexit.register(_POOL.close)
+
+
+def get_transport_pool() -> TransportPool:
+    """Return the transport pool shared by all app instances in the kernel."""
+    return _POOL
@@ -0,0 +1,298 @@
+"""Module for validating inputs and estimating their cost before submission."""
+
+import html
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from ase import Atoms
+
+from aiidalab_chemshell.utils import get_py_app_dir
+
+BASIS_SIZE_TABLE = get_py_app_dir() / "data" / "basis_sizes.json"
+
+# Basis set assumed for the estimate when the requested one is not tabulated
+DEFAULT_BASIS = "cc-pvdz"
+
+# Functionals including exact exchange, which scale like Hartree-Fock
+HYBRID_FUNCTIONALS = {
+    "b1lyp",
+    "b3lyp",
+    "b3pw91",
+    "b97",
+    "b97-1",
+    "b97-2",
+    "bhlyp",
+    "cam-b3lyp",
+    "hse06",
+    "m05",
+    "m05-2x",
+    "m06",
+    "m06-2x",
+    "o3lyp",
+    "pbe0",
+    "tpssh",
+    "wb97x",
+    "wb97x-d",
+    "x3lyp",
+}
+
+# Memory model: a fixed overhead per MPI process for the executables plus a number
+# of dense (nbasis x nbasis) double precision matrices (Fock, density, overlap, MO
+# coefficients and work arrays) held by each process
+PROCESS_OVERHEAD_MB = 256.0
+MATRIX_COPIES = 12
+
+# Runtime is reported relative to a single core calculation of this size
+REFERENCE_NBASIS = 100
+
+# Last atomic number of each row of the periodic table
+_ROW_ENDS = (2, 10, 18, 36, 54)
+
+
+@lru_cache(maxsize=1)
+def load_basis_sizes() -> dict:
+    """Return the bundled table of basis functions per atom."""
+    with open(BASIS_SIZE_TABLE) as f:
+        return json.load(f)
+
+
+def _row(number: int) -> int:
+    """Return the (zero based) table row of an atomic number."""
+    return next(
+        (i for i, end in enumerate(_ROW_ENDS) if number <= end), len(_ROW_ENDS) - 1
+    )
+
+
+def count_basis_functions(atoms: Atoms, basis: str) -> tuple[int, bool]:
+    """
+    Estimate the number of basis functions of a set of atoms.
+
+    Parameters
+    ----------
+    atoms : Atoms
+        The atoms described by the basis set.
+    basis : str
+        The basis set name (case insensitive).
+
+    Returns
+    -------
+    tuple[int, bool]
+        The number of basis functions, and whether the basis set is tabulated
+        (otherwise the default basis set sizes are used).
+    """
+    table = load_basis_sizes()
+    name = basis.strip().lower()
+    name = table["aliases"].get(name, name)
+    sizes = table["basis_sets"].get(name)
+    known = sizes is not None
+    if not known:
+        sizes = table["basis_sets"][DEFAULT_BASIS]
+    nbasis = sum(sizes[_row(number)] for number in atoms.numbers)
+    return int(nbasis), known
+
+
+def parse_qm_region(text: str) -> tuple[list[int], list[str]]:
+    """
+    Parse a QM region specification of atom indices and index ranges.
+
+    Parameters
+    ----------
+    text : str
+        Whitespace and/or comma separated indices (e.g. ``4``) and inclusive
+        ranges (e.g. ``0-3``).
+
+    Returns
+    -------
+    tuple[list[int], list[str]]
+        The atom indices, and any entries which could not be parsed.
+    """
+    indices: list[int] = []
+    invalid: list[str] = []
+    for entry in re.split(r"[\s,]+", text.strip()):
+        if not entry:
+            continue
+        start, separator, end = entry.partition("-")
+        try:
+            if separator:
+                indices.extend(range(int(start), int(end) + 1))
+            else:
+                indices.append(int(entry))
+        except ValueError:
+            invalid.append(entry)
+    return indices, invalid
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """Rough estimate of the resources needed by a QM (or QM/MM) calculation."""
+
+    natoms: int
+    nqm_atoms: int
+    nbasis: int
+    memory_mb: float
+    scaling: int
+    relative_runtime: float
+
+
+def estimate_cost(
+    natoms: int,
+    nqm_atoms: int,
+    nbasis: int,
+    exact_exchange: bool = True,
+    ncpus: int = 1,
+) -> CostEstimate:
+    """
+    Estimate the memory and runtime of a calculation from its basis size.
+
+    Parameters
+    ----------
+    natoms : int
+        The total number of atoms.
+    nqm_atoms : int
+        The number of atoms treated with QM.
+    nbasis : int
+        The number of basis functions.
+    exact_exchange : bool
+        Whether the method includes exact exchange (Hartree-Fock or hybrid
+        DFT), which scales as the fourth power of the basis size rather than
+        the third.
+    ncpus : int
+        The number of MPI processes.
+
+    Returns
+    -------
+    CostEstimate
+        The total memory (MB) of all processes, and the runtime relative to a
+        single core calculation with ``REFERENCE_NBASIS`` basis functions.
+    """
+    matrices_mb = MATRIX_COPIES * nbasis**2 * 8 / 1024**2
+    scaling = 4 if exact_exchange else 3
+    return CostEstimate(
+        natoms=natoms,
+        nqm_atoms=nqm_atoms,
+        nbasis=nbasis,
+        memory_mb=ncpus * (PROCESS_OVERHEAD_MB + matrices_mb),
+        scaling=scaling,
+        relative_runtime=(nbasis / REFERENCE_NBASIS) ** scaling / max(ncpus, 1),
+    )
+
+
+@dataclass
+class ValidationReport:
+    """
+    The outcome of validating a set of inputs.
+
+    Errors prevent submission, warnings should be confirmed before submitting
+    and notes are purely informative.
+    """
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+    estimate: CostEstimate | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the inputs have no errors."""
+        return not self.errors
+
+    def to_html(self) -> str:
+        """Render the report for display."""
+        styles = (("red", self.errors), ("orange", self.warnings), ("", self.notes))
+        lines = [
+            f"<li style='color: {colour}'>{html.escape(message)}</li>"
+            if colour
+            else f"<li>{html.escape(message)}</li>"
+            for colour, messages in styles
+            for message in messages
+        ]
+        if self.estimate is not None:
+            e = self.estimate
+            lines.append(
+                f"<li>{e.nqm_atoms} of {e.natoms} atoms treated with QM, "
+                f"{e.nbasis} basis functions, approximately "
+                f"{e.memory_mb / 1024:.1f} GB of memory and "
+                f"{e.relative_runtime:.3g}x the runtime of a single core "
+                f"{REFERENCE_NBASIS} basis function calculation "
+                f"(O(N<sup>{e.scaling}</sup>) scaling).</li>"
+            )
+        return f"<ul>{''.join(lines)}</ul>" if lines else ""
+
+
+def validate_inputs(
+    atoms: Atoms | None,
+    basis: str,
+    qm_region: str | None = None,
+    exact_exchange: bool = True,
+    ncpus: int = 1,
+    memory_kb: int | None = None,
+) -> ValidationReport:
+    """
+    Validate the inputs of a calculation and estimate its cost.
+
+    Parameters
+    ----------
+    atoms : Atoms | None
+        The input structure, None if it cannot be read (the QM region and cost
+        are then not checked).
+    basis : str
+        The QM basis set.
+    qm_region : str | None
+        The QM region specification of a QM/MM calculation, None for a purely
+        QM calculation. Indices are zero based.
+    exact_exchange : bool
+        Whether the method includes exact exchange.
+    ncpus : int
+        The number of MPI processes.
+    memory_kb : int | None
+        The memory (kB) of the compute node, if known.
+
+    Returns
+    -------
+    ValidationReport
+        The errors, warnings and cost estimate of the inputs.
+    """
+    report = ValidationReport()
+    indices = None
+    if qm_region is not None:
+        indices, invalid = parse_qm_region(qm_region)
+        if invalid:
+            report.errors.append(f"Invalid QM region entries: {', '.join(invalid)}.")
+        if not indices:
+            report.errors.append("No QM region specified.")
+    if atoms is None:
+        report.notes.append("No cost estimate, the structure could not be read.")
+        return report
+
+    qm_atoms = atoms
+    if indices:
+        outside = sorted({i for i in indices if not 0 <= i < len(atoms)})
+        if outside:
+            shown = ", ".join(str(i) for i in outside[:10])
+            report.errors.append(
+                f"QM region indices out of range for a structure of {len(atoms)} "
+                f"atoms (indices start at 0): {shown}"
+                + (", ..." if len(outside) > 10 else "")
+            )
+            return report
+        qm_atoms = atoms[sorted(set(indices))]
+    if not report.is_valid:
+        return report
+
+    nbasis, known = count_basis_functions(qm_atoms, basis)
+    if not known:
+        report.notes.append(
+            f"Basis set '{basis}' is not tabulated, the estimate assumes "
+            f"{DEFAULT_BASIS}."
+        )
+    report.estimate = estimate = estimate_cost(
+        len(atoms), len(qm_atoms), nbasis, exact_exchange, ncpus
+    )
+    if memory_kb and estimate.memory_mb * 1024 > memory_kb:
+        report.warnings.append(
+            f"The estimated memory ({estimate.memory_mb / 1024:.1f} GB) exceeds "
+            f"the memory of the compute node ({memory_kb / 1024**2:.1f} GB)."
+        )
+    return report
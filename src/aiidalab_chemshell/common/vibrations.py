@@ -0,0 +1,187 @@
+"""Module for analysing the vibrational modes computed by ChemShell."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from aiida.orm import ArrayData, load_node
+from ase import units
+
+# Conversion of a wavenumber (cm^-1) to a vibrational temperature (K)
+WAVENUMBER_TO_KELVIN = 100 * units._hplanck * units._c / units._k
+# Boltzmann constant in Hartree per Kelvin
+KB_HARTREE = units.kB / units.Hartree
+
+# Columns of the ChemShell "Modes" array
+MODE_COLUMNS = ("frequency", "vib_temperature", "zpe", "energy", "entropy_term")
+
+
+@dataclass(frozen=True)
+class Thermochemistry:
+    """Harmonic vibrational thermochemistry (Hartree) at a set of temperatures."""
+
+    temperatures: np.ndarray
+    zpe: float
+    energy: np.ndarray
+    entropy: np.ndarray
+    free_energy: np.ndarray
+
+
+class VibrationalData:
+    """
+    Columnar accessor for the vibrational modes of a ChemShell calculation.
+
+    The modes array is read once and each of its columns is exposed as a NumPy
+    array, with all derived quantities computed in bulk from those columns.
+    """
+
+    def __init__(self, modes: np.ndarray):
+        """
+        VibrationalData constructor.
+
+        Parameters
+        ----------
+        modes : np.ndarray
+            The ``(nmodes, 5)`` ChemShell modes array with columns of frequency
+            (cm^-1), vibrational temperature (K), zero point energy, energy and
+            -TS (Hartree).
+        """
+        self.modes = np.asarray(modes, dtype=float)
+        return
+
+    @classmethod
+    def from_node(cls, node: ArrayData) -> "VibrationalData":
+        """Create the accessor from a ChemShell vibrational modes node."""
+        return cls(node.get_array("Modes"))
+
+    def __len__(self) -> int:
+        """Return the number of modes."""
+        return self.modes.shape[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a column of the modes array by name (see MODE_COLUMNS)."""
+        return self.modes[:, MODE_COLUMNS.index(name)]
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """The frequency (cm^-1) of each mode, imaginary modes are negative."""
+        return self.column("frequency")
+
+    def real_frequencies(self, cutoff: float = 10.0) -> np.ndarray:
+        """Return the frequencies above the cutoff (cm^-1), i.e. the true vibrations."""
+        frequencies = self.frequencies
+        return frequencies[frequencies > cutoff]
+
+    def thermochemistry(
+        self, temperatures: float | np.ndarray, cutoff: float = 10.0
+    ) -> Thermochemistry:
+        """
+        Compute the harmonic oscillator thermochemistry at several temperatures.
+
+        Parameters
+        ----------
+        temperatures : float | np.ndarray
+            The temperatures (K) to evaluate.
+        cutoff : float
+            Frequencies (cm^-1) at or below this value (translations, rotations
+            and imaginary modes) are excluded.
+
+        Returns
+        -------
+        Thermochemistry
+            The zero point energy and the vibrational energy, entropy (Hartree/K)
+            and free energy at each temperature.
+        """
+        temperatures = np.atleast_1d(np.asarray(temperatures, dtype=float))
+        theta = self.real_frequencies(cutoff) * WAVENUMBER_TO_KELVIN
+        zpe = 0.5 * KB_HARTREE * theta.sum()
+        # (ntemperatures, nmodes) reduced frequencies, zero temperature has no
+        # thermal population
+        with np.errstate(divide="ignore", over="ignore"):
+            x = theta[np.newaxis, :] / temperatures[:, np.newaxis]
+            occupation = 1.0 / np.expm1(x)
+            entropy_terms = x * occupation - np.log1p(-np.exp(-x))
+        occupation = np.nan_to_num(occupation)
+        entropy_terms = np.nan_to_num(entropy_terms)
+        energy = zpe + KB_HARTREE * (theta * occupation).sum(axis=1)
+        entropy = KB_HARTREE * entropy_terms.sum(axis=1)
+        return Thermochemistry(
+            temperatures=temperatures,
+            zpe=zpe,
+            energy=energy,
+            entropy=entropy,
+            free_energy=energy - temperatures * entropy,
+        )
+
+    def spectrum(
+        self,
+        grid: np.ndarray,
+        fwhm: float = 10.0,
+        intensities: np.ndarray | None = None,
+        lineshape: str = "lorentzian",
+        cutoff: float | None = 10.0,
+    ) -> np.ndarray:
+        """
+        Compute a broadened vibrational spectrum.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The wavenumbers (cm^-1) to evaluate the spectrum at.
+        fwhm : float
+            The full width at half maximum (cm^-1) of each peak.
+        intensities : np.ndarray | None
+            The intensity of each mode, all modes have unit intensity if not given.
+        lineshape : str
+            Either "lorentzian" or "gaussian".
+        cutoff : float | None
+            Modes with frequencies (cm^-1) at or below this value (translations,
+            rotations and imaginary modes) are excluded, all modes are included
+            if None.
+
+        Returns
+        -------
+        np.ndarray
+            The spectrum evaluated on the grid.
+        """
+        if intensities is None:
+            intensities = np.ones(len(self))
+        frequencies = self.frequencies
+        if cutoff is not None:
+            real = frequencies > cutoff
+            frequencies, intensities = frequencies[real], np.asarray(intensities)[real]
+        offsets = np.asarray(grid)[:, np.newaxis] - frequencies[np.newaxis, :]
+        if lineshape == "gaussian":
+            sigma = fwhm / (2 * np.sqrt(2 * np.log(2)))
+            peaks = np.exp(-0.5 * (offsets / sigma) ** 2)
+            peaks /= sigma * np.sqrt(2 * np.pi)
+        elif lineshape == "lorentzian":
+            gamma = 0.5 * fwhm
+            peaks = gamma / (np.pi * (offsets**2 + gamma**2))
+        else:
+            raise ValueError(f"Unknown lineshape '{lineshape}'.")
+        return peaks @ intensities
+
+
+@lru_cache(maxsize=256)
+def _load_vibrational_data(uuid: str) -> VibrationalData:
+    return VibrationalData.from_node(load_node(uuid))
+
+
+def get_vibrational_data(node: ArrayData) -> VibrationalData:
+    """
+    Return the vibrational data of a stored node, reading its array only once.
+
+    Parameters
+    ----------
+    node : ArrayData
+        The ChemShell vibrational modes node.
+
+    Returns
+    -------
+    VibrationalData
+        The (cached) columnar accessor of the node's modes.
+    """
+    if not node.is_stored:
+        return VibrationalData.from_node(node)
+    return _load_vibrational_data(node.uuid)
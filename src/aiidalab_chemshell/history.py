@@ -3,13 +3,17 @@
 from datetime import datetime
 
 from aiida.orm import CalcJobNode, WorkChainNode
-from aiidalab_widgets_base import ProcessNodesTreeWidget
 from IPython.display import display
-from ipywidgets import HTML, VBox, dlink
+from ipywidgets import HTML, Accordion, VBox, dlink
 
+from aiidalab_chemshell.common.comparison import EnergyComparisonWidget
 from aiidalab_chemshell.common.database import AiiDADatabaseWidget
+from aiidalab_chemshell.common.export import ExportBundleWidget
 from aiidalab_chemshell.common.navigation import QuickAccessButtons
 from aiidalab_chemshell.common.node_viewers import CustomAiidaNodeViewWidget
+from aiidalab_chemshell.common.process_tree import LazyProcessTreeWidget
+from aiidalab_chemshell.common.restart import RestartWidget
+from aiidalab_chemshell.common.structure_gallery import StructureGalleryWidget
 from aiidalab_chemshell.models.process import ProcessModel
 
 
@@ -92,7 +96,7 @@ class HistoryAppView(VBox):
         )
         self.lookup_widget.observe(self._update_node_view, "data_object")
 
-        self.node_tree = ProcessNodesTreeWidget()
+        self.node_tree = LazyProcessTreeWidget()
         dlink((self.model, "process_uuid"), (self.node_tree, "value"))
         self.node_view = CustomAiidaNodeViewWidget()
         dlink(
@@ -100,6 +104,20 @@ class HistoryAppView(VBox):
             (self.node_view, "node"),
             transform=lambda nodes: nodes[0] if nodes else None,
         )
+        self.restart = RestartWidget()
+        dlink((self.model, "process_uuid"), (self.restart, "process_uuid"))
+        self.restart.observe(self._follow_restart, "restarted_uuid")
+
+        energies = EnergyComparisonWidget()
+        export = ExportBundleWidget()
+        gallery = StructureGalleryWidget()
+        dlink((energies, "table"), (export, "table"))
+        dlink((energies, "table"), (gallery, "table"))
+        self.comparison = Accordion(children=[energies, gallery, export])
+        self.comparison.set_title(0, "Energy Comparison")
+        self.comparison.set_title(1, "Structure Gallery")
+        self.comparison.set_title(2, "Export Results")
+        self.comparison.selected_index = None
 
         super().__init__(
             layout={},
@@ -111,6 +129,9 @@ class HistoryAppView(VBox):
                 h_line,
                 self.node_tree,
                 self.node_view,
+                self.restart,
+                h_line,
+                self.comparison,
                 footer,
             ],
             **kwargs,
@@ -122,3 +143,9 @@ class HistoryAppView(VBox):
         if self.lookup_widget.data_object is not None:
             self.model.process_uuid = self.lookup_widget.data_object.uuid
         return
+
+    def _follow_restart(self, change) -> None:
+        """Show a restarted optimisation."""
+        if change["new"]:
+            self.model.process_uuid = change["new"]
+        return
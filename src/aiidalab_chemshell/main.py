@@ -6,6 +6,7 @@ import ipywidgets as ipw
 from IPython.display import display
 
 from aiidalab_chemshell.common.navigation import QuickAccessButtons
+from aiidalab_chemshell.common.session import SessionNoticeWidget, SessionStore
 from aiidalab_chemshell.process import MainAppModel
 from aiidalab_chemshell.wizards.main_app import MainAppWizardWidget
 
@@ -17,8 +18,23 @@ class MainApp:
         """MainApp constructor."""
         self.model = MainAppModel()
         self.view = MainAppView(self.model)
+        # Restore the previous session once the views are linked to the model
+        self.session = SessionStore()
+        if self.session.restore(self.model):
+            notice = SessionNoticeWidget(
+                self.session, self.model, layout={"margin": "auto"}
+            )
+            self.view.children = [notice, *self.view.children]
+        self.session.track(self.model)
+        self.model.observe(self._clear_session, "block_results")
         display(self.view)
 
+    def _clear_session(self, change) -> None:
+        """Start a new session once the configured workflow is submitted."""
+        if not change["new"]:
+            self.session.clear()
+        return
+
     # def load(self) -> None:
     #     return
 
@@ -8,9 +8,14 @@ class ComputationalResourcesModel(tl.HasTraits):
 
     code_label = tl.Unicode("").tag(sync=True)
     ncpus = tl.Int(4).tag(sync=True)
+    auto_select_computer = tl.Bool(False).tag(sync=True)
     process_label = tl.Unicode("").tag(sync=True)
     process_description = tl.Unicode("").tag(sync=True)
     submitted = tl.Bool(False).tag(sync=True)
+    # Outcome of the pre-submission validation, and whether its warnings have
+    # been confirmed by submitting again
+    validation_message = tl.Unicode("")
+    confirmed = tl.Bool(False)
 
     default_guide = """
         <p>
@@ -33,3 +38,9 @@ class ComputationalResourcesModel(tl.HasTraits):
             print("ERROR: No code selected.")
             return False
         return True
+
+    @tl.observe("code_label", "ncpus")
+    def _reset_confirmation(self, _) -> None:
+        """Require warnings to be confirmed again after the resources change."""
+        self.confirmed = False
+        return
@@ -1,6 +1,6 @@
 """The structure input model for ChemShell input configuration."""
 
-from aiida.orm import SinglefileData, StructureData
+from aiida.orm import Group, SinglefileData, StructureData
 from traitlets import Bool, HasTraits, Instance, observe
 
 
@@ -14,6 +14,7 @@ class StructureInputModel(HasTraits):
 
     structure = Instance(StructureData, allow_none=True)
     structure_file = Instance(SinglefileData, allow_none=True)
+    structure_group = Instance(Group, allow_none=True)
     submitted = Bool(False).tag(sync=True)
 
     @property
@@ -26,6 +27,11 @@ class StructureInputModel(HasTraits):
         """True if a raw structure file object has been attached to the model."""
         return self.structure_file is not None
 
+    @property
+    def has_group(self) -> bool:
+        """True if a group of structures for batch processing is attached."""
+        return self.structure_group is not None
+
     @property
     def is_periodic(self) -> bool:
         """True if the attached StructureData object is a periodic structure."""
@@ -34,7 +40,24 @@ class StructureInputModel(HasTraits):
         return False
 
     @observe("structure")
-    def _update_structure(self, _) -> None:
+    def _update_structure(self, change) -> None:
         """Remove any file associated if a StructureData object is provided."""
         self.structure_file = None
+        if change["new"] is not None:
+            self.structure_group = None
+        return
+
+    @observe("structure_file")
+    def _update_structure_file(self, change) -> None:
+        """Remove any batch structure group if a single file is provided."""
+        if change["new"] is not None:
+            self.structure_group = None
+        return
+
+    @observe("structure_group")
+    def _update_structure_group(self, change) -> None:
+        """Remove any single structure if a batch structure group is provided."""
+        if change["new"] is not None:
+            self.structure = None
+            self.structure_file = None
         return
@@ -1,16 +1,23 @@
 """Defines the MVC models for ChemShell workflow specification."""
 
-from aiida.orm import SinglefileData
+from aiida.orm import SinglefileData, StructureData
 from aiida_chemshell.utils import ChemShellQMTheory
 from traitlets import (
     Bool,
+    Float,
     HasTraits,
     Instance,
+    Int,
     Unicode,
+    Union,
     UseEnum,
 )
 
-from aiidalab_chemshell.common.chemshell import BasisSetOptions, WorkflowOptions
+from aiidalab_chemshell.common.chemshell import (
+    BasisSetOptions,
+    NEBExecutionOptions,
+    WorkflowOptions,
+)
 
 
 class ChemShellWorkflowModel(HasTraits):
@@ -33,4 +40,24 @@ class ChemShellWorkflowModel(HasTraits):
     gradients = Bool(True)
     hessian = Bool(False)
 
+    # Nudged elastic band settings, the reactant is the main input structure
+    product_structure = Union(
+        [Instance(StructureData), Instance(SinglefileData)], allow_none=True
+    )
+    neb_images = Int(8)
+    neb_interpolation = Unicode("idpp", allow_none=False)
+    neb_type = Unicode("frozen", allow_none=False)
+    neb_spring = Float(0.01)
+    neb_execution = UseEnum(
+        NEBExecutionOptions, NEBExecutionOptions.IMAGES, allow_none=False
+    )
+
+    # Multi-level screening settings, a zero window or count keeps every structure
+    screening_basis_sets = Unicode(
+        ", ".join(option.label for option in BasisSetOptions), allow_none=False
+    )
+    screening_window = Float(0.0)
+    screening_top_n = Int(0)
+    screening_optimise = Bool(True)
+
     default_guide = ""
@@ -1,18 +1,59 @@
 """Module for handling AiiDA processes."""
 
+from io import BytesIO, StringIO
+
+import ase.io
 import traitlets as tl
-from aiida.engine import submit
-from aiida.orm import Dict, load_code
-from aiida.plugins import WorkflowFactory
-from ipywidgets import dlink
+from aiida.engine import ProcessBuilder, submit
+from aiida.orm import (
+    Bool,
+    CalcJobNode,
+    Float,
+    Int,
+    List,
+    SinglefileData,
+    StructureData,
+)
+from aiida.plugins import CalculationFactory, WorkflowFactory
+from ase import units
 
-from aiidalab_chemshell.common.chemshell import WorkflowOptions
+from aiidalab_chemshell.common.atomic_energies import (
+    ATOMISATION_STRUCTURE_EXTRA,
+    atomisation_energy_message,
+    get_atomic_energy_cache,
+    isolated_atoms_structure,
+    qm_cache_key,
+    structure_elements,
+)
+from aiidalab_chemshell.common.builders import get_builder_template_cache
+from aiidalab_chemshell.common.chemshell import NEBExecutionOptions, WorkflowOptions
+from aiidalab_chemshell.common.code_index import get_code_index
+from aiidalab_chemshell.common.guess import (
+    GUESS_EXTRA,
+    find_guess_calculation,
+    guess_files,
+    guess_prepend_text,
+)
+from aiidalab_chemshell.common.neb import interpolate_images
+from aiidalab_chemshell.common.scheduler_load import get_scheduler_load_monitor
+from aiidalab_chemshell.common.screening import ScreeningWorkChain
+from aiidalab_chemshell.common.structure_ingest import read_atoms
+from aiidalab_chemshell.common.validation import (
+    HYBRID_FUNCTIONALS,
+    ValidationReport,
+    parse_qm_region,
+    validate_inputs,
+)
+from aiidalab_chemshell.models.resources import ComputationalResourcesModel
+from aiidalab_chemshell.models.results import ResultsModel
 from aiidalab_chemshell.models.structure import StructureInputModel
 from aiidalab_chemshell.models.workflow import ChemShellWorkflowModel
-from aiidalab_chemshell.wizards.resources import ComputationalResourcesModel
-from aiidalab_chemshell.wizards.results import ResultsModel
 
+# Resolve the process entry points once on import rather than per submission
+ChemShellCalculation = CalculationFactory("chemshell")
 GeometryOptimisationWorkflow = WorkflowFactory("chemshell.opt")
+IsolatedAtomEnergiesWorkflow = WorkflowFactory("chemshell.atomic_energies")
+BatchProcessWorkflow = WorkflowFactory("chemshell.batch")
 
 
 class MainAppModel(tl.HasTraits):
@@ -29,21 +70,37 @@ class MainAppModel(tl.HasTraits):
         self.results_model = ResultsModel()
 
         self.resource_model.observe(self._submit_model, "submitted")
-        dlink((self, "block_results"), (self.results_model, "blocked"))
+        tl.dlink((self, "block_results"), (self.results_model, "blocked"))
 
         self.process = None
+        self.validation: ValidationReport | None = None
 
         return
 
-    def _submit_model(self, _) -> None:
+    def _submit_model(self, change) -> None:
         """Handle the submission of the AiiDA process."""
+        if not change["new"]:
+            return
+        if self.resource_model.auto_select_computer:
+            # Selected first so the inputs are validated against the chosen computer
+            ChemShellProcess.select_least_loaded_code(self)
         if ChemShellProcess.validate_model(self):
+            if self.validation.warnings and not self.resource_model.confirmed:
+                # Hold the submission back until it is repeated to confirm the
+                # warnings shown in the resources step
+                self.resource_model.confirmed = True
+                self.resource_model.submitted = False
+                return
             self.process = ChemShellProcess(self)
             self.process.submit_process()
+            if self.process.node is None:
+                # Nothing to run, e.g. all isolated atom energies were cached
+                return
             self.block_results = False
             self.results_model.process_uuid = self.process.node.uuid
         else:
             print("ERROR: Input Validation Failed")
+            self.resource_model.submitted = False
         return
 
     def reset(self) -> None:
@@ -65,6 +122,8 @@ class ChemShellProcess:
         """
         self.model = model
         self.node = None
+        self.cached_energies: dict[str, float] = {}
+        self.guess_uuid: str | None = None
         return
 
     @classmethod
@@ -82,20 +141,179 @@ class ChemShellProcess:
         bool
             True if the model is valid, False otherwise.
         """
-        if not model.structure_model.has_structure:
+        if model.structure_model.has_group:
+            if model.workflow_model.workflow not in (
+                WorkflowOptions.SINGLE_POINT,
+                WorkflowOptions.SCREENING,
+            ):
+                print(
+                    "Batch submission is only available for single point energies "
+                    "and basis set screening."
+                )
+                return False
+        elif not model.structure_model.has_structure:
             if not model.structure_model.has_file:
                 print("No structure provided.")
                 return False
-        if model.workflow_model.use_mm:
-            if not model.workflow_model.force_field:
-                print("No force field provided.")
-                return False
-            if not model.workflow_model.qm_region:
-                print("No qm_ region specified", model.workflow_model.qm_region)
-                return False
-        # Add more validation checks as needed
+        if not cls._validate_workflow_options(model):
+            return False
+        if model.workflow_model.use_mm and not cls._validate_mm_options(model):
+            return False
+        model.validation = report = cls.validation_report(model)
+        model.resource_model.validation_message = report.to_html()
+        for error in report.errors:
+            print(f"ERROR: {error}")
+        for warning in report.warnings:
+            print(f"WARNING: {warning}")
+        return report.is_valid
+
+    @classmethod
+    def select_least_loaded_code(cls, model: MainAppModel) -> None:
+        """
+        Switch to the selected code on the computer with the shortest queue.
+
+        Only codes with the same label as the selected one are candidates, and
+        the number of CPUs is capped to the cores of the chosen computer.
+
+        Parameters
+        ----------
+        model : MainAppModel
+            The main application model, whose resources are updated.
+        """
+        resources = model.resource_model
+        index = get_code_index()
+        selected = index.get(resources.code_label)
+        label = (
+            selected.label
+            if selected is not None
+            else resources.code_label.partition("@")[0]
+        )
+        candidates = [entry for entry in index.entries() if entry.label == label]
+        entry = get_scheduler_load_monitor().least_loaded(candidates)
+        if entry is None:
+            print("WARNING: No scheduler could be queried, using the selected code.")
+            return
+        resources.code_label = entry.full_label
+        if entry.max_cores and resources.ncpus > entry.max_cores:
+            resources.ncpus = entry.max_cores
+        return
+
+    @classmethod
+    def validation_report(cls, model: MainAppModel) -> ValidationReport:
+        """
+        Check the structure dependent inputs and estimate the calculation's cost.
+
+        The QM region is checked against the structure, and the memory and
+        runtime are estimated from the basis functions of the QM atoms. Batch
+        submissions and isolated atom energies are not estimated.
+
+        Parameters
+        ----------
+        model : MainAppModel
+            The main application model to validate.
+
+        Returns
+        -------
+        ValidationReport
+            The errors, warnings and cost estimate of the model's inputs.
+        """
+        workflow = model.workflow_model
+        if model.structure_model.has_group or (
+            workflow.workflow == WorkflowOptions.ATOMIC_ENERGIES
+        ):
+            return ValidationReport()
+        structure = (
+            model.structure_model.structure_file
+            if model.structure_model.has_file
+            else model.structure_model.structure
+        )
+        try:
+            atoms = read_atoms(structure)
+        except ValueError:
+            atoms = None
+        basis = workflow.basis_set
+        if workflow.workflow == WorkflowOptions.SCREENING:
+            # The last (most expensive) level determines the resources needed
+            basis = cls._screening_levels(workflow)[-1]
+        entry = get_code_index().get(model.resource_model.code_label)
+        return validate_inputs(
+            atoms,
+            basis,
+            qm_region=workflow.qm_region if workflow.use_mm else None,
+            exact_exchange=(
+                not workflow.use_dft
+                or workflow.functional.lower() in HYBRID_FUNCTIONALS
+            ),
+            ncpus=model.resource_model.ncpus,
+            memory_kb=entry.memory_kb if entry is not None else None,
+        )
+
+    @classmethod
+    def _validate_workflow_options(cls, model: MainAppModel) -> bool:
+        """Validate the settings specific to the selected workflow."""
+        match model.workflow_model.workflow:
+            case WorkflowOptions.NEB:
+                return cls._validate_neb_model(model)
+            case WorkflowOptions.SCREENING:
+                if not cls._screening_levels(model.workflow_model):
+                    print("No screening basis sets provided.")
+                    return False
+        return True
+
+    @classmethod
+    def _validate_mm_options(cls, model: MainAppModel) -> bool:
+        """Validate the force field and QM region of a QM/MM calculation."""
+        workflow = model.workflow_model
+        if not workflow.force_field:
+            print("No force field provided.")
+            return False
+        # Checked here as batch submissions skip the structure dependent report
+        indices, invalid = parse_qm_region(workflow.qm_region)
+        if invalid:
+            print(f"Invalid QM region entries: {', '.join(invalid)}.")
+            return False
+        if not indices:
+            print("No QM region specified.")
+            return False
+        return True
+
+    @classmethod
+    def _validate_neb_model(cls, model: MainAppModel) -> bool:
+        """Validate the nudged elastic band settings of the application model."""
+        if model.workflow_model.product_structure is None:
+            print("No product structure provided for the NEB.")
+            return False
+        if model.workflow_model.neb_images < 1:
+            print("The NEB requires at least one image.")
+            return False
+        structure = model.structure_model
+        reactant = (
+            structure.structure_file if structure.has_file else structure.structure
+        )
+        try:
+            reactant_atoms = read_atoms(reactant)
+            product_atoms = read_atoms(model.workflow_model.product_structure)
+        except ValueError as e:
+            print(f"Cannot read the NEB end points: {e}")
+            return False
+        symbols = reactant_atoms.get_chemical_symbols()
+        if product_atoms.get_chemical_symbols() != symbols:
+            print(
+                "The NEB reactant and product must contain the same atoms in the "
+                "same order."
+            )
+            return False
         return True
 
+    @classmethod
+    def _screening_levels(cls, model: ChemShellWorkflowModel) -> list[str]:
+        """Return the basis set of each screening level, cheapest first."""
+        return [
+            basis.strip()
+            for basis in model.screening_basis_sets.split(",")
+            if basis.strip()
+        ]
+
     def submit_process(self):
         """Submit the AiiDA process."""
         match self.model.workflow_model.workflow:
@@ -105,92 +323,269 @@ class ChemShellProcess:
                 self._submit_atomic_energies_workflow()
             case WorkflowOptions.SINGLE_POINT:
                 self._submit_core_calcjob()
+            case WorkflowOptions.NEB:
+                self._submit_builder(self._build_neb_workflow())
+            case WorkflowOptions.SCREENING:
+                self._submit_builder(self._build_screening_workflow())
             case _:
                 print("ERROR :: Invalid Workflow Specified...")
         return
 
+    def build_process(self) -> ProcessBuilder | None:
+        """
+        Create the process builder for the selected workflow without submitting.
+
+        Returns
+        -------
+        ProcessBuilder | None
+            The process builder, or None if the workflow is not supported.
+        """
+        match self.model.workflow_model.workflow:
+            case WorkflowOptions.GEOMETRY:
+                return self._build_optimisation_workflow()
+            case WorkflowOptions.ATOMIC_ENERGIES:
+                return self._build_atomic_energies_workflow()
+            case WorkflowOptions.SINGLE_POINT:
+                return self._build_core_calcjob()
+            case WorkflowOptions.NEB:
+                return self._build_neb_workflow()
+            case WorkflowOptions.SCREENING:
+                return self._build_screening_workflow()
+            case _:
+                return None
+
+    def _submit_builder(self, builder: ProcessBuilder) -> None:
+        """Submit the given process builder and tag the resulting process node."""
+        self.node = submit(builder)
+        self.node.label = self.model.resource_model.process_label
+        self.node.description = self.model.resource_model.process_description
+        if self.guess_uuid is not None:
+            self.node.base.extras.set(GUESS_EXTRA, self.guess_uuid)
+        return
+
     def _submit_core_calcjob(self) -> None:
-        builder = load_code(self.model.resource_model.code_label).get_builder()
-        if self.model.structure_model.has_file:
-            builder.structure = self.model.structure_model.structure_file
-        else:
-            builder.structure = self.model.structure_model.structure
-        builder.qm_parameters = Dict(
-            {
-                "theory": self.model.workflow_model.qm_theory.name,
-                "method": "dft" if self.model.workflow_model.use_dft else "hf",
-                "functional": self.model.workflow_model.functional,
-                "basis": self.model.workflow_model.basis_set,
-            }
+        """Create and submit a core ChemShell CalcJob."""
+        self._submit_builder(self._build_core_calcjob())
+        return
+
+    def _build_core_calcjob(self) -> ProcessBuilder:
+        """Create the process builder for a core ChemShell CalcJob."""
+        if self.model.structure_model.has_group:
+            return self._build_batch_workflow()
+        parameters = self._calcjob_parameters()
+        guess = self._find_guess(parameters)
+        if guess is not None:
+            parameters["qm_parameters"]["restart"] = True
+        builder = get_builder_template_cache().builder(
+            ChemShellCalculation,
+            self.model.resource_model.code_label,
+            parameters,
         )
+        builder.structure = self._structure()
         if self.model.workflow_model.use_mm:
-            builder.mm_parameters = Dict(
-                {
-                    "theory": self.model.workflow_model.mm_theory,
-                }
-            )
             builder.force_field_file = self.model.workflow_model.force_field
-            builder.qmmm_parameters = Dict(
-                {
-                    "qm_region": ChemShellProcess._extract_qm_region(
-                        self.model.workflow_model.qm_region
-                    ),
-                }
-            )
-        builder.calculation_parameters = Dict(
-            {
-                "gradients": self.model.workflow_model.gradients,
-                "hessian": self.model.workflow_model.hessian,
-            }
+        self._set_calcjob_resources(builder.metadata)
+        if guess is not None:
+            builder.metadata.options.prepend_text = guess_prepend_text(*guess)
+        return builder
+
+    def _find_guess(
+        self, parameters: dict[str, dict]
+    ) -> tuple[CalcJobNode, list[str]] | None:
+        """
+        Find a completed calculation of the same structure to take the guess from.
+
+        The wavefunction is only reused for pure QM calculations on the same
+        computer, as the files are copied from the previous working directory,
+        and only if the files are still present. The calculation is returned
+        with the names of its wavefunction files.
+        """
+        self.guess_uuid = None
+        if self.model.workflow_model.use_mm:
+            return None
+        code = get_builder_template_cache().code(self.model.resource_model.code_label)
+        guess = find_guess_calculation(
+            self._structure(), parameters["qm_parameters"], code.computer
         )
-        if self.model.workflow_model.vibrational_analysis:
-            builder.optimisation_parameters = Dict({"thermal": True})
-        if self.model.resource_model.ncpus > 1:
-            builder.metadata.options.withmpi = True
-        else:
-            builder.metadata.options.withmpi = False
-        builder.metadata.options.resources = {
+        files = guess_files(guess) if guess is not None else []
+        if not files:
+            return None
+        self.guess_uuid = guess.uuid
+        return guess, files
+
+    def _build_batch_workflow(self) -> ProcessBuilder:
+        """Create the process builder for a ChemShell CalcJob per grouped structure."""
+        builder = get_builder_template_cache().builder(
+            BatchProcessWorkflow,
+            self.model.resource_model.code_label,
+            self._calcjob_parameters(),
+        )
+        structures, files = {}, {}
+        for node in self.model.structure_model.structure_group.nodes:
+            if isinstance(node, StructureData):
+                structures[f"structure_{node.pk}"] = node
+            elif isinstance(node, SinglefileData):
+                files[f"structure_{node.pk}"] = node
+        if structures:
+            builder.structures = structures
+        if files:
+            builder.structure_files = files
+        if self.model.workflow_model.use_mm:
+            builder.force_field_file = self.model.workflow_model.force_field
+        self._set_calcjob_resources(builder.calc.metadata)
+        return builder
+
+    def _set_calcjob_resources(self, metadata) -> None:
+        """Set the requested resources in a ChemShell CalcJob metadata namespace."""
+        metadata.options.withmpi = self.model.resource_model.ncpus > 1
+        metadata.options.resources = {
             "num_mpiprocs_per_machine": self.model.resource_model.ncpus,
             "num_cores_per_machine": self.model.resource_model.ncpus,
             "num_machines": 1,
             "tot_num_mpiprocs": self.model.resource_model.ncpus,
         }
-        self.node = submit(builder)
-        self.node.label = self.model.resource_model.process_label
-        self.node.description = self.model.resource_model.process_description
         return
 
+    def _calcjob_parameters(self) -> dict[str, dict]:
+        """Return the parameter dictionaries for a core ChemShell CalcJob."""
+        parameters = {
+            "qm_parameters": {
+                "theory": self.model.workflow_model.qm_theory.name,
+                "method": "dft" if self.model.workflow_model.use_dft else "hf",
+                "functional": self.model.workflow_model.functional,
+                "basis": self.model.workflow_model.basis_set,
+            },
+            "calculation_parameters": {
+                "gradients": self.model.workflow_model.gradients,
+                "hessian": self.model.workflow_model.hessian,
+            },
+        }
+        if self.model.workflow_model.use_mm:
+            parameters.update(self._mm_parameters())
+        if self.model.workflow_model.vibrational_analysis:
+            parameters["optimisation_parameters"] = {"thermal": True}
+        return parameters
+
+    def _build_neb_workflow(self) -> ProcessBuilder:
+        """
+        Create the process builder for a nudged elastic band calculation.
+
+        Either the energy of each image of the interpolated path, including the
+        end points, is calculated as an independent ChemShell job, giving a
+        single point scan along the fixed path, or the end points are passed to
+        a single DL-FIND NEB optimisation, which generates its own images.
+        """
+        workflow = self.model.workflow_model
+        reactant = self._structure()
+        product = workflow.product_structure
+        parameters = self._calcjob_parameters()
+        # Vibrational analysis is not performed along the path
+        parameters.pop("optimisation_parameters", None)
+        if workflow.neb_execution == NEBExecutionOptions.IMAGES:
+            builder = get_builder_template_cache().builder(
+                BatchProcessWorkflow,
+                self.model.resource_model.code_label,
+                parameters,
+            )
+            builder.trajectory = interpolate_images(
+                reactant, product, workflow.neb_images, workflow.neb_interpolation
+            )
+            builder.combine_results = True
+            self._set_calcjob_resources(builder.calc.metadata)
+            return builder
+
+        del parameters["calculation_parameters"]
+        parameters["optimisation_parameters"] = {
+            "neb": workflow.neb_type,
+            "nimages": workflow.neb_images,
+            "nebk": workflow.neb_spring,
+        }
+        builder = get_builder_template_cache().builder(
+            ChemShellCalculation,
+            self.model.resource_model.code_label,
+            parameters,
+        )
+        builder.structure = reactant
+        if isinstance(product, StructureData):
+            # A StructureData end point is written over the first structure by
+            # the calculation, so it is always passed as a file
+            content = StringIO()
+            ase.io.write(content, product.get_ase(), format="xyz")
+            product = SinglefileData(
+                BytesIO(content.getvalue().encode()), filename="neb_product.xyz"
+            )
+        builder.structure2 = product
+        if workflow.use_mm:
+            builder.force_field_file = workflow.force_field
+        self._set_calcjob_resources(builder.metadata)
+        return builder
+
+    def _build_screening_workflow(self) -> ProcessBuilder:
+        """
+        Create the process builder for a multi-level basis set screening.
+
+        Every structure of the group (or the single input structure) is
+        calculated with the cheapest basis set and only those within the
+        energy window and/or top-N are promoted to the next basis set.
+        """
+        workflow = self.model.workflow_model
+        parameters = self._calcjob_parameters()
+        parameters.pop("optimisation_parameters", None)
+        builder = get_builder_template_cache().builder(
+            ScreeningWorkChain,
+            self.model.resource_model.code_label,
+            parameters,
+        )
+        if self.model.structure_model.has_group:
+            builder.structures = {
+                f"structure_{node.pk}": node
+                for node in self.model.structure_model.structure_group.nodes
+                if isinstance(node, (StructureData, SinglefileData))
+            }
+        else:
+            builder.structures = {"structure": self._structure()}
+        builder.basis_sets = List(self._screening_levels(workflow))
+        if workflow.screening_window > 0:
+            # The window is entered in kJ/mol but energies are in Hartree
+            builder.energy_window = Float(
+                workflow.screening_window * units.kJ / units.mol / units.Hartree
+            )
+        if workflow.screening_top_n > 0:
+            builder.top_n = Int(workflow.screening_top_n)
+        builder.optimise = Bool(workflow.screening_optimise)
+        if workflow.use_mm:
+            builder.force_field_file = workflow.force_field
+        self._set_calcjob_resources(builder.calc.metadata)
+        return builder
+
     def _submit_optimisation_workflow(self) -> None:
         """Create and submit the AiiDA Workflow for a geometry optimisation."""
-        builder = WorkflowFactory("chemshell.opt").get_builder()  # pyright: ignore[reportFunctionMemberAccess]
-        builder.chemsh.code = load_code(self.model.resource_model.code_label)
+        self._submit_builder(self._build_optimisation_workflow())
+        return
+
+    def _build_optimisation_workflow(self) -> ProcessBuilder:
+        """Create the process builder for a geometry optimisation workflow."""
+        parameters = {}
+        if self.model.workflow_model.use_mm:
+            parameters["qm_parameters"] = {
+                "theory": self.model.workflow_model.qm_theory.name,
+                "method": "dft",
+                "functional": self.model.workflow_model.functional,
+                "basis": self.model.workflow_model.basis_set,
+            }
+            parameters.update(self._mm_parameters())
+        builder = get_builder_template_cache().builder(
+            GeometryOptimisationWorkflow,
+            self.model.resource_model.code_label,
+            {f"chemsh.{port}": values for port, values in parameters.items()},
+            code_port="chemsh.code",
+        )
         if self.model.structure_model.has_file:
             builder.chemsh.structure = self.model.structure_model.structure_file
         else:
             builder.chemsh.structure = self.model.structure_model.structure
-
         if self.model.workflow_model.use_mm:
-            builder.chemsh.qm_parameters = Dict(
-                {
-                    "theory": self.model.workflow_model.qm_theory,
-                    "method": "dft",
-                    "functional": self.model.workflow_model.functional,
-                    "basis": self.model.workflow_model.basis_set,
-                }
-            )
-            builder.chemsh.mm_parameters = Dict(
-                {
-                    "theory": self.model.workflow_model.mm_theory,
-                }
-            )
             builder.chemsh.force_field_file = self.model.workflow_model.force_field
-            builder.chemsh.qmmm_parameters = Dict(
-                {
-                    "qm_region": ChemShellProcess._extract_qm_region(
-                        self.model.workflow_model.qm_region
-                    ),
-                }
-            )
         # builder.chemsh.calculation_parameters = Dict({"gradients": True})
         builder.vibrational_analysis = self.model.workflow_model.vibrational_analysis
         builder.chemsh.metadata.options.resources = {
@@ -199,65 +594,87 @@ class ChemShellProcess:
             "num_machines": 1,
             "tot_num_mpiprocs": self.model.resource_model.ncpus,
         }
-        self.node = submit(builder)
-        self.node.label = self.model.resource_model.process_label
-        self.node.description = self.model.resource_model.process_description
-        return
+        return builder
 
     def _submit_atomic_energies_workflow(self) -> None:
-        """Submit the IsolatedAtomEnergy WorkChain."""
-        builder = WorkflowFactory("chemshell.atomic_energies").get_builder()  # pyright: ignore[reportFunctionMemberAccess]
-        builder.code = load_code(self.model.resource_model.code_label)
+        """Submit the IsolatedAtomEnergy WorkChain for any uncached elements."""
+        builder = self._build_atomic_energies_workflow()
+        structure = self._structure()
+        if builder is None:
+            # Nothing is submitted so the energies are shown in the resources step
+            energies = ", ".join(
+                f"{element}: {energy:.8f}"
+                for element, energy in sorted(self.cached_energies.items())
+            )
+            atomisation = atomisation_energy_message(
+                structure, self._atomic_energies_parameters()
+            )
+            self.model.resource_model.validation_message += (
+                f"<p>All isolated atom energies are cached (Hartree) {energies}</p>"
+                f"<p>{atomisation}</p>"
+            )
+            return
+        self._submit_builder(builder)
+        if structure.is_stored:
+            # The workflow may only have been given the uncached elements
+            self.node.base.extras.set(ATOMISATION_STRUCTURE_EXTRA, structure.uuid)
+        return
+
+    def _structure(self) -> StructureData | SinglefileData:
+        """Return the input structure of the model."""
         if self.model.structure_model.has_file:
-            builder.structure = self.model.structure_model.structure_file
-        else:
-            builder.structure = self.model.structure_model.structure
-        builder.qm_parameters = Dict(
-            {
-                "theory": self.model.workflow_model.qm_theory.name,
-                "method": "dft",
-                "functional": self.model.workflow_model.functional,
-                "basis": self.model.workflow_model.basis_set,
-            }
+            return self.model.structure_model.structure_file
+        return self.model.structure_model.structure
+
+    def _atomic_energies_parameters(self) -> dict[str, str]:
+        """Return the QM parameters used for the isolated atom calculations."""
+        return {
+            "theory": self.model.workflow_model.qm_theory.name,
+            "method": "dft",
+            "functional": self.model.workflow_model.functional,
+            "basis": self.model.workflow_model.basis_set,
+        }
+
+    def _build_atomic_energies_workflow(self) -> ProcessBuilder | None:
+        """
+        Create the process builder for the IsolatedAtomEnergy WorkChain.
+
+        Elements whose energy was already computed with the same backend,
+        method, basis and functional are taken from the cache. Only the remaining
+        elements are calculated, and None is returned if every element is cached.
+        """
+        qm_parameters = self._atomic_energies_parameters()
+        structure = self._structure()
+        elements = sorted(structure_elements(structure))
+        cache = get_atomic_energy_cache()
+        self.cached_energies = cache.lookup(elements, *qm_cache_key(qm_parameters))
+        missing = [e for e in elements if e not in self.cached_energies]
+        if elements and not missing:
+            return None
+        builder = get_builder_template_cache().builder(
+            IsolatedAtomEnergiesWorkflow,
+            self.model.resource_model.code_label,
+            {"qm_parameters": qm_parameters},
         )
-        self.node = submit(builder)
-        self.node.label = self.model.resource_model.process_label
-        self.node.description = self.model.resource_model.process_description
-        return
+        if self.cached_energies:
+            builder.structure = isolated_atoms_structure(missing)
+        else:
+            builder.structure = structure
+        return builder
 
-    @classmethod
-    def _extract_qm_region(cls, input_str: str) -> list[int]:
-        input = [val.strip(",") for val in input_str.split()]
-        qm_region = []
-        invalid_input = False
-        for entry in input:
-            if "," in entry:
-                entries = entry.split(",")
-                for sub_entry in entries:
-                    if "-" in sub_entry:
-                        qm_region += ChemShellProcess._expand_range_entry(
-                            sub_entry, invalid_input
-                        )
-            if "-" in entry:
-                qm_region += ChemShellProcess._expand_range_entry(entry, invalid_input)
-            else:
-                try:
-                    val = int(entry)
-                except ValueError:
-                    invalid_input = True
-                except Exception as e:
-                    raise e
-                else:
-                    qm_region.append(val)
-        return qm_region
+    def _mm_parameters(self) -> dict[str, dict]:
+        """Return the MM and QM/MM parameter dictionaries for the model."""
+        return {
+            "mm_parameters": {
+                "theory": self.model.workflow_model.mm_theory,
+            },
+            "qmmm_parameters": {
+                "qm_region": ChemShellProcess._extract_qm_region(
+                    self.model.workflow_model.qm_region
+                ),
+            },
+        }
 
     @classmethod
-    def _expand_range_entry(cls, input: str, invalid_input: bool) -> list[int]:
-        start, end = input.split("-")
-        try:
-            return list(range(int(start), int(end) + 1))
-        except ValueError:
-            invalid_input = True  # noqa: F841
-            return []
-        except Exception as e:
-            raise e
+    def _extract_qm_region(cls, input_str: str) -> list[int]:
+        return parse_qm_region(input_str)[0]
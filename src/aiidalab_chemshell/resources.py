@@ -1,10 +1,63 @@
 """Defines a resource setup widget based on foundations from aiidalab-widgets-base."""
 
+import asyncio
+from threading import Lock, Thread
+
+from aiidalab_widgets_base import computational_resources
 from aiidalab_widgets_base.computational_resources import ResourceSetupBaseWidget
+from aiidalab_widgets_base.databases import ComputationalResourcesDatabaseWidget
 from aiidalab_widgets_base.utils import StatusHTML
-from ipywidgets import HTML, Text, VBox, dlink
+from ipywidgets import HTML, Button, HBox, Text, VBox, dlink
 from traitlets import HasTraits, Unicode, observe
 
+from aiidalab_chemshell.common.resource_database import (
+    DEFAULT_DATABASE_SOURCE,
+    ResourceDatabaseCache,
+)
+
+# Guards the substitution of the database widget class whilst a setup widget is built
+_SETUP_LOCK = Lock()
+
+
+class CachedResourcesDatabaseWidget(ComputationalResourcesDatabaseWidget):
+    """
+    Resource database widget which never fetches the database itself.
+
+    The upstream widget downloads its default database (without a timeout)
+    as soon as it is constructed. Here the database starts empty and is set
+    from the app's ResourceDatabaseCache once loaded.
+    """
+
+    @staticmethod
+    def _database_generator(database_source, default_calc_job_plugin) -> dict:
+        """Return an empty database instead of fetching the source."""
+        return {}
+
+
+class CachedResourceSetupWidget(ResourceSetupBaseWidget):
+    """Computer and code setup widget making no network requests on construction."""
+
+    def __init__(self, **kwargs):
+        """
+        CachedResourceSetupWidget constructor.
+
+        Parameters
+        ----------
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        # The parent constructor creates its database widget by module level name
+        with _SETUP_LOCK:
+            upstream = computational_resources.ComputationalResourcesDatabaseWidget
+            computational_resources.ComputationalResourcesDatabaseWidget = (
+                CachedResourcesDatabaseWidget
+            )
+            try:
+                super().__init__(**kwargs)
+            finally:
+                computational_resources.ComputationalResourcesDatabaseWidget = upstream
+        return
+
 
 class CodeSetupWidget(VBox, HasTraits):
     """Widget to setup a new code instance."""
@@ -19,18 +72,27 @@ class CodeSetupWidget(VBox, HasTraits):
             value=self._database_source, description="Source: ", layout={"width": "80%"}
         )
         dlink((self.source, "value"), (self, "_database_source"))
-        self.resource_widget = ResourceSetupBaseWidget()
+        self.update_btn = Button(
+            description="Update",
+            button_style="info",
+            tooltip="Revalidate the cached resource database with its source",
+            icon="refresh",
+            layout={"width": "15%"},
+        )
+        self.update_btn.on_click(self._force_update)
+        self.database_cache = ResourceDatabaseCache()
+        self.resource_widget = CachedResourceSetupWidget()
         self.setup_message = StatusHTML(clear_after=15)
         dlink(
             (self.resource_widget, "message"),
             (self.setup_message, "message"),
         )
 
-        self.source.value = "https://raw.githubusercontent.com/stfc/alc-ux/refs/heads/main/resources/remotes.json"
+        self.source.value = DEFAULT_DATABASE_SOURCE
 
         children = [
             HTML("<hr>"),
-            self.source,
+            HBox([self.source, self.update_btn]),
             HTML("<hr>"),
             self.resource_widget,
             self.setup_message,
@@ -40,7 +102,37 @@ class CodeSetupWidget(VBox, HasTraits):
 
     @observe("_database_source")
     def _update_database_source(self, _):
-        self.resource_widget.comp_resources_database.database_source = (
-            self._database_source
-        )
+        self._load_database(force=False)
+        return
+
+    def _force_update(self, _=None) -> None:
+        """Revalidate the current database source regardless of the cache age."""
+        self._load_database(force=True)
+        return
+
+    def _load_database(self, force: bool) -> None:
+        """Load the resource database in the background to keep the page responsive."""
+        source = self._database_source
+        # The database is handed back to the kernel's event loop so that widgets
+        # are only ever updated from the main thread
+        loop = asyncio.get_event_loop()
+
+        def _load() -> None:
+            database = self.database_cache.load(source, force=force)
+            loop.call_soon_threadsafe(self._set_database, source, database)
+            return
+
+        Thread(target=_load, daemon=True).start()
+        return
+
+    def _set_database(self, source: str, database: dict) -> None:
+        """Display a loaded resource database."""
+        if source != self._database_source:
+            # The source changed whilst loading, a newer load will update it
+            return
+        database_widget = self.resource_widget.comp_resources_database
+        with database_widget.hold_trait_notifications():
+            database_widget.database = database
+            database_widget.domain_selector.options = database.keys()
+        database_widget.reset()
         return
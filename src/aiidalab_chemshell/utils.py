@@ -40,6 +40,24 @@ def get_app_dir() -> pathlib.Path:
     )
 
 
+def get_cache_dir() -> pathlib.Path:
+    """
+    Return the directory used to cache app data between sessions.
+
+    The directory is placed under ``$XDG_CACHE_HOME`` (defaulting to
+    ``~/.cache``) and is created if it does not already exist.
+
+    Returns
+    -------
+    pathlib.Path
+        The path to the app's cache directory.
+    """
+    cache_root = getenv("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    cache_dir = pathlib.Path(cache_root) / "aiidalab-chemshell"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def get_chem_shell_params(key: str) -> tuple:
     """
     Return the ChemShell input dictionary keys defined by the aiida-chemshell plugin.
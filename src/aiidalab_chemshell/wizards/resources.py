@@ -3,8 +3,9 @@
 import aiidalab_widgets_base as awb
 import ipywidgets as ipw
 import traitlets as tl
-from aiida.orm import Code, QueryBuilder
 
+from aiidalab_chemshell.common.builders import get_builder_template_cache
+from aiidalab_chemshell.common.code_index import get_code_index
 from aiidalab_chemshell.models.resources import ComputationalResourcesModel
 from aiidalab_chemshell.utils import test_aiida_chemsh_import
 
@@ -46,12 +47,16 @@ class ComputationalResourcesWizardStep(ipw.VBox, awb.WizardAppWidgetStep):
             layout={"width": "80%", "margin": "auto"},
         )
         self.submit_btn.on_click(self._submit)
+        self.model.observe(self._reset_submit, "submitted")
+        self.validation = ipw.HTML("")
+        ipw.dlink((self.model, "validation_message"), (self.validation, "value"))
 
         self.children = [
             # self.header,
             self.guide,
             self.chemsh_warning if not self.chemsh_installed else ipw.HTML(""),
             ResourceSetupBox(model=self.model),
+            self.validation,
             self.submit_btn,
         ]
         return
@@ -68,12 +73,23 @@ class ComputationalResourcesWizardStep(ipw.VBox, awb.WizardAppWidgetStep):
         """Handle the submission of the AiiDA process."""
         if self.model.validate():
             self.model.submitted = True
-            self.submit_btn.disabled = True
-            self.submit_btn.description = "Submitted"
+            # The submission is reset if the inputs are rejected or held back
+            if self.model.submitted:
+                self.submit_btn.disabled = True
+                self.submit_btn.description = "Submitted"
         else:
             print("ERROR: Input Validation Failed")
         return
 
+    def _reset_submit(self, change) -> None:
+        """Allow resubmission if the submission was rejected or held back."""
+        if not change["new"]:
+            self.submit_btn.disabled = False
+            self.submit_btn.description = (
+                "Confirm Submit" if self.model.confirmed else "Submit"
+            )
+        return
+
     def _refresh_widget(self) -> None:
         """Refresh the widget's contents."""
         self.chemsh_installed = test_aiida_chemsh_import()
@@ -117,11 +133,10 @@ class ResourceSetupBox(ipw.VBox):
             icon="refresh",
             layout={"width": "20%"},
         )
-        self.refresh_codes_button.on_click(self.update_codes)
+        self.refresh_codes_button.on_click(self._refresh_codes)
         self.code_box = ipw.HBox(
             layout={"width": "100%"}, children=[self.code, self.refresh_codes_button]
         )
-        self.update_codes()
 
         # tl.link((self.code, "value"), (self.model, "code"))
 
@@ -136,6 +151,20 @@ class ResourceSetupBox(ipw.VBox):
         )
         tl.link((self.ncpus_input, "value"), (self.model, "ncpus"))
 
+        self.auto_select = ipw.Checkbox(
+            value=self.model.auto_select_computer,
+            description="Submit to the least loaded computer",
+            tooltip=(
+                "Choose the ChemShell code on the computer with the shortest "
+                "expected queue wait at submission"
+            ),
+            indent=True,
+            layout=ipw.Layout(width="80%"),
+        )
+        tl.link((self.auto_select, "value"), (self.model, "auto_select_computer"))
+        self.code.observe(self._update_max_cpus, "value")
+        self.update_codes()
+
         self.label = ipw.Text(
             value=self.model.process_label,
             placeholder="Enter process label",
@@ -156,18 +185,32 @@ class ResourceSetupBox(ipw.VBox):
 
         self.children = [
             self.code_box,
+            self.auto_select,
             self.ncpus_input,
             self.label,
             self.description,
         ]
 
     def update_codes(self, _=None) -> None:
-        """Update the list of available codes."""
-        qb = QueryBuilder()
-        qb.append(Code, project=["label", "id"])
-        codes = qb.all()
-        code_labels = [f"{label}" for label, id in codes]
+        """Update the list of available codes, indexing any added or modified."""
+        code_labels = [entry.full_label for entry in get_code_index().refresh()]
         self.code.options = code_labels
-        if code_labels:
+        if code_labels and self.code.value not in code_labels:
             self.code.value = code_labels[0]
         return
+
+    def _refresh_codes(self, _=None) -> None:
+        """Rebuild the code index, including computer changes, and update options."""
+        get_code_index().refresh(full=True)
+        # Cached codes and parameters may have been deleted or relabelled
+        get_builder_template_cache().clear()
+        self.update_codes()
+        return
+
+    def _update_max_cpus(self, change: dict) -> None:
+        """Limit the number of CPUs to the cores available for the chosen code."""
+        entry = get_code_index().get(change["new"])
+        max_cores = entry.max_cores if entry and entry.max_cores else 128
+        self.ncpus_input.max = max_cores
+        self.ncpus_input.value = min(self.ncpus_input.value, max_cores)
+        return
@@ -1,9 +1,17 @@
 """Module for defining widgets/models for viewing process progress and results."""
 
 import ipywidgets as ipw
-from aiidalab_widgets_base import ProcessNodesTreeWidget, WizardAppWidgetStep
+from aiidalab_widgets_base import WizardAppWidgetStep
 
+from aiidalab_chemshell.common.atomic_energies import (
+    ATOMIC_ENERGIES_PROCESS_TYPE,
+    process_atomisation_energy_message,
+)
 from aiidalab_chemshell.common.node_viewers import CustomAiidaNodeViewWidget
+from aiidalab_chemshell.common.process_tree import LazyProcessTreeWidget
+from aiidalab_chemshell.common.remote_files import RemoteFolderWidget
+from aiidalab_chemshell.common.restart import RestartWidget
+from aiidalab_chemshell.common.trajectory import TrajectoryMonitorWidget
 from aiidalab_chemshell.models.results import ResultsModel
 
 
@@ -60,7 +68,7 @@ class ResultsWizardStep(ipw.VBox, WizardAppWidgetStep):
             )
             self.children = [msg]
         else:
-            self.node_tree = ProcessNodesTreeWidget()
+            self.node_tree = LazyProcessTreeWidget()
             ipw.dlink((self.model, "process_uuid"), (self.node_tree, "value"))
             self.node_view = CustomAiidaNodeViewWidget()
             ipw.dlink(
@@ -69,16 +77,76 @@ class ResultsWizardStep(ipw.VBox, WizardAppWidgetStep):
                 transform=lambda nodes: nodes[0] if nodes else None,
             )
 
+            self.restart = RestartWidget()
+            ipw.dlink((self.model, "process_uuid"), (self.restart, "process_uuid"))
+            self.restart.observe(self._follow_restart, "restarted_uuid")
+            self._render_process()
+            self.rendered = True
+        return
+
+    def _render_process(self) -> None:
+        """Render the process specific content."""
+        process = self.model.process
+        if getattr(self, "remote_folder", None) is not None:
+            self.remote_folder.close()
+        self.remote_folder = RemoteFolderWidget(process)
+        working_directory = ipw.Accordion(children=[self.remote_folder])
+        working_directory.set_title(0, "Working Directory")
+        working_directory.selected_index = None
+        self.children = [
+            self.info,
+            self.node_tree,
+            self.node_view,
+            working_directory,
+            self.update_btn,
+        ]
+        self.trajectory_monitor = None
+        self.atomisation_energy = None
+        process_type = getattr(process, "process_type", None) or ""
+        if process_type == ATOMIC_ENERGIES_PROCESS_TYPE:
+            # Shown once the isolated atom calculations complete
+            self.atomisation_energy = ipw.HTML()
+            self._update_atomisation_energy()
             self.children = [
-                self.info,
-                self.node_tree,
-                self.node_view,
+                *self.children[:-1],
+                ipw.HTML("<h4>Atomisation Energy</h4>"),
+                self.atomisation_energy,
                 self.update_btn,
             ]
-            self.rendered = True
+        if process_type.endswith("chemshell.opt"):
+            # Follow the optimisation's convergence whilst it is running
+            self.trajectory_monitor = TrajectoryMonitorWidget(process)
+            self.children = [
+                *self.children[:-1],
+                ipw.HTML("<h4>Optimisation Progress</h4>"),
+                self.trajectory_monitor,
+                self.update_btn,
+                self.restart,
+            ]
+            self.trajectory_monitor.start()
+        return
+
+    def _follow_restart(self, change) -> None:
+        """Switch to a restarted optimisation."""
+        if change["new"]:
+            self.model.process_uuid = change["new"]
+            self._render_process()
         return
 
     def _refresh_info(self, _) -> None:
         """Refresh the process information."""
         self.node_tree.update()
+        if self.trajectory_monitor is not None:
+            self.trajectory_monitor.update()
+        self.remote_folder.update()
+        self.restart.update()
+        self._update_atomisation_energy()
+        return
+
+    def _update_atomisation_energy(self) -> None:
+        """Show the atomisation energy of an isolated atom workflow's structure."""
+        process = self.model.process
+        if self.atomisation_energy is not None and process is not None:
+            message = process_atomisation_energy_message(process)
+            self.atomisation_energy.value = f"<p>{message}</p>"
         return
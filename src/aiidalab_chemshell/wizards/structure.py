@@ -1,5 +1,7 @@
 """Defines the model and view components for the structure setup stage."""
 
+import html
+
 import ase
 import ipywidgets as ipw
 from aiida.orm import SinglefileData, StructureData
@@ -7,6 +9,14 @@ from aiidalab_widgets_base import SmilesWidget, WizardAppWidgetStep
 
 from aiidalab_chemshell.common.database import AiiDADatabaseWidget
 from aiidalab_chemshell.common.file_handling import FileUploadWidget
+from aiidalab_chemshell.common.fingerprint import (
+    FINGERPRINT_EXTRA,
+    completed_calculations,
+    find_duplicates,
+)
+from aiidalab_chemshell.common.smiles import SmilesBatchWidget
+from aiidalab_chemshell.common.structure_ingest import StructureIngestWidget
+from aiidalab_chemshell.common.structure_metadata import set_structure_metadata
 from aiidalab_chemshell.common.structure_viewer import StructureViewWidget
 from aiidalab_chemshell.models.structure import StructureInputModel
 
@@ -60,15 +70,26 @@ class StructureWizardStep(ipw.VBox, WizardAppWidgetStep):
 
         self.smiles_widget = SmilesWidget(title="SMILES")
 
+        # Batch of structures
+        self.ingest_widget = StructureIngestWidget()
+        ipw.dlink((self.ingest_widget, "group"), (self.model, "structure_group"))
+        self.smiles_batch_widget = SmilesBatchWidget()
+        ipw.dlink((self.smiles_batch_widget, "group"), (self.model, "structure_group"))
+
         self.tabs.children = [
             self.file_input_widget,
             self.database_widget,
             self.smiles_widget,
+            self.ingest_widget,
+            self.smiles_batch_widget,
         ]
-        for i, title in enumerate(["Upload File", "AiiDA Database", "SMILES String"]):
+        for i, title in enumerate(
+            ["Upload File", "AiiDA Database", "SMILES String", "Batch", "SMILES Batch"]
+        ):
             self.tabs.set_title(i, title)
 
         self.model.observe(self._on_file_upload, "structure_file")
+        self.model.observe(self._on_group_ingest, "structure_group")
         self.database_widget.observe(self._on_database_search, "data_object")
         self.smiles_widget.observe(self._on_smiles_generation, "structure")
 
@@ -88,8 +109,24 @@ class StructureWizardStep(ipw.VBox, WizardAppWidgetStep):
         self.submit_btn.on_click(self.submit_structure)
         self.viewer = ipw.HTML("<p>No structure found...</p>")
 
-        self._update_children()
+        self.duplicate = None
+        self.duplicate_info = ipw.HTML()
+        self.use_duplicate_btn = ipw.Button(
+            description="Use Existing Structure",
+            button_style="info",
+            tooltip="Use the identical structure already in the database",
+            icon="link",
+            layout={"margin": "auto", "display": "none"},
+        )
+        self.use_duplicate_btn.on_click(self._use_duplicate)
+
         self.rendered = True
+        # Show any structure restored from a previous session
+        if self.model.has_structure:
+            self._create_viewer(self.model.structure.get_ase())
+        self._on_file_upload({})
+        self._on_group_ingest({})
+        self._update_children()
         return
 
     def _update_children(self) -> None:
@@ -99,12 +136,14 @@ class StructureWizardStep(ipw.VBox, WizardAppWidgetStep):
             ipw.HTML("<h2>Viewer:</h2>"),
             self.viewer,
             self.submit_btn,
+            self.duplicate_info,
+            self.use_duplicate_btn,
         ]
         return
 
     def _on_file_upload(self, change: dict) -> None:
         """When file upload button is pressed."""
-        if self.model.has_file:
+        if self.rendered and self.model.has_file:
             self.viewer = StructureViewWidget()
             self.viewer.assign_structure_from_file(
                 self.model.structure_file.filename, self.model.structure_file.content
@@ -112,6 +151,16 @@ class StructureWizardStep(ipw.VBox, WizardAppWidgetStep):
             self._update_children()
         return
 
+    def _on_group_ingest(self, _) -> None:
+        """When a batch of structures is loaded into a group."""
+        if self.rendered and self.model.has_group:
+            self.viewer = ipw.HTML(
+                f"<p>Batch of {self.model.structure_group.count()} structures in "
+                f"group '{self.model.structure_group.label}'.</p>"
+            )
+            self._update_children()
+        return
+
     def _on_smiles_generation(self, change: dict) -> None:
         """When SMILES string is inputted."""
         if change["new"] != change["old"]:
@@ -148,12 +197,66 @@ class StructureWizardStep(ipw.VBox, WizardAppWidgetStep):
 
     def submit_structure(self, _):
         """Submit the structure step."""
-        if self.model.has_file or self.model.has_structure:
+        if self.model.has_file or self.model.has_structure or self.model.has_group:
             self.file_uploader.disable(True)
             self.database_widget.disable(True)
+            self.ingest_widget.disable(True)
+            self.smiles_batch_widget.disable(True)
             self.submit_btn.disabled = True
             self.submit_btn.description = "Submitted"
             self.model.submitted = True
+            self._check_duplicate()
         else:
             self.model.submitted = False
         return
+
+    def _check_duplicate(self) -> None:
+        """Point the user to an identical structure already in the database."""
+        self.duplicate = None
+        self.duplicate_info.value = ""
+        self.use_duplicate_btn.layout.display = "none"
+        if self.model.has_file:
+            structure = self.model.structure_file
+        elif self.model.has_structure:
+            structure = self.model.structure
+        else:
+            return
+        fingerprint = set_structure_metadata(structure).get(FINGERPRINT_EXTRA)
+        if fingerprint is None:
+            return
+        duplicates = find_duplicates(fingerprint, exclude=structure)
+        if not duplicates:
+            return
+        self.duplicate = duplicates[0]
+        calculations = completed_calculations(self.duplicate)
+        items = "".join(
+            f"<li>&lt;{node.pk}&gt; {html.escape(node.process_label or '')} "
+            f"{html.escape(node.label)}</li>"
+            for node in calculations[:10]
+        )
+        summary = (
+            f"<p>It has {len(calculations)} completed calculations, view them on "
+            f"the History page:</p><ul>{items}</ul>"
+            if calculations
+            else "<p>It has no completed calculations.</p>"
+        )
+        self.duplicate_info.value = (
+            f"<p>This structure is already stored as node &lt;{self.duplicate.pk}&gt;"
+            f" ({html.escape(self.duplicate.label or 'unlabelled')}).</p>{summary}"
+        )
+        self.use_duplicate_btn.layout.display = None
+        return
+
+    def _use_duplicate(self, _=None) -> None:
+        """Use the existing identical structure instead of the new one."""
+        if self.duplicate is None:
+            return
+        if isinstance(self.duplicate, SinglefileData):
+            self.model.structure_file = self.duplicate
+        else:
+            self.model.structure = self.duplicate
+        self.use_duplicate_btn.layout.display = "none"
+        self.duplicate_info.value = (
+            f"<p>Using the existing structure node &lt;{self.duplicate.pk}&gt;.</p>"
+        )
+        return
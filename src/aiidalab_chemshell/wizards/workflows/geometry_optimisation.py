@@ -73,7 +73,7 @@ class ChemShellOptionsWidget(ipw.VBox):
             raise e
 
     def _enable_mm_options(self, _) -> None:
-        self._render_input_options({"new": self.advanced_options.value})
+        self._render_options()
         return
 
     # def _update_basis_quality(self, _) -> None:
@@ -86,8 +86,10 @@ class ChemShellOptionsWidget(ipw.VBox):
             return
         self.rendered = True
 
+        # A basis set without a simplified level is only shown in advanced view
+        basis_quality = BasisSetOptions.from_label(self.model.basis_set)
         self.advanced_options = ipw.Checkbox(
-            value=False, description="Show Advanced Options", index=True
+            value=basis_quality is None, description="Show Advanced Options", index=True
         )
         self.advanced_options.observe(self._render_input_options, "value")
 
@@ -102,12 +104,12 @@ class ChemShellOptionsWidget(ipw.VBox):
         # Basis Quality
         self.basis_dropdown = ipw.Dropdown(
             options={e.name: e for e in BasisSetOptions},
+            value=basis_quality or BasisSetOptions.BALANCED,
             description="Basis Quality:",
             disabled=False,
             layout={"width": "50%"},
         )
         self.basis_dropdown.observe(self._update_basis_set, "value")
-        self.basis_dropdown.index = 1
 
         self.basis_string = ipw.Text(
             value="",
@@ -133,20 +135,18 @@ class ChemShellOptionsWidget(ipw.VBox):
 
         # Enable vibrational analysis
         self.enable_vib = ipw.Checkbox(
-            value=True, description="Vibrational Frequencies", index=True
+            description="Vibrational Frequencies", index=True
         )
-        ipw.dlink((self.enable_vib, "value"), (self.model, "vibrational_analysis"))
+        link((self.model, "vibrational_analysis"), (self.enable_vib, "value"))
 
         # DFT checkbox
         # self.enable_dft = ipw.Checkbox(value=False, description="Use DFT", index=True)
         # ipw.dlink((self.enable_dft, "value"), (self.model, "use_dft"))
 
         # QM/MM Checkbox
-        self.enable_mm_chk = ipw.Checkbox(
-            value=False, description="Use QM/MM", indent=True
-        )
+        self.enable_mm_chk = ipw.Checkbox(description="Use QM/MM", indent=True)
+        link((self.model, "use_mm"), (self.enable_mm_chk, "value"))
         self.enable_mm_chk.observe(self._enable_mm_options, "value")
-        ipw.dlink((self.enable_mm_chk, "value"), (self.model, "use_mm"))
 
         # MM Backend
         # self.mm_theory_dropdown = ipw.Dropdown(
@@ -163,9 +163,9 @@ class ChemShellOptionsWidget(ipw.VBox):
             disabled=True,
             layout={"width": "50%"},
         )
-        link((self.qm_region_text, "value"), (self.model, "qm_region"))
+        link((self.model, "qm_region"), (self.qm_region_text, "value"))
 
-        self._render_input_options({"new": self.advanced_options.value})
+        self._render_options()
         return
 
     def _render_basic_options(self) -> None:
@@ -200,12 +200,18 @@ class ChemShellOptionsWidget(ipw.VBox):
         self.children = children
         return
 
-    def _render_input_options(self, change: dict) -> None:
-        """Switch between basic and advanced views."""
-        if change["new"]:
+    def _render_options(self, _=None) -> None:
+        """Render the selected view without changing the basis set."""
+        if self.advanced_options.value:
             self._render_advanced_options()
         else:
             self._render_basic_options()
+        return
+
+    def _render_input_options(self, change: dict) -> None:
+        """Switch between basic and advanced views."""
+        self._render_options()
+        if not change["new"]:
             # Update the linked basis set value
             self._update_basis_set({"new": self.basis_dropdown.value, "old": None})
         return
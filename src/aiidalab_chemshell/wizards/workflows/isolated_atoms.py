@@ -44,18 +44,20 @@ class IsolatedAtomEnergyWidget(VBox):
             return
         self.rendered = True
 
+        # A basis set without a simplified level is only shown in advanced view
+        basis_quality = BasisSetOptions.from_label(self.model.basis_set)
         self.advanced_options = Checkbox(
-            value=False, description="Show Advanced Options", index=True
+            value=basis_quality is None, description="Show Advanced Options", index=True
         )
         self.advanced_options.observe(self._render_input_options, "value")
 
         self.basis_dropdown = Dropdown(
             options={e.name: e for e in BasisSetOptions},
+            value=basis_quality or BasisSetOptions.BALANCED,
             description="Basis Quality:",
             disabled=False,
             layout={"width": "50%"},
         )
-        self.basis_dropdown.index = 1
         self.basis_dropdown.observe(self._update_basis_set, "value")
         # link((self.model, "basis_quality"), (self.basis_dropdown, "value"))
 
@@ -81,7 +83,10 @@ class IsolatedAtomEnergyWidget(VBox):
         )
         link((self.model, "functional"), (self.functional, "value"))
 
-        self._render_basic_options()
+        if self.advanced_options.value:
+            self._render_advanced_options()
+        else:
+            self._render_basic_options()
         return
 
     def _render_basic_options(self) -> None:
@@ -9,6 +9,8 @@ from aiidalab_chemshell.wizards.workflows.geometry_optimisation import (
     ChemShellOptionsWidget,
 )
 from aiidalab_chemshell.wizards.workflows.isolated_atoms import IsolatedAtomEnergyWidget
+from aiidalab_chemshell.wizards.workflows.neb import NEBWidget
+from aiidalab_chemshell.wizards.workflows.screening import ScreeningWidget
 from aiidalab_chemshell.wizards.workflows.single_point import SinglePointCalcWidget
 
 
@@ -64,9 +66,9 @@ class WorkflowWizardStep(ipw.VBox, awb.WizardAppWidgetStep):
         # Link necessary inputs to model
         # ipw.dlink((self.workflow_tabs, "selected_index"), (self.model, "workflow"))
         self.workflow_tabs.observe(self._update_selected_workflow, "selected_index")
-        ipw.dlink(
-            (self.workflow_tabs.children[0].ff_file, "file"),
+        ipw.link(
             (self.model, "force_field"),
+            (self.workflow_tabs.children[0].ff_file, "file"),
         )
 
         # Create a submit button for the bottom of the wizard
@@ -115,6 +117,10 @@ class WorkflowWizardStep(ipw.VBox, awb.WizardAppWidgetStep):
                 return IsolatedAtomEnergyWidget(self.model)
             case WorkflowOptions.SINGLE_POINT:
                 return SinglePointCalcWidget(self.model)
+            case WorkflowOptions.NEB:
+                return NEBWidget(self.model)
+            case WorkflowOptions.SCREENING:
+                return ScreeningWidget(self.model)
             case _:
                 return ipw.VBox()
 
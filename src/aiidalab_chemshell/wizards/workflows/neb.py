@@ -1 +1,192 @@
 """Defines the input widget for the nudged elastic band workflow."""
+
+from aiida.orm import SinglefileData
+from aiida_chemshell.utils import ChemShellQMTheory
+from ipywidgets import HTML, BoundedIntText, Checkbox, Dropdown, FloatText, Text, VBox
+from traitlets import link
+
+from aiidalab_chemshell.common.chemshell import BasisSetOptions, NEBExecutionOptions
+from aiidalab_chemshell.common.file_handling import FileUploadWidget
+from aiidalab_chemshell.common.utils import LoadingWidget
+from aiidalab_chemshell.models.workflow import ChemShellWorkflowModel
+
+
+class NEBWidget(VBox):
+    """Widget for specifying ChemShell nudged elastic band inputs."""
+
+    def __init__(self, model: ChemShellWorkflowModel, **kwargs):
+        """
+        NEBWidget constructor.
+
+        Parameters
+        ----------
+        model : ChemShellWorkflowModel
+            The model that defines the data related to this step in the setup wizard.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.model = model
+        self.rendered = False
+        self.header = HTML(
+            """
+            <h3 style="text-align: center;">Nudged Elastic Band</h3>
+            <p>
+                Explore the path between the input structure (the reactant) and a
+                product structure with the atoms in the same order. Either the
+                images of an interpolated path are calculated concurrently as
+                independent single points, scanning the energy along the fixed
+                path, or the end points are passed to a DL-FIND NEB optimisation
+                of the minimum energy path.
+            </p>
+            """,
+        )
+        self.children = [self.header, LoadingWidget()]
+        return
+
+    def render(self) -> None:
+        """Render the widget."""
+        if self.rendered:
+            return
+        self.rendered = True
+
+        # A basis set without a simplified level is only shown in advanced view
+        basis_quality = BasisSetOptions.from_label(self.model.basis_set)
+        self.advanced_options = Checkbox(
+            value=basis_quality is None, description="Show Advanced Options", index=True
+        )
+        self.advanced_options.observe(self._render_input_options, "value")
+
+        # Only uploads replace the product, which may be a restored structure
+        self.product_file = FileUploadWidget(description="Product:")
+        if isinstance(self.model.product_structure, SinglefileData):
+            self.product_file.file = self.model.product_structure
+        self.product_file.observe(self._update_product, "file")
+
+        self.images = BoundedIntText(
+            min=1, max=64, description="Images:", layout={"width": "50%"}
+        )
+        link((self.model, "neb_images"), (self.images, "value"))
+        self.interpolation = Dropdown(
+            options={"IDPP": "idpp", "Linear": "linear"},
+            description="Interpolation:",
+            layout={"width": "50%"},
+        )
+        link((self.model, "neb_interpolation"), (self.interpolation, "value"))
+        self.execution = Dropdown(
+            options={e.label: e for e in NEBExecutionOptions},
+            description="Run As:",
+            layout={"width": "50%"},
+        )
+        link((self.model, "neb_execution"), (self.execution, "value"))
+        self.execution.observe(self._render_execution_options, "value")
+        self.neb_type = Dropdown(
+            options=["frozen", "free", "perpendicular"],
+            description="NEB Type:",
+            layout={"width": "50%"},
+        )
+        link((self.model, "neb_type"), (self.neb_type, "value"))
+        self.spring = FloatText(description="Spring (a.u.):", layout={"width": "50%"})
+        link((self.model, "neb_spring"), (self.spring, "value"))
+
+        self.basis_dropdown = Dropdown(
+            options={e.name: e for e in BasisSetOptions},
+            value=basis_quality or BasisSetOptions.BALANCED,
+            description="Basis Quality:",
+            disabled=False,
+            layout={"width": "50%"},
+        )
+        self.basis_dropdown.observe(self._update_basis_set, "value")
+        self.basis_string = Text(
+            value="",
+            description="Basis Set:",
+            disabled=False,
+            layout={"width": "50%"},
+        )
+        link((self.model, "basis_set"), (self.basis_string, "value"))
+        self.backend = Dropdown(
+            options={e.name: e for e in ChemShellQMTheory},
+            description="QM Backend:",
+            disabled=False,
+            layout={"width": "50%"},
+        )
+        link((self.model, "qm_theory"), (self.backend, "value"))
+        self.functional = Text(
+            value="B3LYP",
+            description="Functional:",
+            disabled=False,
+            layout={"width": "50%"},
+        )
+        link((self.model, "functional"), (self.functional, "value"))
+
+        self._render_execution_options()
+        return
+
+    def _render_basic_options(self) -> None:
+        """Render the simplified input options view."""
+        self.children = [
+            self.header,
+            self.advanced_options,
+            self.product_file,
+            self.images,
+            self.execution,
+            self.basis_dropdown,
+        ]
+        return
+
+    def _render_advanced_options(self) -> None:
+        """Render the advanced input options view."""
+        # DL-FIND interpolates its own images, so only the fixed path is
+        # interpolated by the app and the NEB options only apply to DL-FIND
+        if self.model.neb_execution == NEBExecutionOptions.IMAGES:
+            execution_options = [self.interpolation]
+        else:
+            execution_options = [self.neb_type, self.spring]
+        self.children = [
+            self.header,
+            self.advanced_options,
+            self.product_file,
+            self.images,
+            self.execution,
+            *execution_options,
+            self.backend,
+            self.basis_string,
+            self.functional,
+        ]
+        return
+
+    def _render_execution_options(self, _=None) -> None:
+        """Render the selected view with the options of the execution mode."""
+        if self.advanced_options.value:
+            self._render_advanced_options()
+        else:
+            self._render_basic_options()
+        return
+
+    def _render_input_options(self, change: dict) -> None:
+        """Switch between basic and advanced views."""
+        if change["new"]:
+            self._render_advanced_options()
+        else:
+            self._render_basic_options()
+            # Update the linked basis set value
+            self._update_basis_set({"new": self.basis_dropdown.value, "old": None})
+        return
+
+    def _update_product(self, change: dict) -> None:
+        """Use an uploaded product structure."""
+        self.model.product_structure = change["new"]
+        return
+
+    def _update_basis_set(self, change: dict) -> None:
+        """Update the basis set based of the simplified input options."""
+        if change["new"] == change["old"]:
+            return
+        self.model.basis_set = change["new"].label
+        return
+
+    def disable(self, disable: bool = True) -> None:
+        """Disable/Enable the wigets input options."""
+        for child in self.children:
+            child.disabled = disable
+        return
@@ -0,0 +1,140 @@
+"""Defines the input widget for the multi-level basis set screening workflow."""
+
+from aiida_chemshell.utils import ChemShellQMTheory
+from ipywidgets import (
+    HTML,
+    BoundedFloatText,
+    BoundedIntText,
+    Checkbox,
+    Dropdown,
+    Text,
+    VBox,
+)
+from traitlets import link
+
+from aiidalab_chemshell.common.utils import LoadingWidget
+from aiidalab_chemshell.models.workflow import ChemShellWorkflowModel
+
+
+class ScreeningWidget(VBox):
+    """Widget for specifying the basis set screening inputs."""
+
+    def __init__(self, model: ChemShellWorkflowModel, **kwargs):
+        """
+        ScreeningWidget constructor.
+
+        Parameters
+        ----------
+        model : ChemShellWorkflowModel
+            The model that defines the data related to this step in the setup wizard.
+        **kwargs :
+            Keyword arguments passed to the parent class's constructor.
+        """
+        super().__init__(**kwargs)
+        self.model = model
+        self.rendered = False
+        self.header = HTML(
+            """
+            <h3 style="text-align: center;">Basis Set Screening</h3>
+            <p>
+                Calculate every structure of the input group with the cheapest
+                basis set, then promote only the lowest energy structures to each
+                more expensive basis set in turn. A zero energy window or count
+                keeps every structure at that filter.
+            </p>
+            """,
+        )
+        self.children = [self.header, LoadingWidget()]
+        return
+
+    def render(self) -> None:
+        """Render the widget."""
+        if self.rendered:
+            return
+        self.rendered = True
+
+        self.advanced_options = Checkbox(
+            value=False, description="Show Advanced Options", index=True
+        )
+        self.advanced_options.observe(self._render_input_options, "value")
+
+        self.basis_sets = Text(
+            description="Basis Sets:",
+            placeholder="Comma separated, cheapest first",
+            layout={"width": "80%"},
+        )
+        link((self.model, "screening_basis_sets"), (self.basis_sets, "value"))
+        self.window = BoundedFloatText(
+            min=0.0,
+            max=1e6,
+            description="Window (kJ/mol):",
+            style={"description_width": "initial"},
+            layout={"width": "50%"},
+        )
+        link((self.model, "screening_window"), (self.window, "value"))
+        self.top_n = BoundedIntText(
+            min=0,
+            max=100000,
+            description="Keep Lowest:",
+            layout={"width": "50%"},
+        )
+        link((self.model, "screening_top_n"), (self.top_n, "value"))
+        self.optimise = Checkbox(description="Optimise At Each Level", indent=True)
+        link((self.model, "screening_optimise"), (self.optimise, "value"))
+
+        self.backend = Dropdown(
+            options={e.name: e for e in ChemShellQMTheory},
+            description="QM Backend:",
+            disabled=False,
+            layout={"width": "50%"},
+        )
+        link((self.model, "qm_theory"), (self.backend, "value"))
+        self.functional = Text(
+            value="B3LYP",
+            description="Functional:",
+            disabled=False,
+            layout={"width": "50%"},
+        )
+        link((self.model, "functional"), (self.functional, "value"))
+
+        self._render_basic_options()
+        return
+
+    def _render_basic_options(self) -> None:
+        """Render the simplified input options view."""
+        self.children = [
+            self.header,
+            self.advanced_options,
+            self.basis_sets,
+            self.window,
+            self.top_n,
+        ]
+        return
+
+    def _render_advanced_options(self) -> None:
+        """Render the advanced input options view."""
+        self.children = [
+            self.header,
+            self.advanced_options,
+            self.basis_sets,
+            self.window,
+            self.top_n,
+            self.optimise,
+            self.backend,
+            self.functional,
+        ]
+        return
+
+    def _render_input_options(self, change: dict) -> None:
+        """Switch between basic and advanced views."""
+        if change["new"]:
+            self._render_advanced_options()
+        else:
+            self._render_basic_options()
+        return
+
+    def disable(self, disable: bool = True) -> None:
+        """Disable/Enable the wigets input options."""
+        for child in self.children:
+            child.disabled = disable
+        return
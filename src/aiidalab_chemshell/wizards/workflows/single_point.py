@@ -1,7 +1,7 @@
 """Defines the input widget for the a base single point energy calculation."""
 
 from aiida_chemshell.utils import ChemShellQMTheory
-from ipywidgets import HTML, Checkbox, Dropdown, HBox, Text, VBox, dlink
+from ipywidgets import HTML, Checkbox, Dropdown, HBox, Text, VBox
 from traitlets import Bool, HasTraits, link
 
 from aiidalab_chemshell.common.chemshell import BasisSetOptions
@@ -47,19 +47,21 @@ class SinglePointCalcWidget(VBox):
             return
         self.rendered = True
 
+        # A basis set without a simplified level is only shown in advanced view
+        basis_quality = BasisSetOptions.from_label(self.model.basis_set)
         self.advanced_options = Checkbox(
-            value=False, description="Show Advanced Options", index=True
+            value=basis_quality is None, description="Show Advanced Options", index=True
         )
         self.advanced_options.observe(self._render_input_options, "value")
 
         self.basis_dropdown = Dropdown(
             options={e.name: e for e in BasisSetOptions},
+            value=basis_quality or BasisSetOptions.BALANCED,
             description="Basis Quality:",
             disabled=False,
             layout={"width": "50%"},
         )
         self.basis_dropdown.observe(self._update_basis_set, "value")
-        self.basis_dropdown.index = 1
 
         self.basis_string = Text(
             value="",
@@ -85,14 +87,12 @@ class SinglePointCalcWidget(VBox):
 
         self.derivatives = DerivativeOptions(self.model)
 
-        self.enable_vib = Checkbox(
-            value=False, description="Vibrational Frequencies", index=True
-        )
-        dlink((self.enable_vib, "value"), (self.model, "vibrational_analysis"))
+        self.enable_vib = Checkbox(description="Vibrational Frequencies", index=True)
+        link((self.model, "vibrational_analysis"), (self.enable_vib, "value"))
 
-        self.enable_mm_chk = Checkbox(value=False, description="Use QM/MM", indent=True)
+        self.enable_mm_chk = Checkbox(description="Use QM/MM", indent=True)
+        link((self.model, "use_mm"), (self.enable_mm_chk, "value"))
         self.enable_mm_chk.observe(self._enable_mm_options, "value")
-        dlink((self.enable_mm_chk, "value"), (self.model, "use_mm"))
 
         # MM Backend
         # self.mm_theory_dropdown = ipw.Dropdown(
@@ -109,13 +109,13 @@ class SinglePointCalcWidget(VBox):
             disabled=False,
             layout={"width": "50%"},
         )
-        link((self.qm_region_text, "value"), (self.model, "qm_region"))
+        link((self.model, "qm_region"), (self.qm_region_text, "value"))
 
         # Force Field File
         self.ff_file = FileUploadWidget(description="Force Field:")
-        link((self.ff_file, "file"), (self.model, "force_field"))
+        link((self.model, "force_field"), (self.ff_file, "file"))
 
-        self._render_basic_options()
+        self._render_options()
 
     def _render_basic_options(self) -> None:
         """Render the simplified input options view."""
@@ -151,12 +151,18 @@ class SinglePointCalcWidget(VBox):
         self.children = children
         return
 
-    def _render_input_options(self, change: dict) -> None:
-        """Switch between basic and advanced views."""
-        if change["new"]:
+    def _render_options(self, _=None) -> None:
+        """Render the selected view without changing the basis set."""
+        if self.advanced_options.value:
             self._render_advanced_options()
         else:
             self._render_basic_options()
+        return
+
+    def _render_input_options(self, change: dict) -> None:
+        """Switch between basic and advanced views."""
+        self._render_options()
+        if not change["new"]:
             # Update the linked basis set value
             self._update_basis_set({"new": self.basis_dropdown.value, "old": None})
         return
@@ -175,7 +181,7 @@ class SinglePointCalcWidget(VBox):
         return
 
     def _enable_mm_options(self, _) -> None:
-        self._render_input_options({"new": self.advanced_options.value})
+        self._render_options()
         return
 
 
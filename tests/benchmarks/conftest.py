@@ -0,0 +1,149 @@
+"""Fixtures populating a temporary AiiDA profile for the benchmark suite."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pytest
+from aiida.common.links import LinkType
+from aiida.engine import ProcessState
+from aiida.orm import (
+    ArrayData,
+    CalcJobNode,
+    Computer,
+    Float,
+    InstalledCode,
+    Node,
+    SinglefileData,
+    StructureData,
+    WorkChainNode,
+)
+
+_WATER = (
+    ("O", (0.0, 0.0, 0.0)),
+    ("H", (0.757, 0.586, 0.0)),
+    ("H", (-0.757, 0.586, 0.0)),
+)
+
+
+@dataclass
+class BenchmarkDatabase:
+    """References to the synthetic nodes stored in the benchmark profile."""
+
+    code: InstalledCode
+    structures: list[StructureData] = field(default_factory=list)
+    structure_files: list[SinglefileData] = field(default_factory=list)
+    processes: list[WorkChainNode] = field(default_factory=list)
+    outputs: dict[str, Node] = field(default_factory=dict)
+
+
+def _water_cluster(nmolecules: int, rng: np.random.Generator) -> list[tuple]:
+    """Return a list of (symbol, position) tuples for a random water cluster."""
+    atoms = []
+    for offset in rng.uniform(-5.0, 5.0, size=(nmolecules, 3)):
+        for symbol, position in _WATER:
+            atoms.append((symbol, tuple(np.asarray(position) + offset)))
+    return atoms
+
+
+def _xyz_content(atoms: list[tuple]) -> bytes:
+    """Convert (symbol, position) tuples into the contents of an xyz file."""
+    lines = [str(len(atoms)), "Benchmark structure"]
+    lines += [f"{s} {p[0]:.6f} {p[1]:.6f} {p[2]:.6f}" for s, p in atoms]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _create_process(
+    index: int, structure: Node, rng: np.random.Generator, db: BenchmarkDatabase
+) -> None:
+    """Store a finished ChemShell-like WorkChain/CalcJob pair with outputs."""
+    workchain = WorkChainNode(process_type="aiida.workflows:chemshell.opt")
+    workchain.label = f"benchmark-{index % 5}"
+    workchain.base.links.add_incoming(structure, LinkType.INPUT_WORK, "structure")
+    workchain.set_process_state(ProcessState.FINISHED)
+    workchain.set_exit_status(0)
+    workchain.store()
+
+    calcjob = CalcJobNode(
+        computer=db.code.computer, process_type="aiida.calculations:chemshell"
+    )
+    calcjob.label = workchain.label
+    calcjob.set_option("resources", {"num_machines": 1})
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.base.links.add_incoming(db.code, LinkType.INPUT_CALC, "code")
+    calcjob.base.links.add_incoming(workchain, LinkType.CALL_CALC, "CALL")
+    calcjob.set_process_state(ProcessState.FINISHED)
+    calcjob.set_exit_status(0)
+    calcjob.store()
+
+    natoms = len(structure.sites) if isinstance(structure, StructureData) else 30
+    energy = Float(rng.uniform(-500.0, -50.0), label="Final SCF Energy")
+    gradients = ArrayData(label="Energy Derivative Arrays")
+    gradients.set_array("gradients", rng.normal(size=(natoms, 3)))
+    modes = ArrayData(label="Vibrational Modes")
+    modes.set_array("Modes", np.abs(rng.normal(size=(3 * natoms - 6, 5))))
+    optimised = SinglefileData.from_string(
+        _xyz_content(_water_cluster(natoms // 3, rng)).decode(),
+        filename="optimised.xyz",
+    )
+    optimised.label = "Optimised Structure"
+    for link_label, output in (
+        ("energy", energy),
+        ("gradients", gradients),
+        ("vibrational_modes", modes),
+        ("optimised_structure", optimised),
+    ):
+        output.base.links.add_incoming(calcjob, LinkType.CREATE, link_label)
+        output.store()
+        db.outputs.setdefault(link_label, output)
+    db.processes.append(workchain)
+    return
+
+
+@pytest.fixture(scope="session")
+def bench_database(aiida_profile, pytestconfig) -> BenchmarkDatabase:
+    """Populate the temporary profile with synthetic structures and processes."""
+    rng = np.random.default_rng(2024)
+    computer = Computer(
+        label="bench-localhost",
+        hostname="localhost",
+        transport_type="core.local",
+        scheduler_type="core.direct",
+        workdir="/tmp/aiidalab-chemshell-bench",
+    ).store()
+    computer.set_minimum_job_poll_interval(0.0)
+    computer.set_default_mpiprocs_per_machine(8)
+    code = InstalledCode(
+        label="chemsh-bench",
+        computer=computer,
+        filepath_executable="/bin/true",
+        default_calc_job_plugin="chemshell",
+    ).store()
+    db = BenchmarkDatabase(code=code)
+    for index in range(20):
+        InstalledCode(
+            label=f"other-{index}",
+            computer=computer,
+            filepath_executable="/bin/true",
+            default_calc_job_plugin="core.arithmetic.add",
+        ).store()
+
+    nstructures = pytestconfig.getoption("--bench-structures")
+    for index in range(nstructures):
+        atoms = _water_cluster(int(rng.integers(1, 10)), rng)
+        if index % 2:
+            structure = SinglefileData.from_string(
+                _xyz_content(atoms).decode(), filename=f"structure_{index}.xyz"
+            )
+            structure.label = f"Structure {index}"
+            db.structure_files.append(structure.store())
+        else:
+            structure = StructureData(pbc=(False, False, False))
+            for symbol, position in atoms:
+                structure.append_atom(position=position, symbols=symbol)
+            db.structures.append(structure.store())
+
+    nprocesses = pytestconfig.getoption("--bench-processes")
+    inputs = db.structures + db.structure_files
+    for index in range(nprocesses if inputs else 0):
+        _create_process(index, inputs[index % len(inputs)], rng, db)
+    return db
@@ -0,0 +1,38 @@
+"""Benchmarks for the AiiDA database search widget."""
+
+import pytest
+
+from aiidalab_chemshell.common.database import AiiDADatabaseWidget
+
+
+@pytest.fixture(scope="module")
+def structure_search(bench_database):
+    """Return a structure search widget attached to the benchmark profile."""
+    from aiida.orm import SinglefileData, StructureData
+
+    return AiiDADatabaseWidget(query=[SinglefileData, StructureData])
+
+
+@pytest.mark.parametrize("mode", ["all", "uploaded", "calculated"])
+def test_search_structures(benchmark, structure_search, mode):
+    """Time a structure search in each of the selectable modes."""
+    structure_search.mode.value = mode
+    benchmark(structure_search.search)
+    assert len(structure_search.results.options) > 1
+
+
+def test_search_calculated_by_label(benchmark, structure_search):
+    """Time a calculated structure search filtered by process label."""
+    structure_search.mode.value = "calculated"
+    structure_search.drop_down.value = "benchmark-0"
+    benchmark(structure_search.search)
+    assert len(structure_search.results.options) > 1
+
+
+def test_search_processes(benchmark, bench_database):
+    """Time a process search as used by the history page."""
+    from aiida.orm import CalcJobNode, WorkChainNode
+
+    widget = AiiDADatabaseWidget(query=[CalcJobNode, WorkChainNode])
+    benchmark(widget.search)
+    assert len(widget.results.options) > len(bench_database.processes)
@@ -0,0 +1,39 @@
+"""Benchmarks for the ChemShell process builder construction."""
+
+import pytest
+
+from aiidalab_chemshell.common.chemshell import WorkflowOptions
+from aiidalab_chemshell.process import ChemShellProcess, MainAppModel
+
+QM_REGION = ", ".join(f"{i}-{i + 8}" for i in range(0, 2000, 10))
+
+
+def test_extract_qm_region(benchmark):
+    """Time expanding a long QM region specification."""
+    qm_region = benchmark(ChemShellProcess._extract_qm_region, QM_REGION)
+    assert len(qm_region) == 1800
+
+
+@pytest.fixture
+def app_model(bench_database):
+    """Return a fully populated main application model."""
+    model = MainAppModel()
+    model.structure_model.structure = bench_database.structures[0]
+    model.resource_model.code_label = bench_database.code.full_label
+    model.resource_model.process_label = "benchmark"
+    return model
+
+
+@pytest.mark.parametrize(
+    ("workflow", "method"),
+    [
+        (WorkflowOptions.SINGLE_POINT, "_build_core_calcjob"),
+        (WorkflowOptions.GEOMETRY, "_build_optimisation_workflow"),
+        (WorkflowOptions.ATOMIC_ENERGIES, "_build_atomic_energies_workflow"),
+    ],
+)
+def test_build_process(benchmark, app_model, workflow, method):
+    """Time the construction of the process builder for each workflow."""
+    app_model.workflow_model.workflow = workflow
+    process = ChemShellProcess(app_model)
+    assert benchmark(getattr(process, method)) is not None
@@ -0,0 +1,29 @@
+"""Benchmarks for the computational resources setup components."""
+
+from aiidalab_chemshell.common.code_index import CodeIndex, get_code_index
+from aiidalab_chemshell.models.resources import ComputationalResourcesModel
+from aiidalab_chemshell.wizards.resources import ResourceSetupBox
+
+
+def test_code_index_full_refresh(benchmark, bench_database):
+    """Time building the ChemShell code index from scratch."""
+    index = CodeIndex()
+    entries = benchmark(index.refresh, full=True)
+    assert [entry.pk for entry in entries] == [bench_database.code.pk]
+    assert entries[0].max_cores == 8
+
+
+def test_code_index_incremental_refresh(benchmark, bench_database):
+    """Time an incremental refresh of an already populated code index."""
+    index = CodeIndex()
+    index.refresh()
+    assert len(benchmark(index.refresh)) == 1
+
+
+def test_resource_setup_box(benchmark, bench_database):
+    """Time constructing the resource setup box from the shared code index."""
+    get_code_index().refresh()
+    model = ComputationalResourcesModel(ncpus=16)
+    box = benchmark(ResourceSetupBox, model=model)
+    assert box.code.value == bench_database.code.full_label
+    assert model.ncpus == 8
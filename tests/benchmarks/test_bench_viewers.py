@@ -0,0 +1,32 @@
+"""Benchmarks for the structure and node visualisation widgets."""
+
+import pytest
+
+from aiidalab_chemshell.common.node_viewers import CustomAiidaNodeViewWidget
+from aiidalab_chemshell.common.structure_viewer import StructureViewWidget
+
+
+@pytest.mark.parametrize(
+    "link_label", ["energy", "gradients", "vibrational_modes", "optimised_structure"]
+)
+def test_render_output_node(benchmark, bench_database, link_label):
+    """Time creating the custom viewer for each type of ChemShell output."""
+    node = bench_database.outputs[link_label]
+    widget = CustomAiidaNodeViewWidget()
+    assert benchmark(widget._viewer, node) is not None
+
+
+def test_render_structure_data(benchmark, bench_database):
+    """Time creating the custom viewer for a StructureData node."""
+    widget = CustomAiidaNodeViewWidget()
+    view = benchmark(widget._viewer, bench_database.structures[0])
+    assert view.viewer is not None
+
+
+def test_parse_structure_file(benchmark, bench_database):
+    """Time parsing a structure file into the structure viewer."""
+    node = bench_database.structure_files[0]
+    content = node.content
+    widget = StructureViewWidget()
+    benchmark(widget.assign_structure_from_file, node.filename, content)
+    assert widget.viewer is not None
@@ -0,0 +1,20 @@
+"""Shared pytest configuration for the AiiDAlab ChemShell test suite."""
+
+pytest_plugins = ["aiida.tools.pytest_fixtures"]
+
+
+def pytest_addoption(parser):
+    """Register the command line options used by the benchmark suite."""
+    group = parser.getgroup("aiidalab-chemshell benchmarks")
+    group.addoption(
+        "--bench-structures",
+        type=int,
+        default=200,
+        help="Number of structure nodes to populate the benchmark profile with.",
+    )
+    group.addoption(
+        "--bench-processes",
+        type=int,
+        default=50,
+        help="Number of process nodes to populate the benchmark profile with.",
+    )
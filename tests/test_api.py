@@ -0,0 +1,97 @@
+"""Tests for the headless submission API and command line interface."""
+
+import pytest
+from aiida.orm import SinglefileData
+from click.testing import CliRunner
+
+from aiidalab_chemshell.api import build_model, build_spec, load_specs
+from aiidalab_chemshell.cli import cli
+from aiidalab_chemshell.common.chemshell import WorkflowOptions
+from aiidalab_chemshell.common.structure_ingest import ingest_structures
+
+SPEC = """
+- structure: water.xyz
+  workflow: single_point
+  qm:
+    theory: pyscf
+    method: hf
+    basis_quality: balanced
+  resources:
+    code: {code}
+    ncpus: 2
+    label: water-sp
+- structure: water.xyz
+  workflow: geometry
+  mm:
+    force_field: water.ff
+    qm_region: "0-2"
+  resources:
+    code: {code}
+"""
+
+
+@pytest.fixture
+def spec_file(tmp_path, aiida_code_installed):
+    """Write a specification file with two submissions."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    (tmp_path / "water.xyz").write_text("3\n\nO 0 0 0\nH 0 0 1\nH 0 1 0\n")
+    (tmp_path / "water.ff").write_text("")
+    path = tmp_path / "spec.yaml"
+    path.write_text(SPEC.format(code=code.full_label))
+    return path
+
+
+def test_build_model(spec_file):
+    """Test the application models are populated from the specification."""
+    first, second = (build_model(spec) for spec in load_specs(spec_file))
+    assert isinstance(first.structure_model.structure_file, SinglefileData)
+    assert first.workflow_model.workflow == WorkflowOptions.SINGLE_POINT
+    assert first.workflow_model.qm_theory.name == "PYSCF"
+    assert not first.workflow_model.use_dft
+    assert first.workflow_model.basis_set == "cc-pvdz"
+    assert first.resource_model.ncpus == 2
+    assert second.workflow_model.use_mm
+    assert second.workflow_model.qm_region == "0-2"
+
+
+def test_build_spec_invalid(spec_file):
+    """Test invalid specifications are rejected before building a process."""
+    spec = load_specs(spec_file)[0]
+    spec["resources"]["code"] = ""
+    with pytest.raises(ValueError, match="Validation"):
+        build_spec(spec)
+
+
+def test_cli_dry_run(spec_file):
+    """Test the CLI validates and builds every specification in a file."""
+    result = CliRunner().invoke(cli, ["submit", "--dry-run", str(spec_file)])
+    assert result.exit_code == 0, result.output
+    assert "[0]: valid ChemShellCalculation" in result.output
+    assert "[1]: valid GeometryOptimisationWorkChain" in result.output
+
+
+def test_build_batch_spec(spec_file):
+    """Test a structure group is submitted as a single point batch workflow."""
+    group = ingest_structures(spec_file.parent / "water.xyz", "api-batch")
+    spec = load_specs(spec_file)[0]
+    del spec["structure"]
+    spec["structure_group"] = group.label
+    builder = build_spec(spec)
+    assert builder.process_class.__name__ == "BatchProcessWorkChain"
+    assert len(builder.structures) == 1
+
+
+@pytest.mark.parametrize(
+    ("qm_region", "message"),
+    [("", "No QM region specified."), ("0-a", "Invalid QM region entries: 0-a.")],
+)
+def test_build_batch_spec_qm_region(spec_file, capsys, qm_region, message):
+    """Test the QM region of a QM/MM batch submission is validated."""
+    group = ingest_structures(spec_file.parent / "water.xyz", "api-batch-qmmm")
+    first, second = load_specs(spec_file)
+    del first["structure"]
+    first["structure_group"] = group.label
+    first["mm"] = {**second["mm"], "qm_region": qm_region}
+    with pytest.raises(ValueError, match="Validation"):
+        build_spec(first)
+    assert message in capsys.readouterr().out
@@ -0,0 +1,121 @@
+"""Tests for the isolated atom energy cache."""
+
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from aiida.common.links import LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcJobNode, Dict, Float, StructureData, WorkChainNode
+
+from aiidalab_chemshell.common import atomic_energies
+from aiidalab_chemshell.common.atomic_energies import (
+    ATOMIC_ENERGIES_PROCESS_TYPE,
+    ATOMISATION_STRUCTURE_EXTRA,
+    AtomicEnergyCache,
+    get_atomic_energy_cache,
+    isolated_atoms_structure,
+    process_atomisation_energy_message,
+    structure_elements,
+)
+
+BASIS = "def2-svp-atomic"
+QM_PARAMETERS = {
+    "theory": "NWCHEM",
+    "method": "dft",
+    "basis": BASIS,
+    "functional": "B3LYP",
+}
+
+
+def _calcjob(structure, energy, caller=None, exit_status=0, **parameters):
+    """Create a finished ChemShell calculation with an energy output."""
+    parameters = Dict({**QM_PARAMETERS, **parameters})
+    parameters.store()
+    calcjob = CalcJobNode(process_type="aiida.calculations:chemshell")
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.base.links.add_incoming(parameters, LinkType.INPUT_CALC, "qm_parameters")
+    if caller is not None:
+        calcjob.base.links.add_incoming(caller, LinkType.CALL_CALC, "CALL")
+    calcjob.set_exit_status(exit_status)
+    calcjob.store()
+    output = Float(energy)
+    output.base.links.add_incoming(calcjob, LinkType.CREATE, "energy")
+    output.store()
+    return calcjob
+
+
+def _workflow(structure):
+    """Create a finished isolated atom workflow."""
+    parameters = Dict(QM_PARAMETERS).store()
+    workflow = WorkChainNode(process_type=ATOMIC_ENERGIES_PROCESS_TYPE)
+    workflow.base.links.add_incoming(structure, LinkType.INPUT_WORK, "structure")
+    workflow.base.links.add_incoming(parameters, LinkType.INPUT_WORK, "qm_parameters")
+    workflow.set_process_state(ProcessState.FINISHED)
+    workflow.set_exit_status(0)
+    return workflow.store()
+
+
+def _atom(symbol):
+    """Create a stored structure containing a single atom."""
+    return isolated_atoms_structure([symbol]).store()
+
+
+@pytest.fixture(scope="module")
+def water(aiida_profile):
+    """Create cached atom energies and a water calculation."""
+    structure = StructureData(cell=[[10, 0, 0], [0, 10, 0], [0, 0, 10]])
+    for symbol, position in (("O", (0, 0, 0)), ("H", (0, 0, 1)), ("H", (0, 1, 0))):
+        structure.append_atom(symbols=symbol, position=position)
+    structure.store()
+    workflow = _workflow(structure)
+    _calcjob(_atom("H"), -0.49, workflow)
+    _calcjob(_atom("O"), -74.9, workflow)
+    _calcjob(_atom("O"), -75.0, workflow, exit_status=1)
+    _calcjob(_atom("O"), -74.0, workflow, method="hf")
+    _calcjob(_atom("C"), -37.8, workflow, basis="other-basis-atomic")
+    # Single atoms calculated outside the workflow (e.g. a cation) are not reused
+    _calcjob(_atom("C"), -37.5, charge=1)
+    _calcjob(structure, -76.4)
+    _calcjob(structure, -76.0, charge=1)
+    return structure, workflow
+
+
+def test_lookup(water):
+    """Test only successful isolated atom calculations with matching parameters."""
+    cache = AtomicEnergyCache()
+    energies = cache.lookup(["C", "H", "O"], "NWCHEM", "DFT", BASIS.upper(), "b3lyp")
+    assert energies == {"H": -0.49, "O": -74.9}
+    assert cache.missing(["C", "H", "O"], "NWCHEM", "dft", BASIS, "B3LYP") == ["C"]
+    assert cache.lookup(["O"], "NWCHEM", "hf", BASIS, "B3LYP") == {"O": -74.0}
+    assert cache.lookup(["H"], "PYSCF", "dft", BASIS, "B3LYP") == {}
+
+
+def test_atomisation_energy(water):
+    """Test the atomisation energy is computed from the cached atom energies."""
+    structure, workflow = water
+    cache = AtomicEnergyCache()
+    key = ("NWCHEM", "dft", BASIS, "B3LYP")
+    counts = structure_elements(structure)
+    assert counts == Counter({"H": 2, "O": 1})
+    energy = cache.structure_energy(structure, *key)
+    assert energy == -76.4
+    atomisation = cache.atomisation_energy(counts, energy, *key)
+    assert atomisation == pytest.approx(2 * -0.49 - 74.9 + 76.4)
+    assert f"{atomisation:.8f}" in process_atomisation_energy_message(workflow)
+    counts["C"] = 1
+    assert cache.atomisation_energy(counts, energy, *key) is None
+
+    # The structure is recorded when only the uncached elements were submitted
+    partial = _workflow(_atom("H"))
+    partial.base.extras.set(ATOMISATION_STRUCTURE_EXTRA, structure.uuid)
+    assert f"{atomisation:.8f}" in process_atomisation_energy_message(partial)
+
+
+def test_cache_per_profile(aiida_profile, monkeypatch):
+    """Test each profile has its own cache."""
+    cache = get_atomic_energy_cache()
+    assert get_atomic_energy_cache() is cache
+    manager = SimpleNamespace(get_profile=lambda: SimpleNamespace(name="other"))
+    monkeypatch.setattr(atomic_energies, "get_manager", lambda: manager)
+    assert get_atomic_energy_cache() is not cache
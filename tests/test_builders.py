@@ -0,0 +1,56 @@
+"""Tests for the cache of reusable process builder inputs."""
+
+from types import SimpleNamespace
+
+from aiida.orm import Dict, QueryBuilder
+from aiida.plugins import CalculationFactory
+
+from aiidalab_chemshell.common import builders
+from aiidalab_chemshell.common.builders import (
+    BuilderTemplateCache,
+    get_builder_template_cache,
+)
+
+PARAMETERS = {"qm_parameters": {"theory": "NWChem", "basis": "cc-pvdz"}}
+
+
+def _count_dicts() -> int:
+    return QueryBuilder().append(Dict, subclassing=False).count()
+
+
+def test_parameters_reused(aiida_code_installed):
+    """Test parameters are only stored on submission and then reused."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    process_class = CalculationFactory("chemshell")
+    cache = BuilderTemplateCache()
+    count = _count_dicts()
+    first = cache.builder(process_class, code.full_label, PARAMETERS)
+    second = cache.builder(process_class, code.full_label, PARAMETERS)
+    assert first.qm_parameters is second.qm_parameters
+    assert not first.qm_parameters.is_stored
+    assert _count_dicts() == count
+
+    # A stored node with the same contents is found by its hash by a new cache
+    stored = first.qm_parameters.store()
+    builder = BuilderTemplateCache().builder(process_class, code.full_label, PARAMETERS)
+    assert builder.qm_parameters.pk == stored.pk
+
+
+def test_code_cached(aiida_code_installed):
+    """Test codes are loaded once per label until the cache is cleared."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    cache = BuilderTemplateCache()
+    loaded = cache.code(code.full_label)
+    assert loaded.pk == code.pk
+    assert cache.code(code.full_label) is loaded
+    cache.clear()
+    assert cache.code(code.full_label) is not loaded
+
+
+def test_cache_per_profile(aiida_profile, monkeypatch):
+    """Test each profile has its own cache."""
+    cache = get_builder_template_cache()
+    assert get_builder_template_cache() is cache
+    manager = SimpleNamespace(get_profile=lambda: SimpleNamespace(name="other"))
+    monkeypatch.setattr(builders, "get_manager", lambda: manager)
+    assert get_builder_template_cache() is not cache
@@ -0,0 +1,27 @@
+"""Tests for the shared index of ChemShell codes."""
+
+from aiidalab_chemshell.common.code_index import CodeIndex, get_code_index
+from aiidalab_chemshell.models.resources import ComputationalResourcesModel
+from aiidalab_chemshell.wizards.resources import ResourceSetupBox
+
+
+def test_refresh_modified_codes(aiida_code_installed):
+    """Test incremental refreshes pick up relabelled and un-hidden codes."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    index = CodeIndex()
+    assert code.pk in {entry.pk for entry in index.refresh()}
+
+    code.is_hidden = True
+    assert code.pk not in {entry.pk for entry in index.refresh()}
+    code.is_hidden = False
+    code.label = "chemsh-relabelled"
+    entries = {entry.pk: entry for entry in index.refresh()}
+    assert entries[code.pk].label == "chemsh-relabelled"
+
+
+def test_setup_box_indexes_new_codes(aiida_code_installed):
+    """Test codes created after the index was loaded are offered by a new box."""
+    get_code_index().entries()
+    code = aiida_code_installed(default_calc_job_plugin="chemshell", label="chemsh-new")
+    box = ResourceSetupBox(ComputationalResourcesModel())
+    assert code.full_label in box.code.options
@@ -0,0 +1,73 @@
+"""Tests for the cross-calculation energy comparison."""
+
+import pandas as pd
+import pytest
+from aiida.common.links import LinkType
+from aiida.orm import (
+    CalcJobNode,
+    Dict,
+    Float,
+    Group,
+    StructureData,
+    WorkChainNode,
+)
+
+from aiidalab_chemshell.common.comparison import export_table, query_energies
+
+
+def _calcjob(structure, basis, energy=None, caller=None):
+    """Create a ChemShell calculation with the linked inputs and outputs."""
+    parameters = Dict({"theory": "NWCHEM", "basis": basis, "functional": "B3LYP"})
+    parameters.store()
+    calcjob = CalcJobNode(process_type="aiida.calculations:chemshell", label=basis)
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.base.links.add_incoming(parameters, LinkType.INPUT_CALC, "qm_parameters")
+    if caller is not None:
+        calcjob.base.links.add_incoming(caller, LinkType.CALL_CALC, "CALL")
+    calcjob.base.attributes.set("last_job_info", {"wallclock_time_seconds": 60})
+    calcjob.store()
+    if energy is not None:
+        output = Float(energy)
+        output.base.links.add_incoming(calcjob, LinkType.CREATE, "energy")
+        output.store()
+    return calcjob
+
+
+@pytest.fixture(scope="module")
+def calculations(aiida_profile):
+    """Create calculations, one directly and one via a workflow in a group."""
+    structure = StructureData(cell=[[10, 0, 0], [0, 10, 0], [0, 0, 10]])
+    for symbol, position in (("O", (0, 0, 0)), ("H", (0, 0, 1)), ("H", (0, 1, 0))):
+        structure.append_atom(symbols=symbol, position=position)
+    structure.store()
+    workchain = WorkChainNode()
+    workchain.store()
+    group = Group(label="comparison-test").store()
+    direct = _calcjob(structure, "cc-pvdz-comparison", energy=-76.4)
+    called = _calcjob(structure, "3-21g-comparison", energy=-76.0, caller=workchain)
+    _calcjob(structure, "cc-pvtz-comparison", energy=-76.5)
+    _calcjob(structure, "failed-comparison")
+    group.add_nodes([direct, workchain])
+    return group, direct, called
+
+
+def test_query_energies_group(calculations):
+    """Test the members and the calculations called by members are projected."""
+    group, direct, called = calculations
+    table = query_energies(group).set_index("pk")
+    assert sorted(table.index) == sorted([direct.pk, called.pk])
+    assert table.loc[direct.pk, "energy"] == -76.4
+    assert table.loc[called.pk, "energy"] == -76.0
+    assert table.loc[called.pk, "basis"] == "3-21g-comparison"
+    assert table.loc[direct.pk, "formula"] == "H2O"
+    assert table.loc[direct.pk, "walltime"] == 60
+
+
+def test_query_energies_filter(calculations, tmp_path):
+    """Test filters, excluding calculations without energies and CSV export."""
+    table = query_energies(filters={"label": {"like": "%-comparison"}})
+    assert len(table) == 3
+    path = export_table(table, tmp_path / "energies.csv")
+    assert len(pd.read_csv(path)) == 3
+    with pytest.raises(ValueError, match="Unsupported"):
+        export_table(table, tmp_path / "energies.txt")
@@ -0,0 +1,79 @@
+"""Tests for exporting results to a bundle."""
+
+import numpy as np
+import pytest
+from aiida.common.links import LinkType
+from aiida.orm import ArrayData, CalcJobNode, Float, StructureData, WorkChainNode
+from ase import Atoms
+
+from aiidalab_chemshell.common.export import export_bundle, iter_bundle_records
+
+GRADIENTS = np.arange(9, dtype=float).reshape(3, 3)
+MODES = np.array([[-120.0, 0, 0, 0, 0], [1600.0, 2300, 0.1, 0, 0]])
+
+
+def _output(node, calcjob, label):
+    node.base.links.add_incoming(calcjob, LinkType.CREATE, label)
+    node.store()
+    return
+
+
+@pytest.fixture(scope="module")
+def workchain(aiida_profile):
+    """Create a workflow calling a ChemShell calculation with vibrational outputs."""
+    atoms = Atoms("OH2", positions=[[0, 0, 0], [0.96, 0, 0], [-0.24, 0.93, 0]])
+    structure = StructureData(ase=atoms).store()
+    workchain = WorkChainNode(label="export-test").store()
+    calcjob = CalcJobNode(process_type="aiida.calculations:chemshell")
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.base.links.add_incoming(workchain, LinkType.CALL_CALC, "CALL")
+    calcjob.store()
+    _output(Float(-76.4), calcjob, "energy")
+    gradients = ArrayData()
+    gradients.set_array("gradients", GRADIENTS)
+    _output(gradients, calcjob, "gradients")
+    modes = ArrayData()
+    modes.set_array("Modes", MODES)
+    _output(modes, calcjob, "vibrational_modes")
+    # Calculations without an energy are left out of the bundle
+    failed = CalcJobNode(process_type="aiida.calculations:chemshell")
+    failed.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    failed.base.links.add_incoming(workchain, LinkType.CALL_CALC, "CALL")
+    failed.store()
+    return workchain
+
+
+def test_iter_bundle_records(workchain):
+    """Test the calculations called by a workflow are streamed with their arrays."""
+    (record,) = iter_bundle_records([workchain.pk])
+    assert record["process_pk"] == workchain.pk
+    assert record["label"] == "export-test"
+    assert record["formula"] == "H2O"
+    assert record["energy"] == -76.4
+    assert record["symbols"] == ["O", "H", "H"]
+    np.testing.assert_array_equal(record["gradients"], GRADIENTS)
+    np.testing.assert_array_equal(record["modes"], MODES)
+    with pytest.raises(ValueError, match="Unsupported"):
+        export_bundle([workchain], "bundle.txt")
+
+
+def test_export_bundle_hdf5(workchain, tmp_path):
+    """Test the HDF5 bundle concatenates per atom arrays over chunks."""
+    h5py = pytest.importorskip("h5py")
+    path = tmp_path / "bundle.h5"
+    assert export_bundle([workchain, workchain], path, chunk_size=1) == 2
+    with h5py.File(path) as bundle:
+        np.testing.assert_array_equal(bundle["calculations/atom_offset"][:], [0, 3])
+        np.testing.assert_array_equal(bundle["atoms/gradients"][3:], GRADIENTS)
+        np.testing.assert_array_equal(bundle["modes/frequency"][:2], MODES[:, 0])
+
+
+def test_export_bundle_parquet(workchain, tmp_path):
+    """Test the Parquet bundle has one row per calculation."""
+    pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    path = tmp_path / "bundle.parquet"
+    assert export_bundle([workchain], path) == 1
+    table = pd.read_parquet(path)
+    assert table.loc[0, "energy"] == -76.4
+    np.testing.assert_array_equal(table.loc[0, "mode_frequency"], MODES[:, 0])
@@ -0,0 +1,52 @@
+"""Tests for structure fingerprints and duplicate detection."""
+
+from aiida.common.links import LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcJobNode, SinglefileData, StructureData
+from ase import Atoms
+
+from aiidalab_chemshell.common.fingerprint import (
+    FINGERPRINT_EXTRA,
+    atoms_fingerprint,
+    completed_calculations,
+    find_duplicates,
+)
+from aiidalab_chemshell.common.structure_ingest import iter_structure_nodes
+from aiidalab_chemshell.common.structure_metadata import set_structure_metadata
+
+WATER = Atoms("OH2", positions=[[0, 0, 0], [0.96, 0, 0], [-0.24, 0.93, 0]])
+
+
+def test_atoms_fingerprint():
+    """Test the fingerprint ignores atom order and noise below the tolerance."""
+    reordered = WATER[[2, 0, 1]]
+    reordered.positions += 1e-5
+    assert atoms_fingerprint(reordered) == atoms_fingerprint(WATER)
+    moved = WATER.copy()
+    moved.positions[1, 0] += 0.01
+    assert atoms_fingerprint(moved) != atoms_fingerprint(WATER)
+
+
+def test_find_duplicates(aiida_localhost):
+    """Test a structure file identical to a stored structure finds it."""
+    stored = StructureData(ase=WATER)
+    set_structure_metadata(stored)
+    stored.store()
+    calcjob = CalcJobNode(
+        computer=aiida_localhost, process_type="aiida.calculations:chemshell"
+    )
+    calcjob.base.links.add_incoming(stored, LinkType.INPUT_CALC, "structure")
+    calcjob.set_process_state(ProcessState.FINISHED)
+    calcjob.set_exit_status(0)
+    calcjob.store()
+
+    content = "3\n\nH -0.24 0.93 0\nO 0 0 0\nH 0.96 0 0\n"
+    upload = SinglefileData.from_string(content, filename="water.xyz")
+    fingerprint = set_structure_metadata(upload)[FINGERPRINT_EXTRA]
+    duplicates = find_duplicates(fingerprint, exclude=upload)
+    assert [node.uuid for node in duplicates] == [stored.uuid]
+    assert find_duplicates(fingerprint, exclude=stored) == []
+    assert [node.uuid for node in completed_calculations(stored)] == [calcjob.uuid]
+
+    (ingested,) = iter_structure_nodes(content.encode(), "water.xyz")
+    assert ingested.base.extras.get(FINGERPRINT_EXTRA) == fingerprint
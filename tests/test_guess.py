@@ -0,0 +1,76 @@
+"""Tests for reusing the wavefunction of a previous calculation as a guess."""
+
+import shutil
+
+import pytest
+from aiida.common.links import LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcJobNode, Dict, RemoteData, SinglefileData
+
+from aiidalab_chemshell.api import build_spec
+from aiidalab_chemshell.common.guess import find_guess_calculation, guess_files
+
+WATER = "3\n\nO 0 0 0\nH 1 0 0\nH 0 0 1\n"
+QM_PARAMETERS = {"theory": "NWCHEM", "method": "dft", "basis": "cc-pvdz"}
+
+
+@pytest.fixture
+def previous_calculation(aiida_localhost, tmp_path):
+    """Create a completed single point calculation of a water molecule."""
+    # Avoid the overhead of starting a login shell for every remote command
+    aiida_localhost.configure(use_login_shell=False, safe_interval=0)
+    structure = SinglefileData.from_string(WATER, filename="water.xyz").store()
+    parameters = Dict({**QM_PARAMETERS, "functional": "B3LYP"}).store()
+    calcjob = CalcJobNode(
+        computer=aiida_localhost, process_type="aiida.calculations:chemshell"
+    )
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.base.links.add_incoming(parameters, LinkType.INPUT_CALC, "qm_parameters")
+    calcjob.set_process_state(ProcessState.FINISHED)
+    calcjob.set_exit_status(0)
+    calcjob.store()
+    remote = RemoteData(remote_path=str(tmp_path), computer=aiida_localhost)
+    remote.base.links.add_incoming(calcjob, LinkType.CREATE, "remote_folder")
+    remote.store()
+    return calcjob
+
+
+def test_find_guess_calculation(previous_calculation, aiida_localhost):
+    """Test an identical structure is matched, but not a different charge."""
+    structure = SinglefileData.from_string(WATER, filename="water.xyz").store()
+    guess = find_guess_calculation(structure, QM_PARAMETERS, aiida_localhost)
+    assert guess.uuid == previous_calculation.uuid
+    charged = {**QM_PARAMETERS, "charge": 1}
+    assert find_guess_calculation(structure, charged, aiida_localhost) is None
+    previous_calculation.outputs.remote_folder.base.extras.set("cleaned", True)
+    assert find_guess_calculation(structure, QM_PARAMETERS, aiida_localhost) is None
+
+
+def test_guess_files(previous_calculation, tmp_path):
+    """Test only the wavefunction files present in the working directory."""
+    assert guess_files(previous_calculation) == []
+    (tmp_path / "water.movecs").write_text("")
+    (tmp_path / "water.out").write_text("")
+    assert guess_files(previous_calculation) == ["water.movecs"]
+    shutil.rmtree(tmp_path)
+    assert guess_files(previous_calculation) == []
+
+
+def test_build_with_guess(previous_calculation, aiida_code_installed, tmp_path):
+    """Test a single point of the same structure restarts from the wavefunction."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    spec = {
+        "structure": previous_calculation.inputs.structure.uuid,
+        "workflow": "single_point",
+        "resources": {"code": code.full_label},
+    }
+    # Without the wavefunction file there is nothing to restart from
+    builder = build_spec(spec)
+    assert "restart" not in builder.qm_parameters.get_dict()
+    assert not builder.metadata.options.prepend_text
+
+    (tmp_path / "water.movecs").write_text("")
+    builder = build_spec(spec)
+    assert builder.qm_parameters["restart"]
+    prepend_text = builder.metadata.options.prepend_text
+    assert prepend_text == f"cp {tmp_path}/water.movecs ."
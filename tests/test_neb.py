@@ -0,0 +1,97 @@
+"""Tests for the nudged elastic band image generation and submission."""
+
+import numpy as np
+import pytest
+from aiida.orm import SinglefileData, StructureData
+
+from aiidalab_chemshell.api import build_spec
+from aiidalab_chemshell.common.neb import (
+    idpp_interpolation,
+    interpolate_images,
+    linear_interpolation,
+)
+from aiidalab_chemshell.common.structure_ingest import read_atoms
+
+REACTANT = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 3.0]])
+PRODUCT = np.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 3.0]])
+
+
+def test_idpp_keeps_bond_lengths():
+    """Test IDPP avoids the bond compression of a linear path for a rotation."""
+    linear = linear_interpolation(REACTANT, PRODUCT, 5)
+    idpp = idpp_interpolation(REACTANT, PRODUCT, 5)
+    assert linear.shape == idpp.shape == (7, 3, 3)
+    np.testing.assert_array_equal(idpp[[0, -1]], [REACTANT, PRODUCT])
+    assert np.linalg.norm(linear[3, 1]) == pytest.approx(np.sqrt(0.5))
+    assert np.linalg.norm(idpp[3, 1] - idpp[3, 0]) == pytest.approx(1.0, abs=0.02)
+    spacing = np.linalg.norm(np.diff(idpp.reshape(7, -1), axis=0), axis=1)
+    np.testing.assert_allclose(spacing, spacing.mean(), rtol=0.05)
+
+
+def test_interpolate_images_mismatch():
+    """Test end points with different atoms are rejected."""
+    reactant = StructureData(pbc=(False, False, False))
+    reactant.append_atom(symbols="H", position=(0, 0, 0))
+    product = SinglefileData.from_string("1\n\nHe 0 0 1\n", filename="product.xyz")
+    with pytest.raises(ValueError, match="same atoms"):
+        interpolate_images(reactant, product, 4)
+
+
+@pytest.fixture
+def neb_spec(tmp_path, aiida_code_installed):
+    """Create a NEB specification between two water geometries."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    (tmp_path / "reactant.xyz").write_text("3\n\nO 0 0 0\nH 1 0 0\nH 0 0 1\n")
+    (tmp_path / "product.xyz").write_text("3\n\nO 0 0 0\nH 0 1 0\nH 0 0 1\n")
+    return {
+        "base_dir": str(tmp_path),
+        "structure": "reactant.xyz",
+        "workflow": "neb",
+        "neb": {"product": "product.xyz", "images": 6},
+        "resources": {"code": code.full_label},
+    }
+
+
+def test_build_neb_images(neb_spec):
+    """Test the whole path, end points included, is submitted as batch jobs."""
+    builder = build_spec(neb_spec)
+    assert builder.process_class.__name__ == "BatchProcessWorkChain"
+    assert builder.trajectory.numsteps == 8
+    positions = builder.trajectory.get_positions()
+    np.testing.assert_allclose(positions[0, 1], [1, 0, 0])
+    np.testing.assert_allclose(positions[-1, 1], [0, 1, 0])
+    assert builder.combine_results
+
+
+def test_build_neb_optimisation(neb_spec):
+    """Test the end points are passed to a DL-FIND NEB optimisation."""
+    neb_spec["neb"].update({"execution": "optimisation", "type": "free"})
+    builder = build_spec(neb_spec)
+    assert builder.structure2.filename == "product.xyz"
+    parameters = builder.optimisation_parameters.get_dict()
+    assert parameters == {"neb": "free", "nimages": 6, "nebk": 0.01}
+    assert "calculation_parameters" not in builder
+
+
+def test_build_neb_optimisation_structure(neb_spec, tmp_path):
+    """Test a StructureData product is written as an XYZ file."""
+    product = read_atoms(SinglefileData(tmp_path / "product.xyz"))
+    neb_spec["neb"].update(
+        {
+            "execution": "optimisation",
+            "product": StructureData(ase=product).store().uuid,
+        }
+    )
+    builder = build_spec(neb_spec)
+    assert builder.structure2.filename == "neb_product.xyz"
+    np.testing.assert_allclose(read_atoms(builder.structure2).positions[1], [0, 1, 0])
+
+
+@pytest.mark.parametrize("execution", ["images", "optimisation"])
+def test_validate_neb_mismatch(neb_spec, tmp_path, capsys, execution):
+    """Test end points with different atoms fail validation in both modes."""
+    (tmp_path / "product.xyz").write_text("3\n\nO 0 0 0\nH 0 1 0\nF 0 0 1\n")
+    neb_spec["neb"]["execution"] = execution
+    with pytest.raises(ValueError, match="Validation"):
+        build_spec(neb_spec)
+    assert "same atoms" in capsys.readouterr().out
@@ -0,0 +1,98 @@
+"""Tests for the incrementally loaded provenance tree."""
+
+import pytest
+from aiida.common.links import LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcJobNode, Float, WorkChainNode
+
+from aiidalab_chemshell.common.process_tree import (
+    DataTreeNode,
+    LazyProcessTreeWidget,
+    LoadMoreTreeNode,
+    OutputsTreeNode,
+    PlaceholderTreeNode,
+    ProcessTreeNode,
+    query_called,
+)
+
+
+@pytest.fixture
+def sweep(aiida_profile):
+    """Create a workchain calling many calculations, the last still running."""
+    workchain = WorkChainNode(process_type="aiida.workflows:chemshell.opt")
+    workchain.set_process_state(ProcessState.RUNNING)
+    workchain.store()
+    calcjobs = []
+    for i in range(7):
+        calcjob = CalcJobNode(process_type="aiida.calculations:chemshell")
+        calcjob.label = f"image {i}"
+        calcjob.base.links.add_incoming(workchain, LinkType.CALL_CALC, "CALL")
+        calcjob.set_process_state(ProcessState.FINISHED)
+        calcjob.set_exit_status(0 if i else 300)
+        calcjob.store()
+        energy = Float(-76.0 - i)
+        energy.base.links.add_incoming(calcjob, LinkType.CREATE, "energy")
+        energy.store()
+        calcjobs.append(calcjob)
+    return workchain, calcjobs
+
+
+def test_query_called(sweep):
+    """Test the called processes are paged in creation order."""
+    workchain, calcjobs = sweep
+    rows = query_called(workchain.pk, offset=2, limit=3)
+    assert [row.pk for row in rows] == [c.pk for c in calcjobs[2:5]]
+    assert rows[0].label == "image 2"
+    assert rows[0].icon == "gears"
+    assert rows[0].icon_style == "success"
+    assert query_called(workchain.pk)[0].icon_style == "danger"
+
+
+def test_lazy_tree(sweep):
+    """Test children are only loaded when opened, a page at a time."""
+    workchain, calcjobs = sweep
+    tree = LazyProcessTreeWidget(page_size=3)
+    tree.value = workchain.uuid
+    (root,) = tree._tree.nodes
+    assert isinstance(root, ProcessTreeNode)
+    assert root.icon == "chain"
+    assert isinstance(root.nodes[0], PlaceholderTreeNode)
+
+    root.opened = True
+    assert isinstance(root.nodes[0], OutputsTreeNode)
+    assert [n.pk for n in root.nodes[1:4]] == [c.pk for c in calcjobs[:3]]
+    assert isinstance(root.nodes[-1], LoadMoreTreeNode)
+
+    # Selecting the last node loads the next page in its place
+    tree._tree.set_trait("selected_nodes", (root.nodes[-1],))
+    tree._tree.set_trait("selected_nodes", (root.nodes[-1],))
+    assert len(root.nodes) == 1 + 7
+    assert not any(isinstance(n, LoadMoreTreeNode) for n in root.nodes)
+
+    calculation = root.nodes[2]
+    calculation.opened = True
+    outputs = calculation.nodes[0]
+    outputs.opened = True
+    (energy,) = outputs.nodes
+    assert isinstance(energy, DataTreeNode)
+    tree._tree.set_trait("selected_nodes", (energy,))
+    assert tree.selected_nodes[0].value == pytest.approx(-77.0)
+
+
+def test_lazy_tree_update(sweep):
+    """Test refreshing updates states and offers newly called processes."""
+    workchain, _ = sweep
+    tree = LazyProcessTreeWidget(page_size=10)
+    tree.value = workchain.uuid
+    root = tree._tree.nodes[0]
+    root.opened = True
+    assert len(root.nodes) == 8
+
+    calcjob = CalcJobNode(process_type="aiida.calculations:chemshell")
+    calcjob.base.links.add_incoming(workchain, LinkType.CALL_CALC, "CALL")
+    calcjob.store()
+    workchain.set_process_state(ProcessState.FINISHED)
+    workchain.set_exit_status(0)
+    tree.update()
+    assert root.icon_style == "success"
+    assert isinstance(root.nodes[-1], LoadMoreTreeNode)
@@ -0,0 +1,105 @@
+"""Tests for browsing and reading remote working directories."""
+
+import asyncio
+
+import pytest
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, RemoteData
+
+from aiidalab_chemshell.common.remote_files import (
+    RemoteFolderWidget,
+    highlight_convergence,
+    list_remote_directory,
+    read_range,
+)
+
+LOG = "".join(f"line {i}\n" for i in range(1000))
+
+
+@pytest.fixture
+def working_directory(aiida_localhost, tmp_path):
+    """Create a calculation with a local working directory holding a log file."""
+    aiida_localhost.configure(use_login_shell=False, safe_interval=0)
+    calcjob = CalcJobNode(
+        computer=aiida_localhost, process_type="aiida.calculations:chemshell"
+    )
+    calcjob.store()
+    remote = RemoteData(remote_path=str(tmp_path), computer=aiida_localhost)
+    remote.base.links.add_incoming(calcjob, LinkType.CREATE, "remote_folder")
+    remote.store()
+    (tmp_path / "_dl_find").mkdir()
+    (tmp_path / "nwchem.out").write_text(LOG)
+    return calcjob, tmp_path
+
+
+def test_ranged_reads(working_directory, aiida_localhost):
+    """Test listing and reading parts of files over the transport."""
+    _, folder = working_directory
+    path = str(folder / "nwchem.out")
+    with aiida_localhost.get_transport() as transport:
+        entries = list_remote_directory(transport, str(folder))
+        assert [(e.name, e.is_dir) for e in entries] == [
+            ("_dl_find", True),
+            ("nwchem.out", False),
+        ]
+        assert entries[1].size == len(LOG)
+        assert read_range(transport, path, 7, 14) == LOG[7:21].encode()
+        assert read_range(transport, path, len(LOG) - 9, 16) == b"line 999\n"
+        with pytest.raises(OSError):
+            read_range(transport, str(folder / "missing.out"), 0, 9)
+
+
+def test_follow_file(working_directory):
+    """Test a tail-read file is followed from the end of the previous read."""
+    calcjob, folder = working_directory
+    browser = RemoteFolderWidget(calcjob)
+    browser.entries.value = browser.entries.options[1][1]
+    browser.length.value = 18
+    browser._open()
+    assert "line 998\nline 999" in browser.output.value
+    browser.follow.value = True
+    with open(folder / "nwchem.out", "a") as log:
+        log.write("Total DFT energy = -76.4\n")
+    browser.update()
+    assert 'color: #2471a3"><b>Total DFT energy' in browser.output.value
+
+
+def test_follow_polls(working_directory):
+    """Test a followed file is polled whilst running and stops on untick."""
+    calcjob, folder = working_directory
+    browser = RemoteFolderWidget(calcjob, interval=0.01)
+    # Output written after the listing is still included in the tail
+    with open(folder / "nwchem.out", "a") as log:
+        log.write("line 1000\n")
+    browser.entries.value = browser.entries.options[1][1]
+    browser.length.value = 10
+    browser._open()
+    assert browser._text == "line 1000\n"
+    browser.follow.value = True
+    with open(folder / "nwchem.out", "a") as log:
+        log.write("SCF converged\n")
+
+    async def _until(condition) -> None:
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    asyncio.get_event_loop().run_until_complete(
+        asyncio.wait_for(_until(lambda: "SCF converged" in browser.output.value), 10)
+    )
+    task = browser._task
+    assert not task.done()
+    browser.follow.value = False
+    assert browser._task is None
+    asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.05))
+    assert task.cancelled()
+    browser.follow.value = True
+    browser.close()
+    assert browser._task is None
+
+
+def test_highlight_convergence():
+    """Test output is escaped and convergence lines are highlighted."""
+    text = highlight_convergence("<step>\nConverged!\nSCF failed")
+    assert text.startswith("&lt;step&gt;\n<span")
+    assert "#1e8449" in text
+    assert "#c0392b" in text
@@ -0,0 +1,43 @@
+"""Tests for the computer and code setup widget."""
+
+import asyncio
+
+from aiidalab_widgets_base import computational_resources, databases
+
+from aiidalab_chemshell.common.resource_database import ResourceDatabaseCache
+from aiidalab_chemshell.resources import (
+    CachedResourcesDatabaseWidget,
+    CachedResourceSetupWidget,
+    CodeSetupWidget,
+)
+
+DATABASE = {"test-domain": {"default": "cpu", "cpu": {"computer": {}, "codes": {}}}}
+
+
+def test_setup_widget_makes_no_request(monkeypatch):
+    """Test constructing the setup widget never fetches the upstream database."""
+    requests = []
+    monkeypatch.setattr(
+        databases.requests, "get", lambda *args, **kwargs: requests.append(args)
+    )
+    upstream = computational_resources.ComputationalResourcesDatabaseWidget
+    widget = CachedResourceSetupWidget()
+    assert not requests
+    assert isinstance(widget.comp_resources_database, CachedResourcesDatabaseWidget)
+    assert computational_resources.ComputationalResourcesDatabaseWidget is upstream
+
+
+def test_database_loaded_in_background(monkeypatch):
+    """Test the cached database is shown from the kernel's event loop."""
+    monkeypatch.setattr(
+        ResourceDatabaseCache, "load", lambda self, source, force=False: DATABASE
+    )
+    widget = CodeSetupWidget()
+    selector = widget.resource_widget.comp_resources_database.domain_selector
+
+    async def _loaded():
+        while not selector.options:
+            await asyncio.sleep(0.01)
+
+    asyncio.get_event_loop().run_until_complete(asyncio.wait_for(_loaded(), 5))
+    assert selector.options == ("test-domain",)
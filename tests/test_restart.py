@@ -0,0 +1,79 @@
+"""Tests for restarting unfinished geometry optimisations."""
+
+import numpy as np
+import pytest
+from aiida.common.links import LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcJobNode, Dict, RemoteData, StructureData, WorkChainNode
+
+from aiidalab_chemshell.common.restart import (
+    is_restartable,
+    last_geometry,
+    restart_builder,
+)
+
+FRAME = "3\nEnergy -76.0\nO 0 0 {z}\nH 0 0 1\nH 0 1 0\n"
+
+
+@pytest.fixture
+def failed_optimisation(aiida_localhost, aiida_code_installed, tmp_path):
+    """Create an excepted optimisation whose calculation ran out of walltime."""
+    aiida_localhost.configure(use_login_shell=False, safe_interval=0)
+    code = aiida_code_installed(
+        default_calc_job_plugin="chemshell", filepath_executable="/bin/true"
+    )
+    structure = StructureData(cell=[[10, 0, 0], [0, 10, 0], [0, 0, 10]])
+    for symbol, position in (("O", (0, 0, 0)), ("H", (0, 0, 1)), ("H", (0, 1, 0))):
+        structure.append_atom(symbols=symbol, position=position)
+    structure.store()
+    parameters = Dict({"theory": "NWChem", "basis": "cc-pvdz"}).store()
+
+    workchain = WorkChainNode(process_type="aiida.workflows:chemshell.opt")
+    workchain.base.links.add_incoming(
+        structure, LinkType.INPUT_WORK, "chemsh__structure"
+    )
+    workchain.base.links.add_incoming(code, LinkType.INPUT_WORK, "chemsh__code")
+    workchain.base.links.add_incoming(
+        parameters, LinkType.INPUT_WORK, "chemsh__qm_parameters"
+    )
+    workchain.set_process_state(ProcessState.EXCEPTED)
+    workchain.store()
+
+    calcjob = CalcJobNode(
+        computer=aiida_localhost, process_type="aiida.calculations:chemshell"
+    )
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.base.links.add_incoming(workchain, LinkType.CALL_CALC, "CALL")
+    calcjob.set_process_state(ProcessState.FINISHED)
+    calcjob.set_exit_status(120)
+    calcjob.store()
+    remote = RemoteData(remote_path=str(tmp_path), computer=aiida_localhost)
+    remote.base.links.add_incoming(calcjob, LinkType.CREATE, "remote_folder")
+    remote.store()
+    (tmp_path / "_dl_find").mkdir()
+    (tmp_path / "_dl_find" / "path.xyz").write_text(
+        FRAME.format(z=0.0) + FRAME.format(z=0.25)
+    )
+    return workchain, structure
+
+
+def test_last_geometry(failed_optimisation):
+    """Test the last frame in the working directory is used with the input cell."""
+    workchain, structure = failed_optimisation
+    assert is_restartable(workchain)
+    geometry = last_geometry(workchain)
+    np.testing.assert_allclose(geometry.get_ase().positions[0], [0, 0, 0.25])
+    assert geometry.cell == structure.cell
+
+
+def test_restart_builder(failed_optimisation):
+    """Test the restart keeps all inputs except the starting structure."""
+    workchain, structure = failed_optimisation
+    builder = restart_builder(workchain)
+    assert builder.chemsh.structure.uuid != structure.uuid
+    assert builder.chemsh.qm_parameters["basis"] == "cc-pvdz"
+    assert builder.chemsh.code.pk == workchain.inputs.chemsh.code.pk
+    workchain.set_process_state(ProcessState.FINISHED)
+    workchain.set_exit_status(0)
+    with pytest.raises(ValueError, match="not an unfinished"):
+        restart_builder(workchain)
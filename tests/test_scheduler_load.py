@@ -0,0 +1,134 @@
+"""Test the scheduler load based computer selection with a mock scheduler."""
+
+import pytest
+from aiida.orm import InstalledCode
+from aiida.schedulers.datastructures import JobInfo, JobState
+
+from aiidalab_chemshell.common.code_index import CodeEntry, get_code_index
+from aiidalab_chemshell.common.scheduler_load import (
+    QueueLoad,
+    SchedulerLoadMonitor,
+    get_scheduler_load_monitor,
+)
+from aiidalab_chemshell.process import ChemShellProcess, MainAppModel
+
+
+def _job(state: JobState, walltime: int | None = None) -> JobInfo:
+    job = JobInfo()
+    job.job_state = state
+    if walltime is not None:
+        job.requested_wallclock_time_seconds = walltime
+    return job
+
+
+class MockScheduler:
+    """Offline stand-in for a scheduler returning fixed job lists per computer."""
+
+    def __init__(self, jobs: dict[str, list[JobInfo]]):
+        self.jobs = jobs
+        self.calls = 0
+
+    def __call__(self, computer):
+        """Return the job listing for the given computer."""
+        label = computer.label
+
+        def list_jobs():
+            self.calls += 1
+            if label not in self.jobs:
+                raise ConnectionError("Remote computer is unreachable")
+            return self.jobs[label]
+
+        return list_jobs
+
+
+@pytest.fixture
+def entries(aiida_computer_local):
+    """Return one ChemShell code entry on each of three computers."""
+    labels = ("busy", "quiet", "offline")
+    for label in labels:
+        aiida_computer_local(label=label)
+    return [
+        CodeEntry(pk=i, uuid="", label="chemsh", computer=c)
+        for i, c in enumerate(labels)
+    ]
+
+
+def test_queue_load_from_jobs():
+    """Test the expected wait is estimated from the queued walltime."""
+    load = QueueLoad.from_jobs(
+        [
+            _job(JobState.RUNNING),
+            _job(JobState.RUNNING),
+            _job(JobState.QUEUED, 7200),
+            _job(JobState.QUEUED_HELD),
+            _job(JobState.DONE),
+        ]
+    )
+    assert (load.running, load.queued) == (2, 2)
+    assert load.expected_wait == pytest.approx((7200 + 3600) / 2)
+    assert QueueLoad(available=False).expected_wait == float("inf")
+
+
+def test_least_loaded_selection(entries):
+    """Test the code on the computer with the shortest queue is selected."""
+    scheduler = MockScheduler(
+        {
+            "busy": [_job(JobState.QUEUED, 36000), _job(JobState.RUNNING)],
+            "quiet": [_job(JobState.RUNNING), _job(JobState.QUEUED, 60)],
+        }
+    )
+    monitor = SchedulerLoadMonitor(ttl=300, job_lister=scheduler)
+    assert monitor.least_loaded(entries).computer == "quiet"
+    assert scheduler.calls == 3
+
+    # Cached loads are reused until the time-to-live expires
+    monitor.least_loaded(entries)
+    assert scheduler.calls == 3
+    monitor.clear()
+    monitor.least_loaded(entries)
+    assert scheduler.calls == 6
+
+
+def test_no_available_computer(entries):
+    """Test no code is selected if every scheduler query fails."""
+    monitor = SchedulerLoadMonitor(job_lister=MockScheduler({}))
+    assert monitor.least_loaded(entries) is None
+
+
+def test_select_least_loaded_code(aiida_computer_local, monkeypatch):
+    """Test only the selected code is switched and the CPUs capped to the computer."""
+    computers = {}
+    for label, cores in (("select-busy", 16), ("select-quiet", 2), ("select-idle", 8)):
+        computer = aiida_computer_local(label=label)
+        computer.set_default_mpiprocs_per_machine(cores)
+        computers[label] = computer
+    for code_label, computer in (
+        ("chemsh-select", "select-busy"),
+        ("chemsh-select", "select-quiet"),
+        ("chemsh-other", "select-idle"),
+    ):
+        InstalledCode(
+            computer=computers[computer],
+            filepath_executable="/bin/true",
+            label=code_label,
+            default_calc_job_plugin="chemshell",
+        ).store()
+    get_code_index().refresh(full=True)
+    scheduler = MockScheduler(
+        {
+            "select-busy": [_job(JobState.QUEUED, 36000)],
+            "select-quiet": [_job(JobState.QUEUED, 600)],
+            "select-idle": [],
+        }
+    )
+    monitor = get_scheduler_load_monitor()
+    monkeypatch.setattr(monitor, "job_lister", scheduler)
+    monitor.clear()
+
+    model = MainAppModel()
+    model.resource_model.code_label = "chemsh-select@select-busy"
+    model.resource_model.ncpus = 8
+    ChemShellProcess.select_least_loaded_code(model)
+    monitor.clear()
+    assert model.resource_model.code_label == "chemsh-select@select-quiet"
+    assert model.resource_model.ncpus == 2
@@ -0,0 +1,45 @@
+"""Tests for the multi-level basis set screening workflow."""
+
+import pytest
+
+from aiidalab_chemshell.api import build_spec
+from aiidalab_chemshell.common.screening import select_survivors
+from aiidalab_chemshell.common.structure_ingest import ingest_structures
+
+ENERGIES = {"a": -1.00, "b": -1.02, "c": -0.90, "d": -1.01}
+
+
+@pytest.mark.parametrize(
+    ("window", "top_n", "expected"),
+    [
+        (None, None, ["b", "d", "a", "c"]),
+        (0.015, None, ["b", "d"]),
+        (None, 3, ["b", "d", "a"]),
+        (0.05, 1, ["b"]),
+    ],
+)
+def test_select_survivors(window, top_n, expected):
+    """Test structures are filtered by energy window and count, lowest first."""
+    assert select_survivors(ENERGIES, window, top_n) == expected
+
+
+def test_build_screening(tmp_path, aiida_code_installed):
+    """Test a structure group is screened with the requested basis set ladder."""
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    (tmp_path / "waters.xyz").write_text(
+        "3\n\nO 0 0 0\nH 1 0 0\nH 0 0 1\n" * 2 + "3\n\nO 0 0 0\nH 0 1 0\nH 0 0 1\n"
+    )
+    group = ingest_structures(tmp_path / "waters.xyz", "screening-group")
+    spec = {
+        "structure_group": group.label,
+        "workflow": "screening",
+        "screening": {"basis_sets": ["3-21G", "cc-pvdz"], "window": 10.0},
+        "resources": {"code": code.full_label},
+    }
+    builder = build_spec(spec)
+    assert builder.process_class.__name__ == "ScreeningWorkChain"
+    assert len(builder.structures) == len(group.nodes)
+    assert builder.basis_sets.get_list() == ["3-21G", "cc-pvdz"]
+    assert builder.energy_window.value == pytest.approx(10.0 / 2625.4996, rel=1e-4)
+    assert "top_n" not in builder
+    assert "optimisation_parameters" not in builder
@@ -0,0 +1,93 @@
+"""Tests for persisting the app's selections between sessions."""
+
+import json
+
+from aiida.orm import Group, SinglefileData, StructureData
+from ase.build import molecule
+
+from aiidalab_chemshell.common.chemshell import WorkflowOptions
+from aiidalab_chemshell.common.session import SessionStore
+from aiidalab_chemshell.process import MainAppModel
+from aiidalab_chemshell.wizards.workflows.main_view import WorkflowWizardStep
+
+
+def test_session_round_trip(aiida_profile, tmp_path):
+    """Test nodes, groups, enums and parameters are restored into a new model."""
+    store = SessionStore(tmp_path / "session.json")
+    model = MainAppModel()
+    store.track(model)
+    model.structure_model.structure = StructureData(ase=molecule("H2O")).store()
+    model.workflow_model.workflow = WorkflowOptions.SINGLE_POINT
+    model.workflow_model.basis_set = "def2-svp"
+    model.workflow_model.qm_region = "0-2"
+    model.workflow_model.product_structure = StructureData(ase=molecule("H2O"))
+    model.resource_model.ncpus = 8
+
+    session = json.loads(store.path.read_text())["models"]
+    # Only changed traits are written, unsubmitted unstored nodes are skipped
+    assert set(session["workflow_model"]) == {"workflow", "basis_set", "qm_region"}
+    assert session["resource_model"] == {"ncpus": 8}
+
+    restored = MainAppModel()
+    assert SessionStore(store.path).restore(restored)
+    assert restored.structure_model.structure.uuid == (
+        model.structure_model.structure.uuid
+    )
+    assert restored.workflow_model.workflow == WorkflowOptions.SINGLE_POINT
+    assert restored.workflow_model.basis_set == "def2-svp"
+    assert restored.resource_model.ncpus == 8
+    assert not restored.resource_model.submitted
+
+
+def test_session_submitted_and_missing_nodes(aiida_profile, tmp_path):
+    """Test submitted inputs are stored, and deleted references are skipped."""
+    store = SessionStore(tmp_path / "session.json")
+    model = MainAppModel()
+    store.track(model)
+    upload = SinglefileData.from_string("2\n\nH 0 0 0\nH 0 0 0.7\n", "h2.xyz")
+    model.structure_model.submitted = True
+    model.structure_model.structure_file = upload
+    assert upload.is_stored
+    restored = MainAppModel()
+    assert store.restore(restored)
+    assert restored.structure_model.structure_file.uuid == upload.uuid
+
+    group = Group(label="session-test").store()
+    model.structure_model.structure_group = group
+    Group.collection.delete(group.pk)
+    restored = MainAppModel()
+    assert store.restore(restored)
+    assert restored.structure_model.structure_group is None
+
+    store.reset(restored)
+    assert not store.path.exists()
+    assert not store.restore(MainAppModel())
+
+
+def test_session_restored_into_workflow_step(aiida_profile, tmp_path):
+    """Test rendering the workflow step keeps the restored selections."""
+    store = SessionStore(tmp_path / "session.json")
+    model = MainAppModel()
+    store.track(model)
+    model.workflow_model.workflow = WorkflowOptions.SINGLE_POINT
+    model.workflow_model.basis_set = "def2-svp"
+    model.workflow_model.qm_region = "0-2"
+    model.workflow_model.use_mm = True
+    model.workflow_model.vibrational_analysis = True
+
+    restored = MainAppModel()
+    assert store.restore(restored)
+    step = WorkflowWizardStep(restored.workflow_model)
+    step.render()
+    # Render every workflow sharing the model, not only the selected one
+    for index in range(len(WorkflowOptions)):
+        step.workflow_tabs.selected_index = index
+    step.workflow_tabs.selected_index = WorkflowOptions.SINGLE_POINT.value
+    workflow = restored.workflow_model
+    assert workflow.basis_set == "def2-svp"
+    assert workflow.qm_region == "0-2"
+    assert workflow.use_mm
+    assert workflow.vibrational_analysis
+    single_point = step.workflow_tabs.children[WorkflowOptions.SINGLE_POINT.value]
+    assert single_point.advanced_options.value
+    assert single_point.qm_region_text in single_point.children
@@ -0,0 +1,49 @@
+"""Tests for the parallel SMILES conformer generation."""
+
+import pytest
+
+from aiidalab_chemshell.common.smiles import (
+    ConformerGenerator,
+    SmilesBatchWidget,
+    canonical_smiles,
+)
+
+
+def test_canonical_smiles():
+    """Test equivalent SMILES strings share a canonical form."""
+    assert canonical_smiles("OCC") == canonical_smiles("CCO")
+    with pytest.raises(ValueError, match="Invalid SMILES"):
+        canonical_smiles("not-a-smiles")
+
+
+def test_generate_cached(aiida_profile):
+    """Test conformers are generated in parallel and reused from the cache."""
+    generator = ConformerGenerator(max_workers=2)
+    try:
+        water, ethanol = generator.generate(["O", "CCO", "OCC"])
+        assert water.get_formula() == "H2O"
+        assert ethanol.get_formula() == "C2H6O"
+        assert ethanol.is_stored
+        assert generator.generate(["C(O)C"]) == [ethanol]
+    finally:
+        generator.shutdown()
+
+
+def test_batch_widget_close(aiida_profile):
+    """Test the cached structures are looked up at once and workers stopped."""
+    generator = ConformerGenerator(max_workers=1)
+    try:
+        (water,) = generator.generate(["O"])
+        assert generator.lookup(["O", "C"]) == {"O": water}
+        assert generator.pool._mp_context.get_start_method() == "spawn"
+    finally:
+        generator.shutdown()
+    widget = SmilesBatchWidget(generator=generator)
+    widget.smiles.value = "O\n[OH2]"
+    widget.group_label.value = "smiles-close"
+    widget.generate_btn.click()
+    assert widget.group.count() == 1
+    assert generator._pool is None
+    assert generator.pool is not None
+    widget.close()
+    assert generator._pool is None
@@ -0,0 +1,94 @@
+"""Tests for the structure gallery."""
+
+import asyncio
+import io
+
+import numpy as np
+import pytest
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, SinglefileData, StructureData
+from ase import Atoms
+
+from aiidalab_chemshell.common.structure_gallery import (
+    StructureGalleryWidget,
+    gallery_entries,
+    render_thumbnail,
+)
+
+WATER = Atoms("OH2", positions=[[0, 0, 0], [0.96, 0, 0], [-0.24, 0.93, 0]])
+
+
+def _calculation(structure, optimised=None, label=""):
+    calcjob = CalcJobNode(process_type="aiida.calculations:chemshell", label=label)
+    calcjob.base.links.add_incoming(structure, LinkType.INPUT_CALC, "structure")
+    calcjob.store()
+    if optimised is not None:
+        optimised.base.links.add_incoming(
+            calcjob, LinkType.CREATE, "optimised_structure"
+        )
+        optimised.store()
+    return calcjob
+
+
+@pytest.fixture(scope="module")
+def calculations(aiida_profile):
+    """Create calculations with input, optimised and file based structures."""
+    structure = StructureData(ase=WATER).store()
+    moved = WATER.copy()
+    moved.positions[1, 0] = 1.1
+    optimised = _calculation(structure, StructureData(ase=moved), label="opt")
+    single = _calculation(structure, label="single")
+    xyz = b"2\n\nC 0 0 0\nO 0 0 1.13\n"
+    from_file = _calculation(
+        SinglefileData(io.BytesIO(xyz), filename="co.xyz").store(), label="file"
+    )
+    return optimised, single, from_file
+
+
+def test_gallery_entries(calculations):
+    """Test the optimised structure replaces the input and files are read."""
+    optimised, single, from_file = calculations
+    entries = gallery_entries([from_file.pk, optimised.pk, single.pk])
+    assert [entry.pk for entry in entries] == [from_file.pk, optimised.pk, single.pk]
+    assert entries[0].to_atoms().get_chemical_formula() == "CO"
+    assert entries[1].label == "opt"
+    assert entries[1].to_atoms().positions[1, 0] == pytest.approx(1.1)
+    np.testing.assert_allclose(entries[2].to_atoms().positions, WATER.positions)
+
+
+def test_render_thumbnail():
+    """Test each atom is drawn, with large structures subsampled."""
+    svg = render_thumbnail(WATER, size=100)
+    assert svg.startswith("<svg") and svg.endswith("</svg>")
+    assert svg.count("<circle") == 3
+    assert render_thumbnail(Atoms()).count("<circle") == 0
+    large = Atoms("H5000", positions=np.random.default_rng(0).random((5000, 3)) * 50)
+    assert render_thumbnail(large).count("<circle") == 2000
+
+
+def test_gallery_widget(calculations):
+    """Test thumbnails are rendered by workers and viewers created on demand."""
+    gallery = StructureGalleryWidget(max_workers=2)
+    loop = asyncio.get_event_loop()
+    try:
+        tiles = gallery.load([calc.pk for calc in calculations])
+        assert loop.run_until_complete(gallery.wait(timeout=60))
+    finally:
+        gallery.shutdown()
+    assert len(gallery.grid.children) == 3
+    assert all("<circle" in tile.thumbnail.value for tile in tiles)
+    assert "CO" in tiles[2].caption.value
+    assert not gallery.detail.children
+    tiles[0].view_btn.click()
+    assert gallery.detail.children[-1].viewer is not None
+
+
+def test_gallery_close(calculations):
+    """Test closing the gallery stops the workers and resolves pending tiles."""
+    gallery = StructureGalleryWidget(max_workers=1)
+    loop = asyncio.get_event_loop()
+    tiles = gallery.load([calc.pk for calc in calculations] * 5)
+    gallery.close()
+    assert gallery._pool is None
+    assert loop.run_until_complete(gallery.wait(timeout=60))
+    assert any("cancelled" in tile.thumbnail.value for tile in tiles)
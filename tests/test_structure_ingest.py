@@ -0,0 +1,55 @@
+"""Tests for the batch structure ingestion."""
+
+import zipfile
+
+import pytest
+from aiida.orm import SinglefileData, StructureData
+
+from aiidalab_chemshell.common.structure_ingest import ingest_structures
+
+FRAME = "3\nframe {i}\nO 0 0 {i}\nH 0 0 1\nH 0 1 0\n"
+
+
+@pytest.fixture
+def structure_dir(tmp_path):
+    """Create a directory of structure files alongside unsupported files."""
+    (tmp_path / "traj.xyz").write_text("".join(FRAME.format(i=i) for i in range(5)))
+    with zipfile.ZipFile(tmp_path / "archive.zip", "w") as zfile:
+        zfile.writestr("water.xyz", FRAME.format(i=0))
+        zfile.writestr("nested/water.pun", "block = coordinates records = 0\n")
+        zfile.writestr("__MACOSX/nested/._water.pun", "metadata")
+        zfile.writestr("README", "Water structures")
+    (tmp_path / ".DS_Store").write_bytes(b"\0")
+    (tmp_path / "run.log").write_text("done")
+    return tmp_path
+
+
+def test_ingest_directory(aiida_profile, structure_dir):
+    """Test every frame and punch file is stored in chunks, other files skipped."""
+    counts, skipped = [], []
+    group = ingest_structures(
+        structure_dir,
+        "ingest-test",
+        chunk_size=3,
+        progress=counts.append,
+        skipped=skipped,
+    )
+    nodes = list(group.nodes)
+    assert counts == [3, 6, 7]
+    assert sum(isinstance(node, StructureData) for node in nodes) == 6
+    files = [node for node in nodes if isinstance(node, SinglefileData)]
+    assert [node.filename for node in files] == ["water.pun"]
+    assert all(node.is_stored for node in nodes)
+    assert sorted(skipped) == [
+        ".DS_Store",
+        "README",
+        "__MACOSX/nested/._water.pun",
+        "run.log",
+    ]
+
+
+def test_ingest_upload(aiida_profile, structure_dir):
+    """Test ingesting the raw contents of an uploaded file."""
+    content = (structure_dir / "traj.xyz").read_bytes()
+    group = ingest_structures(content, "ingest-upload", name="traj.xyz")
+    assert group.count() == 5
@@ -0,0 +1,39 @@
+"""Tests for the cached structure metadata extras."""
+
+from aiida.orm import QueryBuilder, SinglefileData, StructureData
+from ase import Atoms
+
+from aiidalab_chemshell.common.structure_metadata import (
+    ELEMENTS_EXTRA,
+    FORMULA_EXTRA,
+    backfill_structure_metadata,
+)
+
+
+def test_backfill_structure_metadata(aiida_profile_clean):
+    """Test structures and readable files are updated in batches, and only once."""
+    water = StructureData(ase=Atoms("OH2", positions=[[0, 0, 0], [1, 0, 0], [0, 1, 0]]))
+    water.store()
+    monoxide = SinglefileData.from_string(
+        "2\n\nC 0 0 0\nO 0 0 1.1\n", filename="co.xyz"
+    ).store()
+    punch = SinglefileData.from_string("block = fragment\n", filename="a.pun").store()
+
+    processed = []
+    updated = backfill_structure_metadata(
+        batch_size=2, max_workers=2, progress=processed.append
+    )
+    assert updated == 2
+    assert processed == [2, 3]
+    assert water.base.extras.get(FORMULA_EXTRA) == "H2O"
+    assert monoxide.base.extras.get("natoms") == 2
+    assert monoxide.base.extras.get("periodicity") == 0
+    assert punch.base.extras.get(FORMULA_EXTRA) == ""
+    assert backfill_structure_metadata() == 0
+
+    qb = QueryBuilder().append(
+        (StructureData, SinglefileData),
+        filters={f"extras.{ELEMENTS_EXTRA}": {"contains": ["C", "O"]}},
+        project="id",
+    )
+    assert qb.all(flat=True) == [monoxide.pk]
@@ -0,0 +1,113 @@
+"""Tests for streaming optimisation trajectories from the working directory."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, RemoteData
+
+from aiidalab_chemshell.common.trajectory import (
+    OptimisationTrajectory,
+    TrajectoryMonitorWidget,
+    TrajectoryStore,
+    XYZFrameParser,
+)
+
+FRAME = "3\nEnergy {energy}\nO 0 0 {z}\nH 0 0 1\nH 0 1 0\n"
+
+
+def test_parser_partial_frames():
+    """Test frames split across reads are only returned once complete."""
+    data = (FRAME.format(energy=-1.0, z=0) + FRAME.format(energy=-2.0, z=1)).encode()
+    parser = XYZFrameParser()
+    frames = parser.feed(data[:30]) + parser.feed(data[30:50]) + parser.feed(data[50:])
+    assert len(frames) == 2
+    assert frames[1][0] == ["O", "H", "H"]
+    assert frames[1][1][0, 2] == 1.0
+
+
+def test_parser_malformed_frame():
+    """Test a malformed frame is reported and parsing resumes after it."""
+    good = FRAME.format(energy=-1.0, z=0)
+    parser = XYZFrameParser()
+    with pytest.raises(ValueError, match="Malformed XYZ frame"):
+        parser.feed((good + "three\nEnergy\nO 0 0 0\n" + good).encode())
+    frames = parser.feed(b"")
+    assert [frame[2] for frame in frames] == ["Energy -1.0", "Energy -1.0"]
+    with pytest.raises(ValueError, match="expected 3 atoms"):
+        parser.feed(b"3\nEnergy\nO 0 0\nH 0 0 1\nH 0 1 0\n")
+    assert len(parser.feed(good.encode())) == 1
+
+
+def test_store_growth():
+    """Test the store grows beyond its initial capacity without losing frames."""
+    store = TrajectoryStore(capacity=2)
+    for i in range(5):
+        store.append_frame(["H"], np.array([[0.0, 0.0, i]]), energy=-i)
+        store.append_gradients(np.array([[0.0, 3.0, 4.0]]))
+    assert store.positions.shape == (5, 1, 3)
+    np.testing.assert_array_equal(store.energies, -np.arange(5))
+    np.testing.assert_array_equal(store.gradient_norms, np.full(5, 5.0))
+
+
+@pytest.fixture
+def running_calcjob(aiida_localhost, tmp_path):
+    """Create a calculation with a local working directory."""
+    # Avoid the overhead of starting a login shell for every remote command
+    aiida_localhost.configure(use_login_shell=False, safe_interval=0)
+    calcjob = CalcJobNode(
+        computer=aiida_localhost, process_type="aiida.calculations:chemshell"
+    )
+    calcjob.store()
+    remote = RemoteData(remote_path=str(tmp_path), computer=aiida_localhost)
+    remote.base.links.add_incoming(calcjob, LinkType.CREATE, "remote_folder")
+    remote.store()
+    (tmp_path / "_dl_find").mkdir()
+    return calcjob, tmp_path / "_dl_find"
+
+
+def test_tail_working_directory(running_calcjob):
+    """Test only newly appended frames are read from the working directory."""
+    calcjob, folder = running_calcjob
+    trajectory = OptimisationTrajectory(calcjob)
+    assert trajectory.update() == 0
+
+    path = folder / "path.xyz"
+    path.write_text(FRAME.format(energy=-1.0, z=0) + "3\nEnergy")
+    (folder / "path_force.xyz").write_text(FRAME.format(energy=0, z=2))
+    assert trajectory.update() == 1
+    with path.open("a") as f:
+        f.write(" -2.0\nO 0 0 1\nH 0 0 1\nH 0 1 0\n")
+    assert trajectory.update() == 1
+    assert trajectory.update() == 0
+    np.testing.assert_array_equal(trajectory.store.energies, [-1.0, -2.0])
+    assert trajectory.store.gradient_norms[0] == pytest.approx(np.sqrt(6))
+    assert np.isnan(trajectory.store.gradient_norms[1])
+
+
+def test_monitor_keeps_polling(running_calcjob):
+    """Test a malformed trajectory is reported without stopping the polling."""
+    calcjob, folder = running_calcjob
+    (folder / "path.xyz").write_text("garbage\n")
+    (folder / "path_force.xyz").write_text("")
+    widget = TrajectoryMonitorWidget(calcjob, interval=0.01)
+    loop = asyncio.get_event_loop()
+
+    async def _until(condition) -> None:
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    widget.start()
+    loop.run_until_complete(
+        asyncio.wait_for(_until(lambda: "Malformed" in widget.message.value), 10)
+    )
+    assert not widget._task.done()
+    with (folder / "path.xyz").open("a") as f:
+        f.write(FRAME.format(energy=-1.0, z=0))
+    (folder / "path_force.xyz").write_text(FRAME.format(energy=0, z=2))
+    loop.run_until_complete(
+        asyncio.wait_for(_until(lambda: widget.trajectory.store.nframes), 10)
+    )
+    widget._task.cancel()
+    assert "Optimisation step 1" in widget.message.value
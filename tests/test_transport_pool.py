@@ -0,0 +1,94 @@
+"""Tests for the pool of transports to remote computers."""
+
+import threading
+import time
+
+import pytest
+
+from aiidalab_chemshell.common.transport_pool import TransportPool
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def localhost(aiida_localhost):
+    """Configure the local computer to open transports quickly."""
+    aiida_localhost.configure(use_login_shell=False, safe_interval=0)
+    return aiida_localhost
+
+
+def test_reuse_and_idle_timeout(localhost):
+    """Test transports are reused across requests and closed once idle."""
+    clock = FakeClock()
+    pool = TransportPool(idle_timeout=300, clock=clock)
+    transports = pool.get(localhost)
+    for _ in range(3):
+        with transports.connect() as transport:
+            # Nested ``with`` blocks of existing code must not close the transport
+            with transport:
+                assert transport.exec_command_wait("true")[0] == 0
+            assert transport.is_open
+    assert transports.opened == 1
+    assert pool.get(localhost) is transports
+
+    clock.now = 299
+    assert pool.close_idle(pool.idle_timeout) == 0
+    clock.now = 300
+    pool.get(localhost)
+    assert transports.idle == 0
+    assert not transport.is_open
+
+
+def test_concurrency_limit(localhost):
+    """Test no more transports are opened than the concurrency limit."""
+    pool = TransportPool(max_connections=2)
+    transports = pool.get(localhost)
+    active, peak = [], []
+    lock = threading.Lock()
+
+    def _borrow():
+        with transports.connect():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=_borrow) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2
+    assert transports.opened == 2
+    pool.close()
+    assert transports.idle == 0
+
+
+def test_broken_transports_are_replaced(localhost):
+    """Test transports failing during use or the keep-alive check are replaced."""
+    clock = FakeClock()
+    pool = TransportPool(keepalive_interval=60, clock=clock)
+    transports = pool.get(localhost)
+    with pytest.raises(OSError), transports.connect():
+        raise OSError("Connection lost")
+    assert transports.idle == 0
+
+    with transports.connect() as transport:
+        pass
+    transport.close()
+    clock.now = 60
+    with transports.connect() as replacement:
+        assert replacement is not transport
+    assert transports.opened == 3
+    pool.close()
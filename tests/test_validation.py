@@ -0,0 +1,64 @@
+"""Tests for the pre-submission validation and cost estimate."""
+
+from aiida.orm import StructureData
+from ase.build import molecule
+
+from aiidalab_chemshell.common.code_index import get_code_index
+from aiidalab_chemshell.common.validation import (
+    count_basis_functions,
+    parse_qm_region,
+    validate_inputs,
+)
+from aiidalab_chemshell.process import MainAppModel
+
+BENZENE = molecule("C6H6")
+
+
+def test_count_basis_functions():
+    """Test basis sizes are summed per atom, falling back to the default basis."""
+    assert count_basis_functions(BENZENE, "cc-pVDZ") == (6 * 14 + 6 * 5, True)
+    assert count_basis_functions(BENZENE, "6-31G(d)") == (6 * 15 + 6 * 2, True)
+    assert count_basis_functions(BENZENE, "custom") == (6 * 14 + 6 * 5, False)
+
+
+def test_parse_qm_region():
+    """Test indices and ranges separated by commas and/or whitespace."""
+    assert parse_qm_region("0-2, 5 7,8") == ([0, 1, 2, 5, 7, 8], [])
+    assert parse_qm_region("1 a-3 -2") == ([1], ["a-3", "-2"])
+
+
+def test_validate_inputs():
+    """Test QM region errors, QM atom counting and the memory warning."""
+    report = validate_inputs(BENZENE, "cc-pvdz", qm_region="0-5, 12")
+    assert report.errors == [
+        "QM region indices out of range for a structure of 12 atoms "
+        "(indices start at 0): 12"
+    ]
+    report = validate_inputs(BENZENE, "cc-pvdz", qm_region="0-5")
+    assert report.is_valid
+    assert report.estimate.nqm_atoms == 6
+    assert report.estimate.nbasis == 6 * 14
+    assert not report.warnings
+
+    small = validate_inputs(BENZENE, "cc-pvdz", ncpus=4, memory_kb=1024**2)
+    large = validate_inputs(BENZENE, "aug-cc-pvqz", ncpus=4, memory_kb=1024**2)
+    assert large.estimate.memory_mb > small.estimate.memory_mb
+    assert large.estimate.relative_runtime > small.estimate.relative_runtime
+    assert "exceeds the memory" in large.warnings[0]
+    assert "not tabulated" in validate_inputs(BENZENE, "custom").notes[0]
+
+
+def test_memory_warning_holds_submission(aiida_code_installed, aiida_localhost):
+    """Test a submission exceeding the node's memory must be confirmed."""
+    aiida_localhost.set_default_memory_per_machine(1024**2)
+    code = aiida_code_installed(default_calc_job_plugin="chemshell")
+    get_code_index().refresh(full=True)
+    model = MainAppModel()
+    model.structure_model.structure = StructureData(ase=BENZENE)
+    model.workflow_model.basis_set = "aug-cc-pvqz"
+    model.resource_model.code_label = code.full_label
+    model.resource_model.submitted = True
+    assert not model.resource_model.submitted
+    assert model.resource_model.confirmed
+    assert model.process is None
+    assert "exceeds the memory" in model.resource_model.validation_message
@@ -0,0 +1,45 @@
+"""Tests for the vibrational thermochemistry and spectrum."""
+
+import numpy as np
+import pytest
+from ase import units
+from ase.thermochemistry import HarmonicThermo
+
+from aiidalab_chemshell.common.vibrations import VibrationalData
+
+# Translational/rotational modes, an imaginary mode and three real vibrations
+FREQUENCIES = np.array([0.0, 1.2, -3.0, -150.0, 1600.0, 3650.0, 3750.0])
+
+
+@pytest.fixture
+def data():
+    """Return vibrational data with only the frequency column populated."""
+    modes = np.zeros((len(FREQUENCIES), 5))
+    modes[:, 0] = FREQUENCIES
+    return VibrationalData(modes)
+
+
+def test_thermochemistry(data):
+    """Test the vectorised thermochemistry against ASE's harmonic oscillator."""
+    temperatures = np.array([100.0, 298.15, 1000.0])
+    thermo = data.thermochemistry(temperatures)
+    reference = HarmonicThermo(FREQUENCIES[4:] * units.invcm)
+    for i, t in enumerate(temperatures):
+        energy = reference.get_internal_energy(t, verbose=False) / units.Hartree
+        entropy = reference.get_entropy(t, verbose=False) / units.Hartree
+        assert thermo.energy[i] == pytest.approx(energy)
+        assert thermo.entropy[i] == pytest.approx(entropy)
+    assert thermo.zpe == pytest.approx(reference.get_ZPE_correction() / units.Hartree)
+    assert data.thermochemistry(0.0).entropy[0] == 0.0
+
+
+def test_spectrum(data):
+    """Test each broadened real vibration integrates to its intensity."""
+    grid = np.linspace(-5000.0, 10000.0, 150001)
+    for lineshape in ("gaussian", "lorentzian"):
+        spectrum = data.spectrum(grid, fwhm=5.0, lineshape=lineshape)
+        assert np.trapz(spectrum, grid) == pytest.approx(3, rel=1e-2)
+        spectrum = data.spectrum(grid, fwhm=5.0, lineshape=lineshape, cutoff=None)
+        assert np.trapz(spectrum, grid) == pytest.approx(len(FREQUENCIES), rel=1e-2)
+    # The translations, rotations and imaginary modes are not shown
+    assert data.spectrum(np.array([0.0]), fwhm=5.0)[0] < 1e-3